@@ -1,10 +1,31 @@
 import os
+import re
 import pathlib
+import functools
 
 from dataclasses import dataclass
-
-
-@dataclass
+from dataclasses import field
+
+
+_DOTENV_CACHE: dict[tuple[str, int], dict[str, str]] = {}
+_DOTENV_LINE_RE = re.compile(
+    r"^[ \t]*([A-Za-z_][A-Za-z0-9_.-]*)[ \t]*=[ \t]*"
+    r"(?:\"([^\"\n]*)\"|'([^'\n]*)'|([^\n]*?))"
+    r"[ \t]*(?:[ \t]#[^\n]*)?\r?$",
+    re.MULTILINE
+)
+_PLACEHOLDER_FOLDER_TOKENS = frozenset(
+    {
+        "test_folder_token",
+        "your_folder_token",
+        "example_folder_token",
+        "folder_token",
+        "<folder_token>"
+    }
+)
+
+
+@dataclass(slots = True, frozen = True)
 class AppConfig:
     """Application runtime configuration.
 
@@ -24,9 +45,13 @@ class AppConfig:
         feishu_message_max_bytes: Max bytes for one outgoing notify message.
         feishu_convert_max_bytes: Max bytes for one markdown convert call.
         notify_level: Notification verbosity.
+        media_concurrency: Max parallel image uploads within one document.
+        api_rate_limit: Max HTTP requests per second across one import run, 0 disables pacing.
         llm_base_url: OpenAI-compatible LLM base URL.
         llm_api_key: OpenAI-compatible LLM API key.
         llm_model: LLM model name for TOC ambiguity fallback.
+        llm_cache_path: Cache file path for persisted TOC ambiguity resolutions.
+        folder_token_is_placeholder: Derived flag, True when folder token looks like a placeholder.
     """
 
     feishu_base_url: str
@@ -44,9 +69,26 @@ class AppConfig:
     feishu_message_max_bytes: int
     feishu_convert_max_bytes: int
     notify_level: str
+    media_concurrency: int = 4
+    api_rate_limit: float = 0.0
     llm_base_url: str = ""
     llm_api_key: str = ""
     llm_model: str = ""
+    llm_cache_path: str = ""
+    folder_token_is_placeholder: bool = field(init = False, repr = False, compare = False)
+
+    def __post_init__(self) -> None:
+        """Derive cached flags from raw config fields.
+
+        Args:
+            self: Config instance.
+        """
+
+        object.__setattr__(
+            self,
+            "folder_token_is_placeholder",
+            is_placeholder_folder_token(token = self.feishu_folder_token)
+        )
 
     @classmethod
     def from_env(cls) -> "AppConfig":
@@ -56,37 +98,32 @@ class AppConfig:
             cls: Class reference used by dataclass factory.
         """
 
-        load_dotenv_if_exists()
-
-        return cls(
-            feishu_base_url = os.getenv("FEISHU_BASE_URL", "https://open.feishu.cn").rstrip("/"),
-            feishu_webhook_url = os.getenv("FEISHU_WEBHOOK_URL", ""),
-            feishu_app_id = os.getenv("FEISHU_APP_ID", os.getenv("FEISHU_WRITER_APP_ID", "")),
-            feishu_app_secret = os.getenv(
-                "FEISHU_APP_SECRET",
-                os.getenv("FEISHU_WRITER_APP_SECRET", "")
-            ),
-            feishu_user_access_token = os.getenv("FEISHU_USER_ACCESS_TOKEN", ""),
-            feishu_user_refresh_token = os.getenv("FEISHU_USER_REFRESH_TOKEN", ""),
-            feishu_user_token_cache_path = os.getenv(
-                "FEISHU_USER_TOKEN_CACHE_PATH",
-                "cache/user_token.json"
-            ),
-            feishu_folder_token = os.getenv("FEISHU_FOLDER_TOKEN", ""),
-            request_timeout = float(os.getenv("REQUEST_TIMEOUT", "30")),
-            max_retries = int(os.getenv("MAX_RETRIES", "3")),
-            retry_backoff = float(os.getenv("RETRY_BACKOFF", "1.0")),
-            image_url_template = os.getenv(
-                "FEISHU_IMAGE_URL_TEMPLATE",
-                "https://open.feishu.cn/open-apis/drive/v1/medias/{token}/download"
-            ),
-            feishu_message_max_bytes = int(os.getenv("FEISHU_MESSAGE_MAX_BYTES", "18000")),
-            feishu_convert_max_bytes = int(os.getenv("FEISHU_CONVERT_MAX_BYTES", "45000")),
-            notify_level = os.getenv("NOTIFY_LEVEL", "normal"),
-            llm_base_url = os.getenv("LLM_BASE_URL", ""),
-            llm_api_key = os.getenv("LLM_API_KEY", ""),
-            llm_model = os.getenv("LLM_MODEL", "")
-        )
+        return _build_from_env()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop cached env-derived config so next from_env re-reads env.
+
+        Args:
+            cls: Class reference used by dataclass factory.
+        """
+
+        _build_from_env.cache_clear()
+
+
+def is_placeholder_folder_token(token: str) -> bool:
+    """Check whether one folder token looks like placeholder test value.
+
+    Args:
+        token: Folder token text.
+    """
+
+    normalized = token.strip().lower() if token else ""
+    if not normalized:
+        return False
+    if normalized in _PLACEHOLDER_FOLDER_TOKENS:
+        return True
+    return normalized.startswith("${") and normalized.endswith("}")
 
 
 def get_project_root() -> pathlib.Path:
@@ -112,18 +149,94 @@ def load_dotenv_if_exists(dotenv_path: str = ".env") -> None:
     ]
 
     for env_path in candidate_paths:
-        if not env_path.exists():
+        try:
+            mtime_ns = os.stat(env_path).st_mtime_ns
+        except OSError:
             continue
 
-        with open(env_path, "r", encoding = "utf-8") as fp:
-            for raw_line in fp:
-                line = raw_line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "=" not in line:
-                    continue
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                if key and key not in os.environ:
-                    os.environ[key] = value
+        cache_key = (str(env_path), mtime_ns)
+        parsed = _DOTENV_CACHE.get(cache_key)
+        if parsed is None:
+            parsed = _parse_dotenv_text(text = env_path.read_text(encoding = "utf-8"))
+            _DOTENV_CACHE[cache_key] = parsed
+
+        for key, value in parsed.items():
+            os.environ.setdefault(key, value)
+
+
+def _parse_dotenv_text(text: str) -> dict[str, str]:
+    """Parse .env text into key-values, keeping the first value per key.
+
+    Args:
+        text: Raw .env file content.
+    """
+
+    parsed: dict[str, str] = {}
+    for match in _DOTENV_LINE_RE.finditer(text):
+        key, double_quoted, single_quoted, bare = match.groups()
+        if double_quoted is not None:
+            value = double_quoted
+        elif single_quoted is not None:
+            value = single_quoted
+        else:
+            value = bare
+        parsed.setdefault(key, value)
+    return parsed
+
+
+def _env_first(env: dict[str, str], *keys: str, default: str = "") -> str:
+    """Return the first non-empty env value among keys.
+
+    Args:
+        env: Env snapshot map.
+        keys: Env var names in priority order.
+        default: Value used when every key is unset or empty.
+    """
+
+    for key in keys:
+        value = env.get(key)
+        if value:
+            return value
+    return default
+
+
+@functools.cache
+def _build_from_env() -> AppConfig:
+    """Build configuration from environment variables once per process.
+
+    Args:
+        None
+    """
+
+    load_dotenv_if_exists()
+    env = dict(os.environ)
+
+    return AppConfig(
+        feishu_base_url = env.get("FEISHU_BASE_URL", "https://open.feishu.cn").rstrip("/"),
+        feishu_webhook_url = env.get("FEISHU_WEBHOOK_URL", ""),
+        feishu_app_id = _env_first(env, "FEISHU_APP_ID", "FEISHU_WRITER_APP_ID"),
+        feishu_app_secret = _env_first(env, "FEISHU_APP_SECRET", "FEISHU_WRITER_APP_SECRET"),
+        feishu_user_access_token = env.get("FEISHU_USER_ACCESS_TOKEN", ""),
+        feishu_user_refresh_token = env.get("FEISHU_USER_REFRESH_TOKEN", ""),
+        feishu_user_token_cache_path = env.get(
+            "FEISHU_USER_TOKEN_CACHE_PATH",
+            "cache/user_token.json"
+        ),
+        feishu_folder_token = env.get("FEISHU_FOLDER_TOKEN", ""),
+        request_timeout = float(env.get("REQUEST_TIMEOUT", "30")),
+        max_retries = int(env.get("MAX_RETRIES", "3")),
+        retry_backoff = float(env.get("RETRY_BACKOFF", "1.0")),
+        image_url_template = env.get(
+            "FEISHU_IMAGE_URL_TEMPLATE",
+            "https://open.feishu.cn/open-apis/drive/v1/medias/{token}/download"
+        ),
+        feishu_message_max_bytes = int(env.get("FEISHU_MESSAGE_MAX_BYTES", "18000")),
+        feishu_convert_max_bytes = int(env.get("FEISHU_CONVERT_MAX_BYTES", "45000")),
+        notify_level = env.get("NOTIFY_LEVEL", "normal"),
+        media_concurrency = int(env.get("MEDIA_CONCURRENCY", "4")),
+        api_rate_limit = float(env.get("API_RATE_LIMIT", "0")),
+        llm_base_url = env.get("LLM_BASE_URL", ""),
+        llm_api_key = env.get("LLM_API_KEY", ""),
+        llm_model = env.get("LLM_MODEL", ""),
+        llm_cache_path = env.get("LLM_CACHE_PATH", "cache/llm_toc_resolutions.json")
+    )
@@ -1,30 +1,42 @@
 import os
-import sys
 import logging
+import functools
 from typing import Optional
-
-
-sys.path.append(os.getcwd())
+from typing import TYPE_CHECKING
 
 from config.config import AppConfig
-from core.orchestrator import ImportOrchestrator
 from data.source_adapters import GitHubSourceAdapter
 from data.source_adapters import LocalSourceAdapter
 from data.source_adapters import SourceAdapter
-from integrations.feishu_api import DocWriterService
-from integrations.feishu_api import FeishuAuthClient
-from integrations.feishu_api import FeishuUserTokenManager
-from integrations.feishu_api import MediaService
-from integrations.feishu_api import NotifyService
-from integrations.feishu_api import WebhookNotifyService
-from integrations.feishu_api import WikiService
-from integrations.llm_client import OpenAICompatibleLlmClient
 from utils.http_client import HttpClient
-from utils.markdown_processor import MarkdownProcessor
+from utils.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    # Heavy service modules are imported lazily inside each build_* function.
+    from core.orchestrator import ImportOrchestrator
+    from integrations.feishu_api import DocWriterService
+    from integrations.feishu_api import FeishuAuthClient
+    from integrations.feishu_api import FeishuUserTokenManager
+    from integrations.feishu_api import MediaService
+    from integrations.feishu_api import WikiService
+    from integrations.llm_client import OpenAICompatibleLlmClient
+    from utils.markdown_processor import MarkdownProcessor
 
 
 logger = logging.getLogger(__name__)
 
+_LLM_INCOMPLETE_MSG = (
+    "LLM fallback enabled but LLM_BASE_URL/LLM_API_KEY/LLM_MODEL are incomplete."
+)
+_USER_TOKEN_MISSING_MSG = (
+    "FEISHU_USER_ACCESS_TOKEN/FEISHU_USER_REFRESH_TOKEN are empty. "
+    "If target space does not exist, auto-create will fail; "
+    "you can pass --space-id to reuse existing space."
+)
+_WIKI_MODES = frozenset({"wiki", "both"})
+_FOLDER_MODES = frozenset({"folder", "both"})
+_EXISTING_TOKEN_CACHE_PATHS: set[str] = set()
+
 
 def build_http_client(config: AppConfig) -> HttpClient:
     """Create shared HTTP client from config.
@@ -33,20 +45,48 @@ def build_http_client(config: AppConfig) -> HttpClient:
         config: Runtime configuration.
     """
 
-    return HttpClient(
+    return _get_http_client(
         timeout = config.request_timeout,
         max_retries = config.max_retries,
-        retry_backoff = config.retry_backoff
+        retry_backoff = config.retry_backoff,
+        api_rate_limit = config.api_rate_limit
     )
 
 
-def build_markdown_processor() -> MarkdownProcessor:
-    """Create markdown processor instance.
+@functools.lru_cache(maxsize = 4)
+def _get_http_client(
+    timeout: float,
+    max_retries: int,
+    retry_backoff: float,
+    api_rate_limit: float = 0.0
+) -> HttpClient:
+    """Return one process-wide HTTP client per retry/timeout/rate profile.
+
+    Args:
+        timeout: HTTP timeout in seconds.
+        max_retries: Maximum retry count for HTTP requests.
+        retry_backoff: Retry backoff multiplier in seconds.
+        api_rate_limit: Max requests per second, 0 disables pacing.
+    """
+
+    return HttpClient(
+        timeout = timeout,
+        max_retries = max_retries,
+        retry_backoff = retry_backoff,
+        rate_limiter = RateLimiter(api_rate_limit) if api_rate_limit > 0 else None
+    )
+
+
+@functools.cache
+def build_markdown_processor() -> "MarkdownProcessor":
+    """Return shared markdown processor; the processor holds no state.
 
     Args:
         None
     """
 
+    from utils.markdown_processor import MarkdownProcessor
+
     return MarkdownProcessor()
 
 
@@ -54,7 +94,7 @@ def build_llm_client(
     config: AppConfig,
     http_client: HttpClient,
     enable: bool
-) -> Optional[OpenAICompatibleLlmClient]:
+) -> Optional["OpenAICompatibleLlmClient"]:
     """Create LLM client when enabled and ready.
 
     Args:
@@ -65,6 +105,9 @@ def build_llm_client(
 
     if not enable:
         return None
+
+    from integrations.llm_client import OpenAICompatibleLlmClient
+
     client = OpenAICompatibleLlmClient(
         base_url = config.llm_base_url,
         api_key = config.llm_api_key,
@@ -72,9 +115,7 @@ def build_llm_client(
         http_client = http_client
     )
     if not client.is_ready():
-        logger.warning(
-            "LLM fallback enabled but LLM_BASE_URL/LLM_API_KEY/LLM_MODEL are incomplete."
-        )
+        logger.warning(_LLM_INCOMPLETE_MSG)
         return None
     return client
 
@@ -82,7 +123,7 @@ def build_llm_client(
 def build_user_token_manager(
     config: AppConfig,
     http_client: HttpClient
-) -> FeishuUserTokenManager:
+) -> "FeishuUserTokenManager":
     """Create Feishu user token manager.
 
     Args:
@@ -90,6 +131,8 @@ def build_user_token_manager(
         http_client: Shared HTTP client.
     """
 
+    from integrations.feishu_api import FeishuUserTokenManager
+
     return FeishuUserTokenManager(
         app_id = config.feishu_app_id,
         app_secret = config.feishu_app_secret,
@@ -104,7 +147,7 @@ def build_user_token_manager(
 def build_app_auth(
     config: AppConfig,
     http_client: HttpClient
-) -> FeishuAuthClient:
+) -> "FeishuAuthClient":
     """Create Feishu app auth client.
 
     Args:
@@ -112,6 +155,8 @@ def build_app_auth(
         http_client: Shared HTTP client.
     """
 
+    from integrations.feishu_api import FeishuAuthClient
+
     return FeishuAuthClient(
         app_id = config.feishu_app_id,
         app_secret = config.feishu_app_secret,
@@ -123,10 +168,10 @@ def build_app_auth(
 def build_doc_writer(
     config: AppConfig,
     http_client: HttpClient,
-    app_auth: FeishuAuthClient,
+    app_auth: "FeishuAuthClient",
     write_mode: str,
     chunk_workers: int
-) -> DocWriterService:
+) -> "DocWriterService":
     """Create Feishu doc writer service.
 
     Args:
@@ -137,7 +182,9 @@ def build_doc_writer(
         chunk_workers: Chunk worker count.
     """
 
-    folder_token = config.feishu_folder_token if write_mode in {"folder", "both"} else ""
+    from integrations.feishu_api import DocWriterService
+
+    folder_token = config.feishu_folder_token if write_mode in _FOLDER_MODES else ""
     return DocWriterService(
         auth_client = app_auth,
         http_client = http_client,
@@ -151,8 +198,8 @@ def build_doc_writer(
 def build_media_service(
     config: AppConfig,
     http_client: HttpClient,
-    app_auth: FeishuAuthClient
-) -> MediaService:
+    app_auth: "FeishuAuthClient"
+) -> "MediaService":
     """Create Feishu media service.
 
     Args:
@@ -161,6 +208,8 @@ def build_media_service(
         app_auth: App auth client.
     """
 
+    from integrations.feishu_api import MediaService
+
     return MediaService(
         auth_client = app_auth,
         http_client = http_client,
@@ -171,10 +220,10 @@ def build_media_service(
 def build_wiki_service(
     config: AppConfig,
     http_client: HttpClient,
-    app_auth: FeishuAuthClient,
+    app_auth: "FeishuAuthClient",
     write_mode: str,
-    user_token_manager: Optional[FeishuUserTokenManager]
-) -> Optional[WikiService]:
+    user_token_manager: Optional["FeishuUserTokenManager"]
+) -> Optional["WikiService"]:
     """Create Feishu wiki service when write mode requires it.
 
     Args:
@@ -185,8 +234,11 @@ def build_wiki_service(
         user_token_manager: Optional user token manager.
     """
 
-    if write_mode not in {"wiki", "both"}:
+    if write_mode not in _WIKI_MODES:
         return None
+
+    from integrations.feishu_api import WikiService
+
     return WikiService(
         auth_client = app_auth,
         http_client = http_client,
@@ -199,7 +251,7 @@ def build_wiki_service(
 def build_notify_service(
     config: AppConfig,
     http_client: HttpClient,
-    app_auth: FeishuAuthClient,
+    app_auth: "FeishuAuthClient",
     notify_level: str,
     allow_missing_chat_id: bool,
     chat_id: str = ""
@@ -218,12 +270,16 @@ def build_notify_service(
     if notify_level == "none":
         return None
     if config.feishu_webhook_url:
+        from integrations.feishu_api import WebhookNotifyService
+
         return WebhookNotifyService(
             webhook_url = config.feishu_webhook_url,
             http_client = http_client,
             max_bytes = config.feishu_message_max_bytes
         )
     if chat_id or allow_missing_chat_id:
+        from integrations.feishu_api import NotifyService
+
         return NotifyService(
             auth_client = app_auth,
             http_client = http_client,
@@ -243,9 +299,9 @@ def build_orchestrator(
     notify_level: str,
     enable_llm: bool,
     chat_id: str = "",
-    user_token_manager: Optional[FeishuUserTokenManager] = None,
+    user_token_manager: Optional["FeishuUserTokenManager"] = None,
     allow_missing_chat_id: bool = False
-) -> ImportOrchestrator:
+) -> "ImportOrchestrator":
     """Build orchestrator and its dependencies.
 
     Args:
@@ -262,6 +318,8 @@ def build_orchestrator(
         allow_missing_chat_id: Whether to allow NotifyService without chat id.
     """
 
+    from core.orchestrator import ImportOrchestrator
+
     markdown_processor = build_markdown_processor()
     llm_client = build_llm_client(
         config = config,
@@ -358,14 +416,15 @@ def build_source_adapter_from_request(
         http_client: Shared HTTP client.
     """
 
-    source_type = request.get("source_type", "")
+    get = request.get
+    source_type = get("source_type", "")
     if source_type == "local":
         return LocalSourceAdapter(root_path = request["path"])
     if source_type == "github":
         return GitHubSourceAdapter(
             repo = request["path"],
-            ref = request.get("ref") or request.get("branch", "main"),
-            subdir = request.get("subdir", ""),
+            ref = get("ref") or get("branch", "main"),
+            subdir = get("subdir", ""),
             http_client = http_client
         )
     raise ValueError(f"Unsupported source type: {source_type}")
@@ -402,55 +461,38 @@ def validate_runtime_credentials(
             "Set FEISHU_WEBHOOK_URL or pass --chat-id."
         )
 
-    has_token_cache = os.path.exists(config.feishu_user_token_cache_path)
-    has_user_token_source = any(
-        [
-            config.feishu_user_access_token,
-            config.feishu_user_refresh_token,
-            has_token_cache,
-            has_user_token_override
-        ]
+    has_user_token_source = bool(
+        config.feishu_user_access_token
+        or config.feishu_user_refresh_token
+        or has_user_token_override
+        or _has_user_token_cache(path = config.feishu_user_token_cache_path)
     )
-    if write_mode in {"wiki", "both"} and not has_user_token_source:
-        logger.warning(
-            "FEISHU_USER_ACCESS_TOKEN/FEISHU_USER_REFRESH_TOKEN are empty. "
-            "If target space does not exist, auto-create will fail; "
-            "you can pass --space-id to reuse existing space."
-        )
+    if write_mode in _WIKI_MODES and not has_user_token_source:
+        logger.warning(_USER_TOKEN_MISSING_MSG)
 
-    if write_mode in {"folder", "both"} and not config.feishu_folder_token:
+    if write_mode in _FOLDER_MODES and not config.feishu_folder_token:
         raise ValueError(
             "FEISHU_FOLDER_TOKEN is required when --write-mode is folder or both"
         )
-    if write_mode in {"folder", "both"} and is_placeholder_folder_token(
-        token = config.feishu_folder_token
-    ):
+    if write_mode in _FOLDER_MODES and config.folder_token_is_placeholder:
         raise ValueError(
             "FEISHU_FOLDER_TOKEN looks like a placeholder value. "
             "Please set a real Feishu folder token before folder import."
         )
 
 
-def is_placeholder_folder_token(token: str) -> bool:
-    """Check whether one folder token looks like placeholder test value.
+def _has_user_token_cache(path: str) -> bool:
+    """Check whether user token cache file exists, remembering hits.
 
     Args:
-        token: Folder token text.
+        path: User token cache file path.
     """
 
-    normalized = (token or "").strip().lower()
-    if not normalized:
+    if path in _EXISTING_TOKEN_CACHE_PATHS:
+        return True
+    if not os.path.exists(path):
+        # Misses are not cached: OAuth may create the file later in-process.
         return False
+    _EXISTING_TOKEN_CACHE_PATHS.add(path)
+    return True
 
-    placeholders = {
-        "test_folder_token",
-        "your_folder_token",
-        "example_folder_token",
-        "folder_token",
-        "<folder_token>"
-    }
-    if normalized in placeholders:
-        return True
-    if normalized.startswith("${") and normalized.endswith("}"):
-        return True
-    return False
@@ -1,14 +1,22 @@
 class AppError(Exception):
     """Base application error."""
 
+    __slots__ = ()
+
 
 class ValidationError(AppError):
     """Raised when CLI arguments or configuration are invalid."""
 
+    __slots__ = ()
+
 
 class HttpRequestError(AppError):
     """Raised when an HTTP request fails."""
 
+    __slots__ = ()
+
 
 class ApiResponseError(AppError):
     """Raised when Feishu/GitHub API returns an invalid payload."""
+
+    __slots__ = ()
@@ -1,8 +1,18 @@
+import asyncio
+import bisect
+import functools
+import hashlib
+import inspect
+import json
 import logging
 import posixpath
 import re
+import time
 import urllib.parse
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 from dataclasses import dataclass
 from typing import Optional
 from typing import Protocol
@@ -15,8 +25,12 @@ from data.source_adapters import SourceAdapter
 
 logger = logging.getLogger(__name__)
 
+# Characters that make _normalize_relative_path take the full parse path:
+# percent escapes, backslashes, fragments/queries and URL schemes.
+_PATH_SLOW_CHARS = frozenset("%\\#?:")
+
 
-@dataclass
+@dataclass(slots = True, frozen = True)
 class LlmResolution:
     """LLM resolution output for one ambiguous TOC link.
 
@@ -31,7 +45,7 @@ class LlmResolution:
     reason: str = ""
 
 
-@dataclass
+@dataclass(slots = True, frozen = True)
 class TocLinkRef:
     """One markdown link extracted from TOC content.
 
@@ -66,25 +80,236 @@ class TocAmbiguityResolver(Protocol):
         """
 
 
+class AsyncTocAmbiguityResolver(Protocol):
+    """Protocol for LLM resolver with coroutine-based TOC ambiguity resolution."""
+
+    async def resolve_toc_ambiguity(
+        self,
+        link_text: str,
+        raw_target: str,
+        candidate_paths: list[str],
+        toc_context: str
+    ) -> LlmResolution:
+        """Resolve one ambiguous TOC target path asynchronously.
+
+        Args:
+            link_text: TOC link text.
+            raw_target: Raw markdown target.
+            candidate_paths: Candidate source-relative paths.
+            toc_context: Nearby TOC lines for context.
+        """
+
+
+class TocAmbiguityBatchResolver(Protocol):
+    """Protocol for LLM resolver that settles many TOC ambiguities per call."""
+
+    def resolve_toc_ambiguity_batch(
+        self,
+        items: list[dict],
+        toc_context: str
+    ) -> list[LlmResolution]:
+        """Resolve ambiguous TOC targets in one request.
+
+        Args:
+            items: Ambiguity items with link_text, raw_target and candidate_paths.
+            toc_context: TOC lines covering every item for context.
+        """
+
+
+@functools.lru_cache(maxsize = 8192)
+def _normalize_link_target(target: str, toc_dir: str) -> str:
+    """Normalize one markdown link target path.
+
+    Args:
+        target: Raw markdown link target.
+        toc_dir: TOC parent directory.
+    """
+
+    normalized_target = _normalize_relative_path(path = target)
+    if not normalized_target:
+        return ""
+
+    if toc_dir:
+        normalized_target = posixpath.normpath(
+            posixpath.join(toc_dir, normalized_target)
+        )
+    return normalized_target.lstrip("/")
+
+
+@functools.lru_cache(maxsize = 8192)
+def _normalize_relative_path(path: str) -> str:
+    """Normalize source-relative path for matching.
+
+    Args:
+        path: Raw path text.
+    """
+
+    if path and path == path.strip() and _PATH_SLOW_CHARS.isdisjoint(path):
+        segments = path.split("/")
+        if "" not in segments and "." not in segments and ".." not in segments:
+            return path
+
+    value = urllib.parse.unquote((path or "").strip())
+    if not value:
+        return ""
+
+    parsed = urllib.parse.urlparse(value)
+    if parsed.scheme:
+        return ""
+
+    value = value.replace("\\", "/")
+    value = value.split("#", 1)[0]
+    value = value.split("?", 1)[0]
+    if not value:
+        return ""
+
+    normalized = posixpath.normpath(value)
+    if normalized in {"", "."}:
+        return ""
+
+    normalized = normalized.lstrip("/")
+    if normalized.startswith("../"):
+        return ""
+    return normalized
+
+
+def _bounded_edit_distance(left: str, right: str, max_distance: int) -> int:
+    """Compute Levenshtein distance, giving up once it exceeds max_distance.
+
+    Args:
+        left: First string.
+        right: Second string.
+        max_distance: Largest distance of interest.
+    """
+
+    if abs(len(left) - len(right)) > max_distance:
+        return max_distance + 1
+    if left == right:
+        return 0
+
+    previous = list(range(len(right) + 1))
+    for row, left_char in enumerate(left, start = 1):
+        current = [row]
+        row_min = row
+        for column, right_char in enumerate(right, start = 1):
+            value = min(
+                previous[column] + 1,
+                current[column - 1] + 1,
+                previous[column - 1] + (left_char != right_char)
+            )
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous = current
+    return min(previous[-1], max_distance + 1)
+
+
+class _AsyncTokenBucket:
+    """Token bucket limiting LLM request starts per minute.
+
+    Args:
+        rate_per_minute: Allowed request starts per minute.
+        capacity: Max burst size.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: int) -> None:
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until one token is available and consume it.
+
+        Args:
+            None
+        """
+
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    float(self.capacity),
+                    self.tokens + (now - self.updated_at) * self.rate_per_second
+                )
+                self.updated_at = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self.tokens) / self.rate_per_second)
+
+
 class OrchestrationPlanner:
     """Build stable import ordering from markdown paths and optional TOC."""
 
-    MD_LINK_PATTERN = re.compile(r"\[(?P<label>[^\]]+)\]\((?P<target>[^)]+)\)")
+    # Link parts never span line breaks (same boundaries as str.splitlines()),
+    # so one scan over the whole TOC matches exactly what a per-line scan would.
+    MD_LINK_PATTERN = re.compile(
+        r"\[(?P<label>[^\]\n\r\v\f\x1c-\x1e\x85\u2028\u2029]+)\]"
+        r"\((?P<target>[^)\n\r\v\f\x1c-\x1e\x85\u2028\u2029]+)\)"
+    )
+    LINE_BREAK_PATTERN = re.compile(r"\r\n|[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+    FENCED_CODE_PATTERN = re.compile(
+        r"^[ ]{0,3}(?P<fence>`{3,}|~{3,}).*?(?:^[ ]{0,3}(?P=fence)[ \t]*$|\Z)",
+        re.MULTILINE | re.DOTALL
+    )
     SUPPORTED_TOC_TARGET_SUFFIXES = (".md", ".markdown", ".docx")
     INDEX_STEMS = {"readme", "index", "table_of_contents", "toc"}
     ROOT_FILTER_STEMS = {"readme"}
+    LLM_BATCH_SIZE = 20
+    LLM_CONTEXT_LINE_MAX_CHARS = 80
+    LLM_CONTEXT_CHAR_BUDGET = 4000
+    EXTERNAL_LINK_PATTERN = re.compile(r"\[([^\]]*)\]\(\s*[A-Za-z][A-Za-z0-9+.-]*://[^)]*\)")
+    URL_PARENTHETICAL_PATTERN = re.compile(r"\(\s*[A-Za-z][A-Za-z0-9+.-]*://[^)]*\)")
+    WHITESPACE_PATTERN = re.compile(r"\s+")
+    FUZZY_MAX_BASENAMES = 5000
+    FUZZY_WIDE_MIN_LENGTH = 10
 
     def __init__(
         self,
         source_adapter: SourceAdapter,
         llm_resolver: Optional[TocAmbiguityResolver] = None,
         llm_confidence_threshold: float = 0.6,
-        skip_root_readme: bool = False
+        skip_root_readme: bool = False,
+        fuzzy_match: bool = True,
+        llm_max_concurrency: int = 4,
+        llm_rate_limit: float = 0.0,
+        llm_cache_path: str = ""
     ) -> None:
         self.source_adapter = source_adapter
         self.llm_resolver = llm_resolver
         self.llm_confidence_threshold = llm_confidence_threshold
         self.skip_root_readme = skip_root_readme
+        self.fuzzy_match = fuzzy_match
+        self.llm_max_concurrency = max(1, int(llm_max_concurrency))
+        self.llm_rate_limit = max(0.0, float(llm_rate_limit))
+        self._toc_cache: dict[str, str] = {}
+        self.llm_cache_path = llm_cache_path
+        self._llm_cache: Optional[dict[str, dict]] = None
+
+    def invalidate_toc_cache(self) -> None:
+        """Drop cached TOC content so the next manifest build re-reads it.
+
+        Args:
+            None
+        """
+
+        self._toc_cache.clear()
+
+    def seed_toc_cache(self, toc_path: str, content: str) -> None:
+        """Store TOC content that was read ahead of planning.
+
+        Args:
+            toc_path: Source-relative TOC path the content was read from.
+            content: TOC markdown text.
+        """
+
+        normalized = _normalize_relative_path(path = toc_path)
+        if normalized:
+            self._toc_cache[normalized] = content
 
     def build_manifest(
         self,
@@ -104,21 +329,20 @@ class OrchestrationPlanner:
             llm_max_calls: Max number of LLM calls per run.
         """
 
-        normalized_paths = []
-        for path in markdown_paths:
-            normalized = self._normalize_relative_path(path = path)
-            if normalized:
-                normalized_paths.append(normalized)
-        normalized_paths = sorted(normalized_paths)
+        # map/filter keep the per-path loop in C; clean paths hit the fast path
+        # inside _normalize_relative_path and repeated ones hit its lru_cache.
+        normalized_paths = sorted(filter(None, map(_normalize_relative_path, markdown_paths)))
         if not normalized_paths:
             return ImportManifest(items = [])
 
         skipped_items: list[ImportSkipped] = []
-        filtered_root_paths: list[str] = []
+        filtered_root_lookup: dict[str, str] = {}
         effective_paths: list[str] = []
+        effective_lowered: list[str] = []
         for path in normalized_paths:
+            lowered = path.lower()
             if self._is_root_readme_skipped(path = path):
-                filtered_root_paths.append(path)
+                filtered_root_lookup[lowered] = path
                 skipped_items.append(
                     ImportSkipped(
                         path = path,
@@ -127,6 +351,7 @@ class OrchestrationPlanner:
                 )
                 continue
             effective_paths.append(path)
+            effective_lowered.append(lowered)
 
         if not effective_paths:
             return ImportManifest(
@@ -140,10 +365,18 @@ class OrchestrationPlanner:
                 skipped_items = skipped_items
             )
 
-        toc_content, toc_path = self._load_toc_content(
+        toc_path = self._find_toc_path(
             markdown_paths = effective_paths,
+            lowered_paths = effective_lowered,
             toc_file = toc_file
         )
+        if not toc_path:
+            return self._build_path_manifest(
+                paths = effective_paths,
+                skipped_items = skipped_items
+            )
+
+        toc_content = self._load_toc_content(toc_path = toc_path)
         if not toc_content:
             return self._build_path_manifest(
                 paths = effective_paths,
@@ -157,12 +390,11 @@ class OrchestrationPlanner:
                 skipped_items = skipped_items
             )
 
-        path_lookup, basename_lookup = self._build_path_lookup(paths = effective_paths)
-        filtered_root_lookup = {
-            path.lower(): path for path in filtered_root_paths
-        }
+        path_lookup, basename_lookup, suffix_index = self._build_path_lookup(
+            paths = effective_paths,
+            lowered_paths = effective_lowered
+        )
         toc_dir = posixpath.dirname(toc_path)
-        toc_lines = toc_content.splitlines()
 
         ordered_paths: list[str] = []
         seen_paths: set[str] = set()
@@ -174,33 +406,38 @@ class OrchestrationPlanner:
         ambiguous_count = 0
 
         for link in toc_links:
-            normalized_target = self._normalize_link_target(
+            normalized_target = _normalize_link_target(
                 target = link.raw_target,
                 toc_dir = toc_dir
             )
-            if normalized_target and normalized_target.lower() in filtered_root_lookup:
+            normalized_target_lower = normalized_target.lower()
+            if normalized_target and normalized_target_lower in filtered_root_lookup:
                 skipped_items.append(
                     ImportSkipped(
-                        path = filtered_root_lookup[normalized_target.lower()],
+                        path = filtered_root_lookup[normalized_target_lower],
                         reason = "root_readme_filtered"
                     )
                 )
                 continue
 
             candidate_paths = self._resolve_link_candidates(
-                raw_target = link.raw_target,
-                toc_dir = toc_dir,
+                normalized_target = normalized_target,
+                normalized_target_lower = normalized_target_lower,
                 path_lookup = path_lookup,
-                basename_lookup = basename_lookup
+                basename_lookup = basename_lookup,
+                suffix_index = suffix_index
             )
 
             if len(candidate_paths) == 1:
                 selected = candidate_paths[0]
                 matched_links += 1
-                if selected not in seen_paths:
-                    ordered_paths.append(selected)
-                    seen_paths.add(selected)
-                    path_to_label[selected] = link.label
+                self._add_ordered(
+                    path = selected,
+                    label = link.label,
+                    ordered = ordered_paths,
+                    seen = seen_paths,
+                    labels = path_to_label
+                )
                 continue
 
             if len(candidate_paths) > 1:
@@ -213,6 +450,7 @@ class OrchestrationPlanner:
             )
 
         llm_calls = 0
+        llm_cache_hits = 0
         llm_used = False
         if (
             llm_fallback == "toc_ambiguity"
@@ -220,8 +458,19 @@ class OrchestrationPlanner:
             and llm_max_calls > 0
             and ambiguous_links
         ):
-            for link, candidates in ambiguous_links:
-                if llm_calls >= llm_max_calls:
+            # Line text is only needed for LLM prompt context; _parse_toc_links
+            # scans the raw TOC without materializing lines.
+            toc_lines = toc_content.splitlines()
+            resolutions, llm_calls, llm_cache_hits = self._resolve_ambiguities_with_cache(
+                ambiguous_links = ambiguous_links,
+                toc_lines = toc_lines,
+                toc_content = toc_content,
+                llm_max_calls = llm_max_calls
+            )
+            llm_used = llm_calls > 0
+
+            for (link, candidates), resolution in zip(ambiguous_links, resolutions):
+                if resolution is None:
                     unresolved_lines.append(
                         (
                             f"line {link.line_no}: [{link.label}]({link.raw_target}) -> "
@@ -230,29 +479,19 @@ class OrchestrationPlanner:
                     )
                     continue
 
-                llm_used = True
-                llm_calls += 1
-                context = self._build_toc_context(
-                    toc_lines = toc_lines,
-                    line_no = link.line_no
-                )
-                resolution = self.llm_resolver.resolve_toc_ambiguity(
-                    link_text = link.label,
-                    raw_target = link.raw_target,
-                    candidate_paths = candidates,
-                    toc_context = context
-                )
-
-                selected = self._normalize_relative_path(path = resolution.selected_path)
+                selected = _normalize_relative_path(path = resolution.selected_path)
                 if (
                     selected in candidates
                     and resolution.confidence >= self.llm_confidence_threshold
                 ):
                     matched_links += 1
-                    if selected not in seen_paths:
-                        ordered_paths.append(selected)
-                        seen_paths.add(selected)
-                        path_to_label[selected] = link.label
+                    self._add_ordered(
+                        path = selected,
+                        label = link.label,
+                        ordered = ordered_paths,
+                        seen = seen_paths,
+                        labels = path_to_label
+                    )
                     continue
 
                 unresolved_lines.append(
@@ -270,11 +509,9 @@ class OrchestrationPlanner:
                     )
                 )
 
-        for path in effective_paths:
-            if path in seen_paths:
-                continue
-            ordered_paths.append(path)
-            seen_paths.add(path)
+        ordered_paths.extend(
+            path for path in dict.fromkeys(effective_paths) if path not in seen_paths
+        )
 
         items = [
             self._build_plan_item(
@@ -290,6 +527,7 @@ class OrchestrationPlanner:
             unresolved_links = unresolved_lines,
             llm_used = llm_used,
             llm_calls = llm_calls,
+            llm_cache_hits = llm_cache_hits,
             toc_links = len(toc_links),
             matched_links = matched_links,
             ambiguous_links = ambiguous_count,
@@ -297,6 +535,367 @@ class OrchestrationPlanner:
             skipped_items = skipped_items
         )
 
+    def _add_ordered(
+        self,
+        path: str,
+        label: str,
+        ordered: list[str],
+        seen: set[str],
+        labels: dict[str, str]
+    ) -> None:
+        """Append one TOC-matched path unless it is already ordered.
+
+        Args:
+            path: Source-relative markdown path.
+            label: TOC link label.
+            ordered: Ordered path list to extend.
+            seen: Paths already in ordered.
+            labels: TOC label by path.
+        """
+
+        if path in seen:
+            return
+        ordered.append(path)
+        seen.add(path)
+        if label:
+            labels[path] = label
+
+    def _resolve_ambiguities_with_cache(
+        self,
+        ambiguous_links: list[tuple[TocLinkRef, list[str]]],
+        toc_lines: list[str],
+        toc_content: str,
+        llm_max_calls: int
+    ) -> tuple[list[Optional[LlmResolution]], int, int]:
+        """Resolve ambiguous links, reusing persisted resolutions when available.
+
+        Args:
+            ambiguous_links: Ambiguous links with candidate paths.
+            toc_lines: TOC lines.
+            toc_content: Full TOC markdown text.
+            llm_max_calls: Max number of LLM calls.
+        """
+
+        if not self.llm_cache_path:
+            resolutions, llm_calls = self._dispatch_ambiguity_resolution(
+                ambiguous_links = ambiguous_links,
+                toc_lines = toc_lines,
+                llm_max_calls = llm_max_calls
+            )
+            return resolutions, llm_calls, 0
+
+        cache = self._load_llm_cache()
+        toc_hash = hashlib.sha256(toc_content.encode("utf-8")).hexdigest()
+        cache_keys = [
+            self._llm_cache_key(link = link, candidates = candidates, toc_hash = toc_hash)
+            for link, candidates in ambiguous_links
+        ]
+
+        resolutions: list[Optional[LlmResolution]] = [None] * len(ambiguous_links)
+        pending_indexes: list[int] = []
+        for index, key in enumerate(cache_keys):
+            entry = cache.get(key)
+            if entry is None:
+                pending_indexes.append(index)
+                continue
+            resolutions[index] = LlmResolution(
+                selected_path = str(entry.get("selected_path", "")),
+                confidence = float(entry.get("confidence", 0.0)),
+                reason = str(entry.get("reason", ""))
+            )
+        cache_hits = len(ambiguous_links) - len(pending_indexes)
+
+        llm_calls = 0
+        if pending_indexes:
+            pending_resolutions, llm_calls = self._dispatch_ambiguity_resolution(
+                ambiguous_links = [ambiguous_links[index] for index in pending_indexes],
+                toc_lines = toc_lines,
+                llm_max_calls = llm_max_calls
+            )
+            cache_updated = False
+            for index, resolution in zip(pending_indexes, pending_resolutions):
+                resolutions[index] = resolution
+                if resolution is not None and resolution.selected_path:
+                    cache[cache_keys[index]] = {
+                        "selected_path": resolution.selected_path,
+                        "confidence": resolution.confidence,
+                        "reason": resolution.reason
+                    }
+                    cache_updated = True
+            if cache_updated:
+                self._save_llm_cache()
+        return resolutions, llm_calls, cache_hits
+
+    def _dispatch_ambiguity_resolution(
+        self,
+        ambiguous_links: list[tuple[TocLinkRef, list[str]]],
+        toc_lines: list[str],
+        llm_max_calls: int
+    ) -> tuple[list[Optional[LlmResolution]], int]:
+        """Pick batch, async or sequential resolution based on resolver capabilities.
+
+        Args:
+            ambiguous_links: Ambiguous links with candidate paths.
+            toc_lines: TOC lines.
+            llm_max_calls: Max number of LLM calls.
+        """
+
+        batch_resolve = getattr(self.llm_resolver, "resolve_toc_ambiguity_batch", None)
+        if callable(batch_resolve):
+            return self._resolve_ambiguities_in_batches(
+                batch_resolve = batch_resolve,
+                ambiguous_links = ambiguous_links,
+                toc_lines = toc_lines,
+                llm_max_calls = llm_max_calls
+            )
+        if inspect.iscoroutinefunction(self.llm_resolver.resolve_toc_ambiguity):
+            return self._resolve_ambiguities_concurrently(
+                ambiguous_links = ambiguous_links,
+                toc_lines = toc_lines,
+                llm_max_calls = llm_max_calls
+            )
+        return self._resolve_ambiguities_one_by_one(
+            ambiguous_links = ambiguous_links,
+            toc_lines = toc_lines,
+            llm_max_calls = llm_max_calls
+        )
+
+    def _llm_cache_key(self, link: TocLinkRef, candidates: list[str], toc_hash: str) -> str:
+        """Build persistent cache key for one ambiguity.
+
+        Args:
+            link: TOC link.
+            candidates: Candidate source paths.
+            toc_hash: SHA-256 hex digest of TOC content.
+        """
+
+        raw_key = json.dumps(
+            [link.label, link.raw_target, sorted(candidates), toc_hash],
+            ensure_ascii = False
+        )
+        return hashlib.blake2b(raw_key.encode("utf-8"), digest_size = 16).hexdigest()
+
+    def _load_llm_cache(self) -> dict[str, dict]:
+        """Load persisted LLM resolutions once per planner.
+
+        Args:
+            None
+        """
+
+        if self._llm_cache is not None:
+            return self._llm_cache
+
+        self._llm_cache = {}
+        cache_file = Path(self.llm_cache_path)
+        if not cache_file.exists():
+            return self._llm_cache
+
+        try:
+            payload = json.loads(cache_file.read_text(encoding = "utf-8"))
+        except Exception:
+            logger.warning("Failed to parse LLM resolution cache file: %s", str(cache_file))
+            return self._llm_cache
+
+        if isinstance(payload, dict):
+            self._llm_cache = {
+                key: value for key, value in payload.items() if isinstance(value, dict)
+            }
+        return self._llm_cache
+
+    def _save_llm_cache(self) -> None:
+        """Persist LLM resolutions to the cache file.
+
+        Args:
+            None
+        """
+
+        cache_file = Path(self.llm_cache_path)
+        try:
+            cache_file.parent.mkdir(parents = True, exist_ok = True)
+            cache_file.write_text(
+                json.dumps(self._llm_cache or {}, ensure_ascii = False),
+                encoding = "utf-8"
+            )
+        except Exception:
+            logger.warning("Failed to write LLM resolution cache file: %s", str(cache_file))
+
+    def _resolve_ambiguities_one_by_one(
+        self,
+        ambiguous_links: list[tuple[TocLinkRef, list[str]]],
+        toc_lines: list[str],
+        llm_max_calls: int
+    ) -> tuple[list[Optional[LlmResolution]], int]:
+        """Resolve ambiguous links with one LLM call per link.
+
+        Args:
+            ambiguous_links: Ambiguous links with candidate paths.
+            toc_lines: TOC lines.
+            llm_max_calls: Max number of LLM calls.
+        """
+
+        resolutions: list[Optional[LlmResolution]] = []
+        context_by_line: dict[int, str] = {}
+        llm_calls = 0
+        for link, candidates in ambiguous_links:
+            if llm_calls >= llm_max_calls:
+                resolutions.append(None)
+                continue
+            llm_calls += 1
+            if link.line_no not in context_by_line:
+                context_by_line[link.line_no] = self._build_toc_context(
+                    toc_lines = toc_lines,
+                    line_no = link.line_no
+                )
+            resolutions.append(
+                self.llm_resolver.resolve_toc_ambiguity(
+                    link_text = link.label,
+                    raw_target = link.raw_target,
+                    candidate_paths = candidates,
+                    toc_context = context_by_line[link.line_no]
+                )
+            )
+        return resolutions, llm_calls
+
+    def _resolve_ambiguities_concurrently(
+        self,
+        ambiguous_links: list[tuple[TocLinkRef, list[str]]],
+        toc_lines: list[str],
+        llm_max_calls: int
+    ) -> tuple[list[Optional[LlmResolution]], int]:
+        """Resolve ambiguous links with bounded concurrent async LLM calls.
+
+        Args:
+            ambiguous_links: Ambiguous links with candidate paths.
+            toc_lines: TOC lines.
+            llm_max_calls: Max number of LLM calls.
+        """
+
+        resolvable = ambiguous_links[:llm_max_calls]
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            results = asyncio.run(
+                self._gather_async_resolutions(
+                    ambiguous_links = resolvable,
+                    toc_lines = toc_lines
+                )
+            )
+        else:
+            # asyncio.run() refuses to nest inside a running loop, so use a helper thread.
+            with ThreadPoolExecutor(max_workers = 1) as executor:
+                results = executor.submit(
+                    asyncio.run,
+                    self._gather_async_resolutions(
+                        ambiguous_links = resolvable,
+                        toc_lines = toc_lines
+                    )
+                ).result()
+
+        resolutions: list[Optional[LlmResolution]] = []
+        for (link, _), result in zip(resolvable, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "LLM ambiguity resolution failed for line %s: %s",
+                    link.line_no,
+                    str(result)
+                )
+                resolutions.append(LlmResolution())
+                continue
+            resolutions.append(result or LlmResolution())
+        resolutions.extend([None] * (len(ambiguous_links) - len(resolvable)))
+        return resolutions, len(resolvable)
+
+    async def _gather_async_resolutions(
+        self,
+        ambiguous_links: list[tuple[TocLinkRef, list[str]]],
+        toc_lines: list[str]
+    ) -> list:
+        """Run async resolver calls under semaphore and optional rate limit.
+
+        Args:
+            ambiguous_links: Ambiguous links with candidate paths.
+            toc_lines: TOC lines.
+        """
+
+        semaphore = asyncio.Semaphore(self.llm_max_concurrency)
+        context_by_line: dict[int, str] = {}
+        for link, _ in ambiguous_links:
+            if link.line_no not in context_by_line:
+                context_by_line[link.line_no] = self._build_toc_context(
+                    toc_lines = toc_lines,
+                    line_no = link.line_no
+                )
+        bucket = None
+        if self.llm_rate_limit > 0:
+            bucket = _AsyncTokenBucket(
+                rate_per_minute = self.llm_rate_limit,
+                capacity = self.llm_max_concurrency
+            )
+
+        async def bounded(link: TocLinkRef, candidates: list[str]) -> LlmResolution:
+            async with semaphore:
+                if bucket is not None:
+                    await bucket.acquire()
+                return await self.llm_resolver.resolve_toc_ambiguity(
+                    link_text = link.label,
+                    raw_target = link.raw_target,
+                    candidate_paths = candidates,
+                    toc_context = context_by_line[link.line_no]
+                )
+
+        return await asyncio.gather(
+            *[bounded(link = link, candidates = candidates) for link, candidates in ambiguous_links],
+            return_exceptions = True
+        )
+
+    def _resolve_ambiguities_in_batches(
+        self,
+        batch_resolve,
+        ambiguous_links: list[tuple[TocLinkRef, list[str]]],
+        toc_lines: list[str],
+        llm_max_calls: int
+    ) -> tuple[list[Optional[LlmResolution]], int]:
+        """Resolve ambiguous links with up to LLM_BATCH_SIZE links per LLM call.
+
+        Args:
+            batch_resolve: Resolver batch method.
+            ambiguous_links: Ambiguous links with candidate paths.
+            toc_lines: TOC lines.
+            llm_max_calls: Max number of LLM calls.
+        """
+
+        batch_size = self.LLM_BATCH_SIZE
+        resolvable = ambiguous_links[:llm_max_calls * batch_size]
+        resolutions: list[Optional[LlmResolution]] = []
+        llm_calls = 0
+        for start in range(0, len(resolvable), batch_size):
+            batch = resolvable[start:start + batch_size]
+            llm_calls += 1
+            batch_result = list(
+                batch_resolve(
+                    items = [
+                        {
+                            "link_text": link.label,
+                            "raw_target": link.raw_target,
+                            "candidate_paths": candidates
+                        }
+                        for link, candidates in batch
+                    ],
+                    toc_context = self._build_toc_context_for_lines(
+                        toc_lines = toc_lines,
+                        line_nos = [link.line_no for link, _ in batch]
+                    )
+                ) or []
+            )
+            for offset in range(len(batch)):
+                if offset < len(batch_result) and batch_result[offset] is not None:
+                    resolutions.append(batch_result[offset])
+                else:
+                    resolutions.append(LlmResolution())
+
+        resolutions.extend([None] * (len(ambiguous_links) - len(resolvable)))
+        return resolutions, llm_calls
+
     def _build_path_manifest(
         self,
         paths: list[str],
@@ -305,13 +904,13 @@ class OrchestrationPlanner:
         """Build simple path-sorted manifest without TOC parsing.
 
         Args:
-            paths: Normalized source-relative markdown paths.
+            paths: Normalized source-relative markdown paths, already sorted by build_manifest.
             skipped_items: Optional skipped import items.
         """
 
         items = [
             self._build_plan_item(path = path, order = index)
-            for index, path in enumerate(sorted(paths))
+            for index, path in enumerate(paths)
         ]
         return ImportManifest(
             items = items,
@@ -330,7 +929,7 @@ class OrchestrationPlanner:
         relative_dir = posixpath.dirname(path)
         if relative_dir == ".":
             relative_dir = ""
-        stem = posixpath.splitext(posixpath.basename(path))[0].lower()
+        stem = posixpath.splitext(path.rpartition("/")[2])[0].lower()
         return DocumentPlanItem(
             path = path,
             order = order,
@@ -339,50 +938,77 @@ class OrchestrationPlanner:
             toc_label = toc_label
         )
 
-    def _build_path_lookup(self, paths: list[str]) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+    def _build_path_lookup(
+        self,
+        paths: list[str],
+        lowered_paths: list[str]
+    ) -> tuple[dict[str, list[str]], dict[str, list[str]], tuple[list[str], list[tuple[int, str]]]]:
         """Build normalized path lookup maps.
 
         Args:
-            paths: Normalized source-relative markdown paths.
+            paths: Already normalized, non-empty source-relative markdown paths.
+            lowered_paths: Lowercase form of each path, index-aligned with paths.
         """
 
         path_lookup: dict[str, list[str]] = {}
         basename_lookup: dict[str, list[str]] = {}
-        for path in paths:
-            normalized = self._normalize_relative_path(path = path)
-            if not normalized:
-                continue
-
-            normalized_key = normalized.lower()
-            path_lookup.setdefault(normalized_key, []).append(normalized)
-
-            basename = posixpath.basename(normalized).lower()
-            basename_lookup.setdefault(basename, []).append(normalized)
-        return path_lookup, basename_lookup
+        reversed_entries: list[tuple[str, int, str]] = []
+        for index, (path, lowered) in enumerate(zip(paths, lowered_paths)):
+            path_lookup.setdefault(lowered, []).append(path)
+            basename_lookup.setdefault(lowered.rpartition("/")[2], []).append(path)
+            reversed_entries.append((lowered[::-1], index, path))
+
+        # Reversed lowercase paths sorted together turn "endswith(suffix)" into
+        # a contiguous prefix range that bisect can locate.
+        reversed_entries.sort()
+        suffix_index = (
+            [entry[0] for entry in reversed_entries],
+            [(entry[1], entry[2]) for entry in reversed_entries]
+        )
+        return path_lookup, basename_lookup, suffix_index
 
-    def _load_toc_content(self, markdown_paths: list[str], toc_file: str) -> tuple[str, str]:
-        """Load TOC markdown content if present.
+    def _find_toc_path(
+        self,
+        markdown_paths: list[str],
+        lowered_paths: list[str],
+        toc_file: str
+    ) -> str:
+        """Find the source path of the TOC file, or empty string if absent.
 
         Args:
-            markdown_paths: Source markdown paths.
+            markdown_paths: Normalized source markdown paths.
+            lowered_paths: Lowercase form of each path, index-aligned with markdown_paths.
             toc_file: TOC file path relative to source root.
         """
 
-        toc_candidate = self._normalize_relative_path(path = toc_file)
+        toc_candidate = _normalize_relative_path(path = toc_file)
         if not toc_candidate:
-            return "", ""
+            return ""
 
-        lookup = {self._normalize_relative_path(path = item).lower(): item for item in markdown_paths}
-        toc_path = lookup.get(toc_candidate.lower(), "")
-        if not toc_path:
-            return "", ""
+        toc_candidate_lower = toc_candidate.lower()
+        for path, lowered in zip(markdown_paths, lowered_paths):
+            if lowered == toc_candidate_lower:
+                return path
+        return ""
+
+    def _load_toc_content(self, toc_path: str) -> str:
+        """Load TOC markdown content.
+
+        Args:
+            toc_path: Source-relative TOC path present in the source.
+        """
+
+        cached = self._toc_cache.get(toc_path)
+        if cached is not None:
+            return cached
 
         try:
             toc_doc = self.source_adapter.read_markdown(relative_path = toc_path)
-            return toc_doc.markdown, toc_path
         except Exception as exc:
             logger.warning("Failed to read toc_file = %s: %s", toc_path, str(exc))
-            return "", ""
+            return ""
+        self._toc_cache[toc_path] = toc_doc.markdown
+        return toc_doc.markdown
 
     def _parse_toc_links(self, toc_content: str) -> list[TocLinkRef]:
         """Extract markdown links that target .md files.
@@ -391,63 +1017,159 @@ class OrchestrationPlanner:
             toc_content: TOC markdown text.
         """
 
+        if "](" not in toc_content:
+            return []
+
+        line_starts = [0]
+        line_starts.extend(
+            match.end() for match in self.LINE_BREAK_PATTERN.finditer(toc_content)
+        )
+
+        fence_starts: list[int] = []
+        fence_ends: list[int] = []
+        if "```" in toc_content or "~~~" in toc_content:
+            for fence in self.FENCED_CODE_PATTERN.finditer(toc_content):
+                fence_starts.append(fence.start())
+                fence_ends.append(fence.end())
+
         links: list[TocLinkRef] = []
-        for index, line in enumerate(toc_content.splitlines(), start = 1):
-            for match in self.MD_LINK_PATTERN.finditer(line):
-                label = (match.group("label") or "").strip()
-                target = (match.group("target") or "").strip()
-                normalized_target = self._normalize_link_target(target = target, toc_dir = "")
-                if not normalized_target:
-                    continue
-                if not normalized_target.lower().endswith(self.SUPPORTED_TOC_TARGET_SUFFIXES):
+        supported_suffixes = self.SUPPORTED_TOC_TARGET_SUFFIXES
+        bisect_right = bisect.bisect_right
+        for match in self.MD_LINK_PATTERN.finditer(toc_content):
+            if fence_starts:
+                fence_index = bisect_right(fence_starts, match.start()) - 1
+                if fence_index >= 0 and match.start() < fence_ends[fence_index]:
                     continue
-                links.append(
-                    TocLinkRef(
-                        line_no = index,
-                        label = label,
-                        raw_target = target
-                    )
+            # Both groups are non-empty by construction; fetch them in one call
+            # and only strip the label once the target is known to qualify.
+            raw_label, raw_target = match.group("label", "target")
+            target = raw_target.strip()
+            normalized_target = _normalize_link_target(target = target, toc_dir = "")
+            if not normalized_target:
+                continue
+            if not normalized_target.lower().endswith(supported_suffixes):
+                continue
+            links.append(
+                TocLinkRef(
+                    line_no = bisect_right(line_starts, match.start()),
+                    label = raw_label.strip(),
+                    raw_target = target
                 )
+            )
         return links
 
     def _resolve_link_candidates(
         self,
-        raw_target: str,
-        toc_dir: str,
+        normalized_target: str,
+        normalized_target_lower: str,
         path_lookup: dict[str, list[str]],
-        basename_lookup: dict[str, list[str]]
+        basename_lookup: dict[str, list[str]],
+        suffix_index: tuple[list[str], list[tuple[int, str]]]
     ) -> list[str]:
         """Resolve one TOC target into source path candidates.
 
         Args:
-            raw_target: Raw target text from markdown link.
-            toc_dir: TOC parent directory.
+            normalized_target: Normalized link target path.
+            normalized_target_lower: Lowercase form of normalized_target.
             path_lookup: Normalized path lookup.
             basename_lookup: Basename lookup.
+            suffix_index: Sorted reversed lowercase paths with (order, path) entries.
         """
 
-        normalized_target = self._normalize_link_target(target = raw_target, toc_dir = toc_dir)
         if not normalized_target:
             return []
 
-        exact = path_lookup.get(normalized_target.lower(), [])
+        # Lookup lists follow the sorted effective path order, so first-seen
+        # dedup keeps the same deterministic order sorted(set(...)) gave.
+        exact = path_lookup.get(normalized_target_lower, [])
+        if len(exact) == 1:
+            return [exact[0]]
         if exact:
-            return sorted(set(exact))
+            return list(dict.fromkeys(exact))
 
-        basename = posixpath.basename(normalized_target).lower()
-        candidates = basename_lookup.get(basename, [])
+        target_basename = normalized_target_lower.rpartition("/")[2]
+        candidates = basename_lookup.get(target_basename, [])
         if not candidates:
-            return []
+            if not self.fuzzy_match:
+                return []
+            return self._fuzzy_basename_candidates(
+                target_basename = target_basename,
+                basename_lookup = basename_lookup
+            )
+        if len(candidates) == 1:
+            return [candidates[0]]
 
         if "/" in normalized_target:
-            suffix = normalized_target.lower()
-            suffix_filtered = [
-                item for item in candidates
-                if item.lower().endswith(suffix)
-            ]
+            suffix_filtered = self._find_suffix_matches(
+                suffix_lower = normalized_target_lower,
+                suffix_index = suffix_index
+            )
             if suffix_filtered:
-                return sorted(set(suffix_filtered))
-        return sorted(set(candidates))
+                return list(dict.fromkeys(suffix_filtered))
+        return list(dict.fromkeys(candidates))
+
+    def _fuzzy_basename_candidates(
+        self,
+        target_basename: str,
+        basename_lookup: dict[str, list[str]]
+    ) -> list[str]:
+        """Match a near-miss basename (typo) by bounded edit distance.
+
+        A unique basename within distance 1 is taken as the match. Longer
+        names also accept distance 2, where every nearest basename contributes
+        candidates so that ties still go through the ambiguity path.
+
+        Args:
+            target_basename: Lowercase link target basename.
+            basename_lookup: Basename lookup.
+        """
+
+        if len(basename_lookup) > self.FUZZY_MAX_BASENAMES:
+            return []
+
+        max_distance = 2 if len(target_basename) >= self.FUZZY_WIDE_MIN_LENGTH else 1
+        best_distance = max_distance + 1
+        best_basenames: list[str] = []
+        for basename in basename_lookup:
+            distance = _bounded_edit_distance(
+                left = target_basename,
+                right = basename,
+                max_distance = min(max_distance, best_distance)
+            )
+            if distance < best_distance:
+                best_distance = distance
+                best_basenames = [basename]
+            elif distance == best_distance and distance <= max_distance:
+                best_basenames.append(basename)
+
+        if not best_basenames:
+            return []
+        candidates: list[str] = []
+        for basename in best_basenames:
+            candidates.extend(basename_lookup[basename])
+        return sorted(dict.fromkeys(candidates))
+
+    def _find_suffix_matches(
+        self,
+        suffix_lower: str,
+        suffix_index: tuple[list[str], list[tuple[int, str]]]
+    ) -> list[str]:
+        """Find paths whose lowercase form ends with suffix, in manifest order.
+
+        Args:
+            suffix_lower: Lowercase path suffix.
+            suffix_index: Sorted reversed lowercase paths with (order, path) entries.
+        """
+
+        reversed_keys, entries = suffix_index
+        reversed_suffix = suffix_lower[::-1]
+        matches: list[tuple[int, str]] = []
+        for position in range(bisect.bisect_left(reversed_keys, reversed_suffix), len(reversed_keys)):
+            if not reversed_keys[position].startswith(reversed_suffix):
+                break
+            matches.append(entries[position])
+        matches.sort()
+        return [path for _, path in matches]
 
     def _build_toc_context(self, toc_lines: list[str], line_no: int, window: int = 2) -> str:
         """Build compact TOC nearby context for LLM fallback.
@@ -463,71 +1185,77 @@ class OrchestrationPlanner:
 
         start = max(1, line_no - window)
         end = min(len(toc_lines), line_no + window)
-        context_lines = []
-        for index in range(start, end + 1):
-            context_lines.append(f"{index}: {toc_lines[index - 1]}")
-        return "\n".join(context_lines)
+        return "\n".join(
+            f"{index}: {self._compress_toc_line(line = line)}"
+            for index, line in enumerate(toc_lines[start - 1:end], start = start)
+        )
 
-    def _normalize_link_target(self, target: str, toc_dir: str) -> str:
-        """Normalize one markdown link target path.
+    def _build_toc_context_for_lines(
+        self,
+        toc_lines: list[str],
+        line_nos: list[int],
+        window: int = 2
+    ) -> str:
+        """Build one TOC context covering the union of windows around many lines.
 
         Args:
-            target: Raw markdown link target.
-            toc_dir: TOC parent directory.
+            toc_lines: TOC lines.
+            line_nos: 1-based target line numbers.
+            window: Number of surrounding lines on each side.
         """
 
-        normalized_target = self._normalize_relative_path(path = target)
-        if not normalized_target:
+        if not toc_lines:
             return ""
 
-        if toc_dir:
-            normalized_target = posixpath.normpath(
-                posixpath.join(toc_dir, normalized_target)
-            )
-        return normalized_target.lstrip("/")
+        selected: set[int] = set()
+        for line_no in line_nos:
+            if line_no <= 0:
+                continue
+            start = max(1, line_no - window)
+            end = min(len(toc_lines), line_no + window)
+            selected.update(range(start, end + 1))
 
-    def _normalize_relative_path(self, path: str) -> str:
-        """Normalize source-relative path for matching.
+        context_lines = []
+        seen_lines: set[str] = set()
+        total_chars = 0
+        previous = 0
+        for index in sorted(selected):
+            has_gap = previous and index > previous + 1
+            previous = index
+            compressed = self._compress_toc_line(line = toc_lines[index - 1])
+            if not compressed or compressed in seen_lines:
+                continue
+            entry = f"{index}: {compressed}"
+            if total_chars + len(entry) > self.LLM_CONTEXT_CHAR_BUDGET:
+                break
+            if has_gap:
+                context_lines.append("...")
+            context_lines.append(entry)
+            seen_lines.add(compressed)
+            total_chars += len(entry) + 1
+        return "\n".join(context_lines)
+
+    def _compress_toc_line(self, line: str) -> str:
+        """Shrink one TOC line for LLM prompts without losing local link targets.
 
         Args:
-            path: Raw path text.
+            line: Raw TOC line.
         """
 
-        value = urllib.parse.unquote((path or "").strip())
-        if not value:
-            return ""
-
-        parsed = urllib.parse.urlparse(value)
-        if parsed.scheme:
-            return ""
-
-        value = value.replace("\\", "/")
-        value = value.split("#", 1)[0]
-        value = value.split("?", 1)[0]
-        if not value:
-            return ""
-
-        normalized = posixpath.normpath(value)
-        if normalized in {"", "."}:
-            return ""
-
-        normalized = normalized.lstrip("/")
-        if normalized.startswith("../"):
-            return ""
-        return normalized
+        compressed = self.EXTERNAL_LINK_PATTERN.sub(r"\1", line)
+        compressed = self.URL_PARENTHETICAL_PATTERN.sub("", compressed)
+        compressed = self.WHITESPACE_PATTERN.sub(" ", compressed).strip()
+        if len(compressed) > self.LLM_CONTEXT_LINE_MAX_CHARS:
+            compressed = compressed[:self.LLM_CONTEXT_LINE_MAX_CHARS - 3] + "..."
+        return compressed
 
     def _is_root_readme_skipped(self, path: str) -> bool:
         """Check whether source path should be skipped by root README rule.
 
         Args:
-            path: Normalized source-relative path.
+            path: Source-relative path already passed through _normalize_relative_path.
         """
 
-        if not self.skip_root_readme:
-            return False
-
-        normalized = (path or "").strip().replace("\\", "/").strip("/")
-        if "/" in normalized:
+        if not self.skip_root_readme or "/" in path:
             return False
-        stem = posixpath.splitext(normalized)[0].lower()
-        return stem in self.ROOT_FILTER_STEMS
+        return posixpath.splitext(path)[0].lower() in self.ROOT_FILTER_STEMS
@@ -1,16 +1,27 @@
+import io
 import os
 import re
 import sys
+import mmap
+import queue
+import time
 import logging
 import datetime
+import functools
+import tempfile
+import threading
 import posixpath
 import dataclasses
 import urllib.parse
 import multiprocessing
 from typing import Any
+from typing import Callable
+from typing import Iterable
 from typing import Optional
+from concurrent.futures import Future
 from concurrent.futures import as_completed
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(os.getcwd())
 
@@ -18,9 +29,11 @@ from config.config import AppConfig
 from core.orchestration_planner import OrchestrationPlanner
 from data.models import AssetRef
 from data.models import CreatedDocRecord
+from data.models import DocumentPlanItem
 from data.models import ImportFailure
 from data.models import ImportManifest
 from data.models import ImportResult
+from data.models import ProcessedMarkdown
 from data.models import SourceDocument
 from data.source_adapters import SourceAdapter
 from integrations.feishu_api import DocWriterService
@@ -28,16 +41,76 @@ from integrations.feishu_api import FeishuAuthClient
 from integrations.feishu_api import MediaService
 from integrations.feishu_api import WikiService
 from utils.http_client import HttpClient
+from utils.rate_limiter import RateLimiter
 from utils.logging_setup import ensure_worker_log_handler
 from utils.markdown_processor import MarkdownProcessor
 
 
 logger = logging.getLogger(__name__)
 
+# Control chars and characters Feishu rejects in titles all become spaces.
+_TITLE_SANITIZE_TRANS = str.maketrans(
+    dict.fromkeys([*range(0x20), 0x7f, *map(ord, '\\/:*?"<>|')], " ")
+)
+_TITLE_MAX_BYTES = 180
+# "确认参数是否合法" is covered by the unordered 参数/合法 pair.
+_INVALID_PARAM_RE = re.compile(r"1770001|invalid param|参数.*合法|合法.*参数", re.DOTALL)
+_NAV_LINE_URL = "%s- [%s](%s) · `%s`"
+_NAV_LINE_NOURL = "%s- %s · `%s` (document_id: `%s`)"
+_TITLE_STRIP_SUFFIXES = (".markdown", ".docx", ".md")
+
+
+@dataclasses.dataclass(frozen = True, slots = True)
+class _NormPath:
+    """Source path split once and shared by the title helpers.
+
+    Args:
+        posix: Stripped path text with forward slashes.
+        parts: Non-empty path segments.
+        stem_lower: Lowercase last segment without its extension.
+    """
+
+    posix: str
+    parts: tuple[str, ...]
+    stem_lower: str
+
+
+@functools.lru_cache(maxsize = 4096)
+def _norm_path(path: str) -> _NormPath:
+    """Normalize one source path into its reusable pieces.
+
+    Args:
+        path: Source-relative path text.
+    """
+
+    posix = (path or "").strip().replace("\\", "/")
+    parts = tuple(segment for segment in posix.split("/") if segment)
+    stem_lower = posixpath.splitext(parts[-1])[0].lower() if parts else ""
+    return _NormPath(
+        posix = posix,
+        parts = parts,
+        stem_lower = stem_lower
+    )
+
+
+@dataclasses.dataclass(frozen = True, slots = True)
+class _PlanLookups:
+    """Per-path lookups derived from one pass over the manifest.
+
+    Args:
+        order_map: Manifest index by path.
+        folder_dir_by_path: Root-prefixed destination folder dir by path.
+    """
+
+    order_map: dict[str, int]
+    folder_dir_by_path: dict[str, str]
+
 
 class InMemorySourceAdapter(SourceAdapter):
     """In-memory source adapter for worker-side grouped import."""
 
+    supports_concurrent_read = True
+
     def __init__(
         self,
         docs_by_path: dict[str, SourceDocument],
@@ -65,60 +138,50 @@ class InMemorySourceAdapter(SourceAdapter):
 
         if relative_path not in self.docs_by_path:
             raise FileNotFoundError(f"Missing in-memory markdown path: {relative_path}")
-        doc = self.docs_by_path[relative_path]
-        return SourceDocument(
-            path = doc.path,
-            title = doc.title,
-            markdown = doc.markdown,
-            assets = list(doc.assets),
-            relative_dir = doc.relative_dir,
-            base_ref = doc.base_ref,
-            source_type = doc.source_type
-        )
+        # Shallow copy so callers can reassign fields freely. Assets start as the
+        # shared empty tuple: every reader replaces them with parsed assets, and
+        # the stored snapshot's list is never aliased.
+        return dataclasses.replace(self.docs_by_path[relative_path], assets = ())
 
 
-def _process_group_worker(payload: dict[str, Any]) -> dict[str, Any]:
-    """Process one top-level folder group in a subprocess.
+_WORKER_CTX: Optional[dict[str, Any]] = None
+
+
+def _worker_init(
+    config_payload: dict[str, Any],
+    write_mode: str,
+    chunk_workers: int,
+    doc_workers: int = 1,
+    spool_path: str = "",
+    auth_seed: tuple[str, float] = ("", 0.0)
+) -> None:
+    """Build per-process Feishu services once for the grouped import pool.
 
     Args:
-        payload: Serializable worker payload.
+        config_payload: Serialized AppConfig fields.
+        write_mode: Write mode, one of folder/wiki/both.
+        chunk_workers: Per-document chunk planning thread count.
+        doc_workers: Documents imported concurrently inside one group.
+        spool_path: Optional markdown spool file written by the parent.
+        auth_seed: Parent's (tenant_access_token, expires_at) so workers start warm.
     """
 
-    ensure_worker_log_handler()
+    global _WORKER_CTX
 
-    group_key = str(payload.get("group_key", "__unknown__"))
-    config = AppConfig(**payload["config"])
-    docs_by_path: dict[str, SourceDocument] = {}
-    for raw_doc in payload.get("docs", []):
-        path = str(raw_doc.get("path", "")).strip()
-        if not path:
-            continue
-        docs_by_path[path] = SourceDocument(
-            path = path,
-            title = str(raw_doc.get("title", "")).strip() or posixpath.basename(path),
-            markdown = str(raw_doc.get("markdown", "")),
-            assets = [],
-            relative_dir = str(raw_doc.get("relative_dir", "")).strip(),
-            base_ref = str(raw_doc.get("base_ref", "")).strip(),
-            source_type = str(raw_doc.get("source_type", "")).strip() or "local"
-        )
+    ensure_worker_log_handler()
 
-    ordered_paths = [path for path in payload.get("ordered_paths", []) if path in docs_by_path]
-    logger.info(
-        "worker group start: key = %s, docs = %d",
-        group_key,
-        len(ordered_paths)
-    )
-    source_adapter = InMemorySourceAdapter(
-        docs_by_path = docs_by_path,
-        ordered_paths = ordered_paths
+    config = AppConfig(
+        **{
+            field.name: config_payload[field.name]
+            for field in dataclasses.fields(AppConfig)
+            if field.init
+        }
     )
-    markdown_processor = MarkdownProcessor()
-
     http_client = HttpClient(
         timeout = config.request_timeout,
         max_retries = config.max_retries,
-        retry_backoff = config.retry_backoff
+        retry_backoff = config.retry_backoff,
+        rate_limiter = RateLimiter(config.api_rate_limit) if config.api_rate_limit > 0 else None
     )
     app_auth = FeishuAuthClient(
         app_id = config.feishu_app_id,
@@ -126,13 +189,16 @@ def _process_group_worker(payload: dict[str, Any]) -> dict[str, Any]:
         base_url = config.feishu_base_url,
         http_client = http_client
     )
+    app_auth.seed_token(*auth_seed)
+    write_folder = write_mode in ("folder", "both")
+    write_wiki = write_mode in ("wiki", "both")
     doc_writer = DocWriterService(
         auth_client = app_auth,
         http_client = http_client,
         base_url = config.feishu_base_url,
-        folder_token = config.feishu_folder_token if payload.get("write_mode") in {"folder", "both"} else "",
+        folder_token = config.feishu_folder_token if write_folder else "",
         convert_max_bytes = config.feishu_convert_max_bytes,
-        chunk_workers = int(payload.get("chunk_workers", 2))
+        chunk_workers = int(chunk_workers)
     )
     media_service = MediaService(
         auth_client = app_auth,
@@ -141,7 +207,7 @@ def _process_group_worker(payload: dict[str, Any]) -> dict[str, Any]:
     )
 
     wiki_service = None
-    if payload.get("write_mode") in {"wiki", "both"}:
+    if write_wiki:
         wiki_service = WikiService(
             auth_client = app_auth,
             http_client = http_client,
@@ -149,113 +215,230 @@ def _process_group_worker(payload: dict[str, Any]) -> dict[str, Any]:
             user_access_token = config.feishu_user_access_token
         )
 
-    orchestrator = ImportOrchestrator(
-        source_adapter = source_adapter,
-        markdown_processor = markdown_processor,
-        config = config,
-        doc_writer = doc_writer,
-        media_service = media_service,
-        wiki_service = wiki_service,
-        notify_service = None,
-        llm_client = None
-    )
+    markdown_spool = None
+    if spool_path and os.path.getsize(spool_path) > 0:
+        with open(spool_path, "rb") as spool_file:
+            markdown_spool = mmap.mmap(spool_file.fileno(), 0, access = mmap.ACCESS_READ)
+
+    _WORKER_CTX = {
+        "config": config,
+        "write_wiki": write_wiki,
+        "doc_workers": max(1, int(doc_workers)),
+        "http_client": http_client,
+        "doc_writer": doc_writer,
+        "media_service": media_service,
+        "wiki_service": wiki_service,
+        "markdown_processor": MarkdownProcessor(),
+        "markdown_spool": markdown_spool
+    }
 
-    success = 0
-    failures: list[dict[str, str]] = []
-    created_docs: list[dict[str, str]] = []
-    folder_token_by_path = payload.get("folder_token_by_path", {})
-    wiki_parent_by_path = payload.get("wiki_parent_by_path", {})
-    write_mode = str(payload.get("write_mode", "folder"))
-    space_id = str(payload.get("space_id", ""))
 
-    for index, path in enumerate(ordered_paths, start = 1):
-        try:
+def _worker_mp_context() -> multiprocessing.context.BaseContext:
+    """Pick the start method for the grouped import pool.
+
+    Forkserver imports this module once in the server process so each
+    worker forks with the Feishu clients already loaded; spawn is the
+    fallback where forkserver is unavailable.
+
+    Args:
+        None
+    """
+
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def _process_group_doc(
+    orchestrator: "ImportOrchestrator",
+    group_key: str,
+    index: int,
+    total: int,
+    path: str,
+    target_folder_token: str,
+    parent_node_token: str,
+    write_wiki: bool,
+    space_id: str,
+    wiki_turnstile: Optional["_OrderedTurnstile"] = None
+) -> tuple[bool, dict[str, str]]:
+    """Import one document of a group inside a pool worker.
+
+    Returns (True, created doc dict) on success or (False, failure dict).
+
+    Args:
+        orchestrator: Worker-side orchestrator bound to the group's in-memory source.
+        group_key: Group key used in log lines.
+        index: 1-based position inside the group.
+        total: Group document count.
+        path: Source-relative markdown path.
+        target_folder_token: Destination folder token resolved by the parent.
+        parent_node_token: Wiki parent node token resolved by the parent.
+        write_wiki: Whether the write mode moves documents into wiki.
+        space_id: Resolved wiki space id.
+        wiki_turnstile: Optional turnstile keeping wiki moves in group order.
+    """
+
+    info_on = logger.isEnabledFor(logging.INFO)
+    try:
+        if info_on:
             logger.info(
                 "worker processing: group = %s, progress = %d/%d, path = %s",
                 group_key,
                 index,
-                len(ordered_paths),
+                total,
                 path
             )
-            doc = source_adapter.read_markdown(relative_path = path)
-            processed = markdown_processor.extract_assets_and_math(
-                md_text = doc.markdown,
-                base_path_or_url = doc.base_ref
-            )
-            doc.assets = processed.assets
-            target_folder_token = str(folder_token_by_path.get(path, ""))
-            document_id, resolved_title, doc_url = orchestrator._create_doc_with_title_strategy(
-                doc = doc,
-                folder_token = target_folder_token
-            )
-            asset_lookup = orchestrator._build_asset_lookup(assets = doc.assets)
+        doc, processed = orchestrator._load_processed_doc(path = path)
+        document_id, resolved_title, doc_url = orchestrator._create_doc_with_title_strategy(
+            doc = doc,
+            folder_token = target_folder_token
+        )
+        asset_lookup = orchestrator._build_asset_lookup(assets = doc.assets)
 
-            def _image_block_handler(image_url: str, block_id: str) -> None:
-                asset = orchestrator._find_asset_by_image_url(
-                    image_url = image_url,
-                    asset_lookup = asset_lookup
-                )
-                if not asset:
-                    return
-                file_token = media_service.upload_to_node(
-                    asset = asset,
-                    parent_node = block_id
-                )
-                doc_writer.replace_image(
-                    document_id = document_id,
-                    block_id = block_id,
-                    file_token = file_token
-                )
+        pending_images: list[tuple[str, AssetRef]] = []
 
-            doc_writer.write_markdown_with_fallback(
-                document_id = document_id,
-                content = processed.markdown,
-                image_block_handler = _image_block_handler
+        def _image_block_handler(image_url: str, block_id: str) -> None:
+            asset = orchestrator._find_asset_by_image_url(
+                image_url = image_url,
+                asset_lookup = asset_lookup
             )
+            if not asset:
+                return
+            pending_images.append((block_id, asset))
+
+        orchestrator.doc_writer.write_markdown_with_fallback(
+            document_id = document_id,
+            content = processed.markdown,
+            image_block_handler = _image_block_handler
+        )
+        orchestrator._upload_and_replace_images(
+            document_id = document_id,
+            pending_images = pending_images
+        )
 
-            wiki_node_token = ""
-            if write_mode in {"wiki", "both"} and wiki_service is not None:
-                parent_node_token = str(wiki_parent_by_path.get(path, ""))
-                wiki_node_token = wiki_service.move_doc_to_wiki(
-                    space_id = space_id,
-                    document_id = document_id,
-                    parent_node_token = parent_node_token,
-                    title = resolved_title
-                )
-
-            created_docs.append(
-                {
-                    "path": doc.path,
-                    "title": resolved_title,
-                    "document_id": document_id,
-                    "doc_url": doc_url,
-                    "wiki_node_token": wiki_node_token
-                }
+        wiki_node_token = ""
+        wiki_service = orchestrator.wiki_service
+        if write_wiki and wiki_service is not None:
+            if wiki_turnstile is not None:
+                wiki_turnstile.wait_for(index = index)
+            wiki_node_token = wiki_service.move_doc_to_wiki(
+                space_id = space_id,
+                document_id = document_id,
+                parent_node_token = parent_node_token,
+                title = resolved_title
             )
-            success += 1
+
+        if info_on:
             logger.info(
                 "worker done: group = %s, progress = %d/%d, path = %s, document_id = %s",
                 group_key,
                 index,
-                len(ordered_paths),
+                total,
                 path,
                 document_id
             )
-        except Exception as exc:
-            logger.warning(
-                "worker failed: group = %s, progress = %d/%d, path = %s, err = %s",
-                group_key,
-                index,
-                len(ordered_paths),
-                path,
-                str(exc)
-            )
-            failures.append(
-                {
-                    "path": path,
-                    "reason": str(exc)
-                }
+        return True, {
+            "path": doc.path,
+            "title": resolved_title,
+            "document_id": document_id,
+            "doc_url": doc_url,
+            "wiki_node_token": wiki_node_token
+        }
+    except Exception as exc:
+        logger.warning(
+            "worker failed: group = %s, progress = %d/%d, path = %s, err = %s",
+            group_key,
+            index,
+            total,
+            path,
+            str(exc)
+        )
+        return False, {
+            "path": path,
+            "reason": str(exc)
+        }
+
+
+def _process_group_worker(payload: dict[str, Any]) -> dict[str, Any]:
+    """Process one top-level folder group in a pool worker.
+
+    Args:
+        payload: Serializable group payload; services come from `_worker_init`.
+    """
+
+    if _WORKER_CTX is None:
+        raise RuntimeError("Grouped import worker used before _worker_init")
+
+    group_key = str(payload.get("group_key", "__unknown__"))
+    markdown_spool = _WORKER_CTX.get("markdown_spool")
+    docs_by_path: dict[str, SourceDocument] = {}
+    targets_by_path: dict[str, tuple[str, str]] = {}
+    # Rows are normalized by the parent; see ImportOrchestrator._doc_payload_row.
+    for row in payload.get("docs", []):
+        path, title, (offset, length), relative_dir, base_ref, source_type, folder_token, wiki_parent = row
+        markdown = ""
+        if length and markdown_spool is not None:
+            markdown = markdown_spool[offset:offset + length].decode("utf-8")
+        docs_by_path[path] = SourceDocument(path, title, markdown, [], relative_dir, base_ref, source_type)
+        targets_by_path[path] = (folder_token, wiki_parent)
+
+    ordered_paths = list(docs_by_path)
+    logger.info(
+        "worker group start: key = %s, docs = %d",
+        group_key,
+        len(ordered_paths)
+    )
+    source_adapter = InMemorySourceAdapter(
+        docs_by_path = docs_by_path,
+        ordered_paths = ordered_paths
+    )
+    orchestrator = ImportOrchestrator(
+        source_adapter = source_adapter,
+        markdown_processor = _WORKER_CTX["markdown_processor"],
+        config = _WORKER_CTX["config"],
+        doc_writer = _WORKER_CTX["doc_writer"],
+        media_service = _WORKER_CTX["media_service"],
+        wiki_service = _WORKER_CTX["wiki_service"],
+        notify_service = None,
+        llm_client = None
+    )
+
+    write_wiki = bool(_WORKER_CTX["write_wiki"])
+    space_id = str(payload.get("space_id", ""))
+    doc_workers = min(int(_WORKER_CTX.get("doc_workers", 1)), len(ordered_paths))
+    total = len(ordered_paths)
+    wiki_turnstile = _OrderedTurnstile() if doc_workers > 1 else None
+
+    def _run_doc(index: int, path: str) -> tuple[bool, dict[str, str]]:
+        try:
+            return _process_group_doc(
+                orchestrator = orchestrator,
+                group_key = group_key,
+                index = index,
+                total = total,
+                path = path,
+                target_folder_token = targets_by_path[path][0],
+                parent_node_token = targets_by_path[path][1],
+                write_wiki = write_wiki,
+                space_id = space_id,
+                wiki_turnstile = wiki_turnstile
             )
+        finally:
+            if wiki_turnstile is not None:
+                wiki_turnstile.complete(index = index)
+
+    if doc_workers > 1:
+        # Documents overlap their Feishu round-trips; results keep ordered_paths order.
+        with ThreadPoolExecutor(max_workers = doc_workers) as executor:
+            outcomes = list(executor.map(_run_doc, range(1, total + 1), ordered_paths))
+    else:
+        outcomes = [_run_doc(index, path) for index, path in enumerate(ordered_paths, start = 1)]
+
+    created_docs = [record for ok, record in outcomes if ok]
+    failures = [record for ok, record in outcomes if not ok]
+    success = len(created_docs)
 
     logger.info(
         "worker group finish: key = %s, success = %d, failed = %d",
@@ -270,6 +453,110 @@ def _process_group_worker(payload: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+class _OrderedTurnstile:
+    """Let item N proceed only after items 1..N-1 have completed."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._completed: set[int] = set()
+        self._next_index = 1
+
+    def wait_for(self, index: int) -> None:
+        """Block until every item before index has completed.
+
+        Args:
+            index: 1-based item index.
+        """
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._next_index >= index)
+
+    def complete(self, index: int) -> None:
+        """Mark one item as completed and wake waiting items.
+
+        Args:
+            index: 1-based item index.
+        """
+
+        with self._condition:
+            self._completed.add(index)
+            while self._next_index in self._completed:
+                self._completed.discard(self._next_index)
+                self._next_index += 1
+            self._condition.notify_all()
+
+
+class _NotifyBatcher:
+    """Coalesce progress notifications into one message per flush interval.
+
+    Args:
+        send: Callable delivering one (chat_id, message) notification.
+        flush_interval: Seconds between background flushes.
+    """
+
+    def __init__(self, send: Callable[[str, str], None], flush_interval: float = 5.0) -> None:
+        self._send = send
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue[tuple[str, str]] = queue.Queue()
+        self._flush_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target = self._run,
+            name = "notify-batcher",
+            daemon = True
+        )
+        self._thread.start()
+
+    def submit(self, chat_id: str, message: str) -> None:
+        """Queue one progress message for the next flush.
+
+        Args:
+            chat_id: Target chat id.
+            message: Message text.
+        """
+
+        self._queue.put((chat_id, message))
+
+    def flush(self) -> None:
+        """Send queued messages as one multi-line message per chat.
+
+        Args:
+            None
+        """
+
+        with self._flush_lock:
+            pending: dict[str, list[str]] = {}
+            while True:
+                try:
+                    chat_id, message = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                pending.setdefault(chat_id, []).append(message)
+            for chat_id, messages in pending.items():
+                self._send(chat_id, "\n".join(messages))
+
+    def close(self) -> None:
+        """Stop the background thread and flush what is left.
+
+        Args:
+            None
+        """
+
+        self._stopped.set()
+        self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        """Flush periodically until closed.
+
+        Args:
+            None
+        """
+
+        while not self._stopped.wait(self._flush_interval):
+            self.flush()
+
+
 class ImportOrchestrator:
     """End-to-end orchestrator for markdown to Feishu import.
 
@@ -304,9 +591,12 @@ class ImportOrchestrator:
         self.notify_service = notify_service
         self.llm_client = llm_client
 
-        self._title_max_bytes = 180
-        self._title_invalid_chars_pattern = re.compile(r"[\\/:*?\"<>|]+")
-        self._control_chars_pattern = re.compile(r"[\x00-\x1f\x7f]+")
+        self._folder_path_lock = threading.Lock()
+        self._notify_batcher: Optional[_NotifyBatcher] = None
+        self._doc_writer_has_meta = hasattr(doc_writer, "create_doc_with_meta")
+        self._default_folder_token = getattr(doc_writer, "folder_token", "")
+        self._folder_token_cache: dict[str, str] = {}
+        self._wiki_parent_cache: dict[tuple[str, str], str] = {}
 
     def run(
         self,
@@ -327,7 +617,9 @@ class ImportOrchestrator:
         llm_max_calls: int = 3,
         skip_root_readme: bool = False,
         max_workers: int = 1,
-        chunk_workers: int = 2
+        chunk_workers: int = 2,
+        doc_workers: int = 1,
+        doc_stagger_ms: int = 0
     ) -> ImportResult:
         """Run import pipeline.
 
@@ -350,18 +642,27 @@ class ImportOrchestrator:
             skip_root_readme: Whether to skip only root README.md/readme.md.
             max_workers: Process worker count for grouped import.
             chunk_workers: Thread worker count for per-document chunk planning.
+            doc_workers: Thread count for document import; 1 means sequential. With
+                max_workers > 1 it applies inside each group worker.
+            doc_stagger_ms: Delay between document submissions when doc_workers > 1.
         """
 
-        paths = self.source_adapter.list_markdown()
+        paths, prefetched_toc = self._list_markdown_with_toc_prefetch(
+            structure_order = structure_order,
+            toc_file = toc_file
+        )
         manifest = self._build_manifest(
             paths = paths,
             structure_order = structure_order,
             toc_file = toc_file,
             llm_fallback = llm_fallback,
             llm_max_calls = llm_max_calls,
-            skip_root_readme = skip_root_readme
+            skip_root_readme = skip_root_readme,
+            prefetched_toc = prefetched_toc
         )
-        result = ImportResult(total = len(manifest.items))
+        total = len(manifest.items)
+        total_paths = len(paths)
+        result = ImportResult(total = total)
         if manifest.skipped_items:
             result.skipped_items.extend(manifest.skipped_items)
         result.skipped = len(result.skipped_items)
@@ -369,7 +670,7 @@ class ImportOrchestrator:
         logger.info("=" * 80)
         logger.info("Import task started")
         logger.info("=" * 80)
-        logger.info("Discovered markdown files: %d", len(paths))
+        logger.info("Discovered markdown files: %d", total_paths)
         logger.info(
             (
                 "orchestration summary: strategy = %s, toc_links = %d, matched = %d, "
@@ -386,7 +687,7 @@ class ImportOrchestrator:
         self._log_robot_push(
             stage = "start",
             detail = (
-                f"source_files = {len(paths)}, planned_files = {len(manifest.items)}, "
+                f"source_files = {total_paths}, planned_files = {total}, "
                 f"mode = {write_mode}, strategy = {structure_order}"
             )
         )
@@ -403,7 +704,7 @@ class ImportOrchestrator:
             chat_id = chat_id,
             level = notify_level,
             message = (
-                f"知识导入任务开始：source_files = {len(paths)}, "
+                f"知识导入任务开始：source_files = {total_paths}, "
                 f"space = {space_name or space_id}, mode = {write_mode}, dry_run = {dry_run}"
             ),
             force = True
@@ -434,7 +735,7 @@ class ImportOrchestrator:
             folder_root_relative_dir = self._resolve_folder_root_subdir_name(
                 explicit_name = folder_root_subdir_name
             )
-            folder_root_token = self.doc_writer.ensure_folder_path(
+            folder_root_token = self._ensure_folder_token(
                 relative_dir = folder_root_relative_dir
             )
             self._log_robot_push(
@@ -449,262 +750,508 @@ class ImportOrchestrator:
                 folder_root_token
             )
 
-        if max_workers > 1 and not dry_run and manifest.items:
-            parallel_outcome = self._run_grouped_multiprocess_import(
-                manifest = manifest,
-                write_mode = write_mode,
-                space_id = space_id,
-                folder_subdirs = folder_subdirs,
-                folder_root_relative_dir = folder_root_relative_dir,
-                folder_root_token = folder_root_token,
-                max_workers = max_workers,
-                chunk_workers = chunk_workers,
-                chat_id = chat_id,
-                notify_level = notify_level
-            )
-            created_docs.extend(parallel_outcome["created_docs"])
-            result.success += parallel_outcome["success"]
-            result.failures.extend(parallel_outcome["failures"])
-        else:
-            for index, plan_item in enumerate(manifest.items, start = 1):
-                path = plan_item.path
-                try:
-                    doc = self.source_adapter.read_markdown(relative_path = path)
-                    processed = self.markdown_processor.extract_assets_and_math(
-                        md_text = doc.markdown,
-                        base_path_or_url = doc.base_ref
-                    )
-                    doc.assets = processed.assets
-
-                    logger.info("-" * 60)
-                    logger.info("[%d/%d] Processing: %s", index, len(manifest.items), doc.path)
-                    logger.info("assets = %d, formulas = %d", len(doc.assets), processed.formula_count)
-                    logger.info("-" * 60)
-
-                    self._notify(
-                        chat_id = chat_id,
-                        level = notify_level,
-                        message = f"正在写入：{doc.path} ({index}/{len(manifest.items)})",
-                        force = notify_level == "normal"
+        plan_lookups = self._derive_plan_lookups(
+            manifest = manifest,
+            folder_root_relative_dir = folder_root_relative_dir
+        )
+        self._notify_batcher = self._start_notify_batcher(notify_level = notify_level)
+        try:
+            if max_workers > 1 and not dry_run and manifest.items:
+                parallel_outcome = self._run_grouped_multiprocess_import(
+                    manifest = manifest,
+                    write_mode = write_mode,
+                    space_id = space_id,
+                    folder_subdirs = folder_subdirs,
+                    folder_root_relative_dir = folder_root_relative_dir,
+                    folder_root_token = folder_root_token,
+                    max_workers = max_workers,
+                    chunk_workers = chunk_workers,
+                    chat_id = chat_id,
+                    notify_level = notify_level,
+                    doc_workers = doc_workers,
+                    plan_lookups = plan_lookups
+                )
+                created_docs.extend(parallel_outcome["created_docs"])
+                result.success += parallel_outcome["success"]
+                result.failures.extend(parallel_outcome["failures"])
+            elif doc_workers > 1 and not dry_run and total > 1:
+                threaded_outcome = self._run_threaded_import(
+                    manifest = manifest,
+                    doc_workers = doc_workers,
+                    doc_stagger_ms = doc_stagger_ms,
+                    chat_id = chat_id,
+                    notify_level = notify_level,
+                    write_mode = write_mode,
+                    space_id = space_id,
+                    folder_subdirs = folder_subdirs,
+                    folder_root_relative_dir = folder_root_relative_dir,
+                    folder_root_token = folder_root_token,
+                    folder_token_by_path = self._prefetch_folder_tokens(
+                        items = manifest.items,
+                        write_mode = write_mode,
+                        folder_subdirs = folder_subdirs,
+                        folder_dir_by_path = plan_lookups.folder_dir_by_path
                     )
-                    self._log_robot_push(
-                        stage = "processing",
-                        detail = f"path = {doc.path}, progress = {index}/{len(manifest.items)}"
+                )
+                created_docs.extend(threaded_outcome["created_docs"])
+                result.success += threaded_outcome["success"]
+                result.failures.extend(threaded_outcome["failures"])
+            elif manifest.items:
+                items = manifest.items
+                load_processed_doc = self._load_processed_doc
+                process_one = self._process_one
+                append_failure = result.failures.append
+                append_created = created_docs.append
+                folder_token_by_path = None
+                if not dry_run:
+                    folder_token_by_path = self._prefetch_folder_tokens(
+                        items = items,
+                        write_mode = write_mode,
+                        folder_subdirs = folder_subdirs,
+                        folder_dir_by_path = plan_lookups.folder_dir_by_path
                     )
-
-                    if dry_run:
-                        result.success += 1
-                        continue
-
-                    target_folder_token = folder_root_token
-                    if write_mode in {"folder", "both"} and folder_subdirs:
-                        effective_relative_dir = doc.relative_dir
-                        if folder_root_relative_dir:
-                            if effective_relative_dir:
-                                effective_relative_dir = (
-                                    f"{folder_root_relative_dir}/{effective_relative_dir}"
-                                )
-                            else:
-                                effective_relative_dir = folder_root_relative_dir
-                        target_folder_token = self.doc_writer.ensure_folder_path(
-                            relative_dir = effective_relative_dir
+                # Read and parse document N+1 on a helper thread while document N
+                # is being written, so source I/O hides behind Feishu API latency.
+                with ThreadPoolExecutor(max_workers = 1) as prefetch_pool:
+                    submit_load = prefetch_pool.submit
+                    next_load = submit_load(load_processed_doc, path = items[0].path)
+                    for index, plan_item in enumerate(items, start = 1):
+                        current_load = next_load
+                        if index < total:
+                            next_load = submit_load(load_processed_doc, path = items[index].path)
+                        outcome = process_one(
+                            plan_item = plan_item,
+                            index = index,
+                            total = total,
+                            chat_id = chat_id,
+                            notify_level = notify_level,
+                            dry_run = dry_run,
+                            write_mode = write_mode,
+                            space_id = space_id,
+                            folder_subdirs = folder_subdirs,
+                            folder_root_relative_dir = folder_root_relative_dir,
+                            folder_root_token = folder_root_token,
+                            prefetched = current_load,
+                            folder_token_by_path = folder_token_by_path
                         )
+                        if isinstance(outcome, ImportFailure):
+                            append_failure(outcome)
+                            continue
+                        result.success += 1
+                        if outcome is not None:
+                            append_created(outcome)
+        finally:
+            self._stop_notify_batcher()
+
+        # Place records by manifest position instead of sorting; records whose
+        # path is not in the manifest keep their arrival order at the end.
+        order_map = plan_lookups.order_map
+        slots: list[Optional[CreatedDocRecord]] = [None] * total
+        unplaced: list[CreatedDocRecord] = []
+        for record in created_docs:
+            position = order_map.get(record.path)
+            if position is None or slots[position] is not None:
+                unplaced.append(record)
+            else:
+                slots[position] = record
+        created_docs = [record for record in slots if record is not None]
+        created_docs.extend(unplaced)
+        result.created_docs = list(created_docs)
+        result.failed = len(result.failures)
+        result.skipped = len(result.skipped_items)
+        created_docs_by_path = {record.path: record for record in created_docs}
 
-                    document_id, resolved_title, doc_url = self._create_doc_with_title_strategy(
-                        doc = doc,
-                        folder_token = target_folder_token
-                    )
-                    logger.info(
-                        "created document_id = %s, title = %s, folder_token = %s, url = %s",
-                        document_id,
-                        resolved_title,
-                        target_folder_token or getattr(self.doc_writer, "folder_token", ""),
-                        doc_url
-                    )
-                    self._log_robot_push(
-                        stage = "doc_created",
-                        detail = (
-                            f"path = {doc.path}, title = {resolved_title}, document_id = {document_id}, "
-                            f"folder_token = {target_folder_token or getattr(self.doc_writer, 'folder_token', '')}"
-                        )
+        if (
+            not dry_run
+            and folder_nav_doc
+            and write_mode in {"folder", "both"}
+            and created_docs
+        ):
+            if folder_subdirs:
+                nav_created = self._write_folder_navigation_doc_with_llm(
+                    folder_nav_title = folder_nav_title,
+                    manifest = manifest,
+                    record_by_path = created_docs_by_path,
+                    folder_token = folder_root_token,
+                    source_paths = paths,
+                    toc_file = toc_file
+                )
+                if not nav_created:
+                    logger.warning(
+                        "Skip folder navigation doc: LLM generation unavailable or invalid output"
                     )
-                    asset_lookup = self._build_asset_lookup(assets = doc.assets)
+            else:
+                self._write_folder_navigation_doc(
+                    folder_nav_title = folder_nav_title,
+                    manifest = manifest,
+                    record_by_path = created_docs_by_path,
+                    folder_token = folder_root_token
+                )
 
-                    def _image_block_handler(image_url: str, block_id: str) -> None:
-                        asset = self._find_asset_by_image_url(
-                            image_url = image_url,
-                            asset_lookup = asset_lookup
-                        )
-                        if not asset:
-                            logger.warning(
-                                "No local asset mapping for image url = %s in document = %s",
-                                image_url,
-                                doc.path
-                            )
-                            return
+        logger.info("*" * 50)
+        logger.info(
+            "Import finished: total = %d, success = %d, failed = %d, skipped = %d",
+            result.total,
+            result.success,
+            result.failed,
+            result.skipped
+        )
+        logger.info("*" * 50)
+        self._log_robot_push(
+            stage = "finished",
+            detail = (
+                f"total = {result.total}, success = {result.success}, failed = {result.failed}, "
+                f"skipped = {result.skipped}, llm_calls = {manifest.llm_calls}, "
+                f"unresolved = {len(manifest.unresolved_links)}"
+            )
+        )
 
-                        file_token = self.media_service.upload_to_node(
-                            asset = asset,
-                            parent_node = block_id
-                        )
-                        self.doc_writer.replace_image(
-                            document_id = document_id,
-                            block_id = block_id,
-                            file_token = file_token
-                        )
+        summary = io.StringIO()
+        summary.write(
+            "知识导入任务完成\n"
+            f"total = {result.total}\n"
+            f"success = {result.success}\n"
+            f"failed = {result.failed}\n"
+            f"skipped = {result.skipped}\n"
+            "编排统计："
+            f"toc_links = {manifest.toc_links}, "
+            f"matched = {manifest.matched_links}, "
+            f"ambiguous = {manifest.ambiguous_links}, "
+            f"llm_calls = {manifest.llm_calls}, "
+            f"fallback = {manifest.fallback_count}"
+        )
+        if manifest.unresolved_links:
+            summary.write("\nTOC 歧义/未匹配：")
+            for unresolved in manifest.unresolved_links[:20]:
+                summary.write(f"\n- {unresolved}")
+        if result.failures:
+            summary.write("\n失败清单：")
+            for failure in result.failures[:20]:
+                summary.write(f"\n- {failure.path}: {failure.reason[:120]}")
+        if result.skipped_items:
+            summary.write("\n跳过清单：")
+            for skipped in result.skipped_items[:20]:
+                summary.write(f"\n- {skipped.path}: {skipped.reason[:120]}")
 
-                    self.doc_writer.write_markdown_with_fallback(
-                        document_id = document_id,
-                        content = processed.markdown,
-                        image_block_handler = _image_block_handler
-                    )
+        self._notify(
+            chat_id = chat_id,
+            level = notify_level,
+            message = summary.getvalue(),
+            force = True
+        )
 
-                    wiki_node_token = ""
-                    if write_mode in {"wiki", "both"}:
-                        parent_node_token = self.wiki_service.ensure_path_nodes(
-                            space_id = space_id,
-                            relative_dir = doc.relative_dir
-                        )
-                        wiki_node_token = self.wiki_service.move_doc_to_wiki(
-                            space_id = space_id,
-                            document_id = document_id,
-                            parent_node_token = parent_node_token,
-                            title = resolved_title
-                        )
-                        self._log_robot_push(
-                            stage = "wiki_moved",
-                            detail = (
-                                f"path = {doc.path}, document_id = {document_id}, "
-                                f"wiki_node_token = {wiki_node_token}"
+        return result
+
+    def _process_one(
+        self,
+        plan_item: DocumentPlanItem,
+        index: int,
+        total: int,
+        chat_id: str,
+        notify_level: str,
+        dry_run: bool,
+        write_mode: str,
+        space_id: str,
+        folder_subdirs: bool,
+        folder_root_relative_dir: str,
+        folder_root_token: str,
+        wiki_turnstile: Optional[_OrderedTurnstile] = None,
+        prefetched: Optional[Future] = None,
+        folder_token_by_path: Optional[dict[str, str]] = None
+    ) -> Optional[CreatedDocRecord | ImportFailure]:
+        """Import one planned document.
+
+        Returns the created record, an ImportFailure, or None for a dry-run success.
+
+        Args:
+            plan_item: Planned import item.
+            index: 1-based position in the manifest.
+            total: Manifest item count.
+            chat_id: Notification chat id.
+            notify_level: Notification verbosity.
+            dry_run: Whether to skip Feishu write operations.
+            write_mode: Write mode, one of folder/wiki/both.
+            space_id: Resolved wiki space id.
+            folder_subdirs: Whether folder hierarchy mode is enabled.
+            folder_root_relative_dir: Optional task root folder name.
+            folder_root_token: Optional task root folder token.
+            wiki_turnstile: Optional turnstile keeping wiki moves in manifest order.
+            prefetched: Optional future already loading this item via _load_processed_doc.
+            folder_token_by_path: Optional destination folders resolved before the loop.
+        """
+
+        path = plan_item.path
+        try:
+            if prefetched is not None:
+                doc, processed = prefetched.result()
+            else:
+                doc, processed = self._load_processed_doc(path = path)
+
+            info_on = logger.isEnabledFor(logging.INFO)
+            if info_on:
+                logger.info("-" * 60)
+                logger.info("[%d/%d] Processing: %s", index, total, doc.path)
+                logger.info("assets = %d, formulas = %d", len(doc.assets), processed.formula_count)
+                logger.info("-" * 60)
+
+            self._notify(
+                chat_id = chat_id,
+                level = notify_level,
+                message = f"正在写入：{doc.path} ({index}/{total})",
+                force = notify_level == "normal",
+                progress = True
+            )
+            if info_on:
+                self._log_robot_push(
+                    stage = "processing",
+                    detail = f"path = {doc.path}, progress = {index}/{total}"
+                )
+
+            if dry_run:
+                return None
+
+            target_folder_token = folder_root_token
+            if write_mode in {"folder", "both"} and folder_subdirs:
+                if folder_token_by_path and path in folder_token_by_path:
+                    target_folder_token = folder_token_by_path[path]
+                else:
+                    with self._folder_path_lock:
+                        target_folder_token = self._ensure_folder_token(
+                            relative_dir = self._effective_folder_dir(
+                                relative_dir = doc.relative_dir,
+                                folder_root_relative_dir = folder_root_relative_dir
                             )
                         )
 
-                    created_docs.append(
-                        CreatedDocRecord(
-                            path = doc.path,
-                            title = resolved_title,
-                            document_id = document_id,
-                            doc_url = doc_url,
-                            wiki_node_token = wiki_node_token
-                        )
+            document_id, resolved_title, doc_url = self._create_doc_with_title_strategy(
+                doc = doc,
+                folder_token = target_folder_token
+            )
+            if info_on:
+                logger.info(
+                    "created document_id = %s, title = %s, folder_token = %s, url = %s",
+                    document_id,
+                    resolved_title,
+                    target_folder_token or self._default_folder_token,
+                    doc_url
+                )
+                self._log_robot_push(
+                    stage = "doc_created",
+                    detail = (
+                        f"path = {doc.path}, title = {resolved_title}, document_id = {document_id}, "
+                        f"folder_token = {target_folder_token or self._default_folder_token}"
                     )
+                )
+            asset_lookup = self._build_asset_lookup(assets = doc.assets)
 
-                    result.success += 1
-                    self._notify(
-                        chat_id = chat_id,
-                        level = notify_level,
-                        message = f"写入完成：{doc.path}",
-                        force = notify_level == "normal"
+            pending_images: list[tuple[str, AssetRef]] = []
+
+            def _image_block_handler(image_url: str, block_id: str) -> None:
+                asset = self._find_asset_by_image_url(
+                    image_url = image_url,
+                    asset_lookup = asset_lookup
+                )
+                if not asset:
+                    logger.warning(
+                        "No local asset mapping for image url = %s in document = %s",
+                        image_url,
+                        doc.path
                     )
-                except Exception as exc:
-                    logger.exception("Failed to process %s", path)
+                    return
+                pending_images.append((block_id, asset))
+
+            self.doc_writer.write_markdown_with_fallback(
+                document_id = document_id,
+                content = processed.markdown,
+                image_block_handler = _image_block_handler
+            )
+            self._upload_and_replace_images(
+                document_id = document_id,
+                pending_images = pending_images
+            )
+
+            wiki_node_token = ""
+            if write_mode in {"wiki", "both"}:
+                if wiki_turnstile is not None:
+                    wiki_turnstile.wait_for(index = index)
+                parent_node_token = self._ensure_wiki_parent(
+                    space_id = space_id,
+                    relative_dir = doc.relative_dir
+                )
+                wiki_node_token = self.wiki_service.move_doc_to_wiki(
+                    space_id = space_id,
+                    document_id = document_id,
+                    parent_node_token = parent_node_token,
+                    title = resolved_title
+                )
+                if info_on:
                     self._log_robot_push(
-                        stage = "failed",
-                        detail = f"path = {path}, error = {str(exc)[:240]}"
-                    )
-                    result.failures.append(
-                        ImportFailure(
-                            path = path,
-                            reason = str(exc)
+                        stage = "wiki_moved",
+                        detail = (
+                            f"path = {doc.path}, document_id = {document_id}, "
+                            f"wiki_node_token = {wiki_node_token}"
                         )
                     )
-                    self._notify(
-                        chat_id = chat_id,
-                        level = notify_level,
-                        message = f"写入失败：{path}，原因：{str(exc)[:300]}",
-                        force = True
-                    )
 
-        order_map = {item.path: index for index, item in enumerate(manifest.items)}
-        created_docs = sorted(
-            created_docs,
-            key = lambda item: order_map.get(item.path, 10 ** 9)
-        )
-        result.created_docs = list(created_docs)
-        result.failed = len(result.failures)
-        result.skipped = len(result.skipped_items)
+            self._notify(
+                chat_id = chat_id,
+                level = notify_level,
+                message = f"写入完成：{doc.path}",
+                force = notify_level == "normal",
+                progress = True
+            )
+            return CreatedDocRecord(
+                path = doc.path,
+                title = resolved_title,
+                document_id = document_id,
+                doc_url = doc_url,
+                wiki_node_token = wiki_node_token
+            )
+        except Exception as exc:
+            logger.exception("Failed to process %s", path)
+            self._log_robot_push(
+                stage = "failed",
+                detail = f"path = {path}, error = {str(exc)[:240]}"
+            )
+            self._notify(
+                chat_id = chat_id,
+                level = notify_level,
+                message = f"写入失败：{path}，原因：{str(exc)[:300]}",
+                force = True
+            )
+            return ImportFailure(
+                path = path,
+                reason = str(exc)
+            )
+
+    def _load_processed_doc(self, path: str) -> tuple[SourceDocument, ProcessedMarkdown]:
+        """Read one source document and extract its assets and formulas.
+
+        Args:
+            path: Source-relative markdown path.
+        """
+
+        doc = self.source_adapter.read_markdown(relative_path = path)
+        processed = self.markdown_processor.extract_assets_and_math(
+            md_text = doc.markdown,
+            base_path_or_url = doc.base_ref
+        )
+        doc.assets = processed.assets
+        return doc, processed
+
+    def _run_threaded_import(
+        self,
+        manifest: ImportManifest,
+        doc_workers: int,
+        doc_stagger_ms: int,
+        chat_id: str,
+        notify_level: str,
+        write_mode: str,
+        space_id: str,
+        folder_subdirs: bool,
+        folder_root_relative_dir: str,
+        folder_root_token: str,
+        folder_token_by_path: Optional[dict[str, str]] = None
+    ) -> dict[str, Any]:
+        """Import manifest items on a bounded thread pool.
+
+        Create/write calls overlap across documents, while wiki moves still
+        happen in manifest order so sibling node order stays stable.
+
+        Args:
+            manifest: Ordered import manifest.
+            doc_workers: Thread count.
+            doc_stagger_ms: Delay between task submissions in milliseconds.
+            chat_id: Notification chat id.
+            notify_level: Notification verbosity.
+            write_mode: Write mode, one of folder/wiki/both.
+            space_id: Resolved wiki space id.
+            folder_subdirs: Whether folder hierarchy mode is enabled.
+            folder_root_relative_dir: Optional task root folder name.
+            folder_root_token: Optional task root folder token.
+            folder_token_by_path: Optional destination folders resolved before dispatch.
+        """
+
+        total = len(manifest.items)
+        wiki_turnstile = _OrderedTurnstile()
+        outcomes: list[Optional[CreatedDocRecord | ImportFailure]] = [None] * total
+
+        def _run_item(index: int, plan_item: DocumentPlanItem) -> Optional[CreatedDocRecord | ImportFailure]:
+            try:
+                return self._process_one(
+                    plan_item = plan_item,
+                    index = index,
+                    total = total,
+                    chat_id = chat_id,
+                    notify_level = notify_level,
+                    dry_run = False,
+                    write_mode = write_mode,
+                    space_id = space_id,
+                    folder_subdirs = folder_subdirs,
+                    folder_root_relative_dir = folder_root_relative_dir,
+                    folder_root_token = folder_root_token,
+                    wiki_turnstile = wiki_turnstile,
+                    folder_token_by_path = folder_token_by_path
+                )
+            finally:
+                wiki_turnstile.complete(index = index)
+
+        with ThreadPoolExecutor(max_workers = doc_workers) as executor:
+            future_to_position = {}
+            for index, plan_item in enumerate(manifest.items, start = 1):
+                if doc_stagger_ms > 0 and index > 1:
+                    time.sleep(doc_stagger_ms / 1000.0)
+                future = executor.submit(_run_item, index, plan_item)
+                future_to_position[future] = index - 1
+            for future in as_completed(future_to_position):
+                outcomes[future_to_position[future]] = future.result()
+
+        created_docs: list[CreatedDocRecord] = []
+        failures: list[ImportFailure] = []
+        success = 0
+        for outcome in outcomes:
+            if isinstance(outcome, ImportFailure):
+                failures.append(outcome)
+                continue
+            success += 1
+            if outcome is not None:
+                created_docs.append(outcome)
+        return {
+            "created_docs": created_docs,
+            "success": success,
+            "failures": failures
+        }
+
+    def _list_markdown_with_toc_prefetch(
+        self,
+        structure_order: str,
+        toc_file: str
+    ) -> tuple[list[str], Optional[SourceDocument]]:
+        """List source markdown while reading the TOC file in the background.
+
+        Args:
+            structure_order: Ordering strategy; only toc_first needs the TOC.
+            toc_file: TOC file path relative to source root.
+        """
 
         if (
-            not dry_run
-            and folder_nav_doc
-            and write_mode in {"folder", "both"}
-            and created_docs
+            structure_order != "toc_first"
+            or not getattr(self.source_adapter, "supports_concurrent_read", False)
         ):
-            if folder_subdirs:
-                nav_created = self._write_folder_navigation_doc_with_llm(
-                    folder_nav_title = folder_nav_title,
-                    manifest = manifest,
-                    created_docs = created_docs,
-                    folder_token = folder_root_token,
-                    source_paths = paths,
-                    toc_file = toc_file
-                )
-                if not nav_created:
-                    logger.warning(
-                        "Skip folder navigation doc: LLM generation unavailable or invalid output"
-                    )
-            else:
-                self._write_folder_navigation_doc(
-                    folder_nav_title = folder_nav_title,
-                    manifest = manifest,
-                    created_docs = created_docs,
-                    folder_token = folder_root_token
-                )
-
-        logger.info("*" * 50)
-        logger.info(
-            "Import finished: total = %d, success = %d, failed = %d, skipped = %d",
-            result.total,
-            result.success,
-            result.failed,
-            result.skipped
-        )
-        logger.info("*" * 50)
-        self._log_robot_push(
-            stage = "finished",
-            detail = (
-                f"total = {result.total}, success = {result.success}, failed = {result.failed}, "
-                f"skipped = {result.skipped}, llm_calls = {manifest.llm_calls}, "
-                f"unresolved = {len(manifest.unresolved_links)}"
-            )
-        )
+            return self.source_adapter.list_markdown(), None
 
-        summary_lines = [
-            "知识导入任务完成",
-            f"total = {result.total}",
-            f"success = {result.success}",
-            f"failed = {result.failed}",
-            f"skipped = {result.skipped}",
-            (
-                "编排统计："
-                f"toc_links = {manifest.toc_links}, "
-                f"matched = {manifest.matched_links}, "
-                f"ambiguous = {manifest.ambiguous_links}, "
-                f"llm_calls = {manifest.llm_calls}, "
-                f"fallback = {manifest.fallback_count}"
+        with ThreadPoolExecutor(max_workers = 1) as prefetch_pool:
+            toc_future = prefetch_pool.submit(
+                self.source_adapter.read_markdown,
+                relative_path = toc_file
             )
-        ]
-        if manifest.unresolved_links:
-            summary_lines.append("TOC 歧义/未匹配：")
-            for unresolved in manifest.unresolved_links[:20]:
-                summary_lines.append(f"- {unresolved}")
-        if result.failures:
-            summary_lines.append("失败清单：")
-            for failure in result.failures[:20]:
-                summary_lines.append(f"- {failure.path}: {failure.reason[:120]}")
-        if result.skipped_items:
-            summary_lines.append("跳过清单：")
-            for skipped in result.skipped_items[:20]:
-                summary_lines.append(f"- {skipped.path}: {skipped.reason[:120]}")
-
-        self._notify(
-            chat_id = chat_id,
-            level = notify_level,
-            message = "\n".join(summary_lines),
-            force = True
-        )
-
-        return result
+            paths = self.source_adapter.list_markdown()
+            try:
+                toc_doc = toc_future.result()
+            except Exception as exc:
+                logger.debug("toc prefetch skipped: toc_file = %s, err = %s", toc_file, str(exc))
+                toc_doc = None
+        return paths, toc_doc
 
     def _build_manifest(
         self,
@@ -713,7 +1260,8 @@ class ImportOrchestrator:
         toc_file: str,
         llm_fallback: str,
         llm_max_calls: int,
-        skip_root_readme: bool
+        skip_root_readme: bool,
+        prefetched_toc: Optional[SourceDocument] = None
     ) -> ImportManifest:
         """Build import manifest with optional TOC-aware ordering.
 
@@ -724,13 +1272,20 @@ class ImportOrchestrator:
             llm_fallback: LLM fallback strategy.
             llm_max_calls: LLM call cap.
             skip_root_readme: Whether to skip root README markdown file.
+            prefetched_toc: TOC document read during listing, if any.
         """
 
         planner = OrchestrationPlanner(
             source_adapter = self.source_adapter,
             llm_resolver = self.llm_client if llm_fallback == "toc_ambiguity" else None,
-            skip_root_readme = skip_root_readme
+            skip_root_readme = skip_root_readme,
+            llm_cache_path = self.config.llm_cache_path
         )
+        if prefetched_toc is not None:
+            planner.seed_toc_cache(
+                toc_path = prefetched_toc.path,
+                content = prefetched_toc.markdown
+            )
         manifest = planner.build_manifest(
             markdown_paths = paths,
             structure_order = structure_order,
@@ -751,7 +1306,9 @@ class ImportOrchestrator:
         max_workers: int,
         chunk_workers: int,
         chat_id: str,
-        notify_level: str
+        notify_level: str,
+        doc_workers: int = 1,
+        plan_lookups: Optional[_PlanLookups] = None
     ) -> dict[str, Any]:
         """Run grouped multiprocessing import by top-level folder key.
 
@@ -766,19 +1323,22 @@ class ImportOrchestrator:
             chunk_workers: Per-document chunk planning thread count.
             chat_id: Notification target chat id.
             notify_level: Notification verbosity.
+            doc_workers: Documents imported concurrently inside each group.
+            plan_lookups: Optional lookups already derived from the manifest by run().
         """
 
+        planned_docs = len(manifest.items)
         logger.info(
             "grouped import start: workers = %d, chunk_workers = %d, planned_docs = %d",
             max_workers,
             chunk_workers,
-            len(manifest.items)
+            planned_docs
         )
         self._log_robot_push(
             stage = "grouped_start",
             detail = (
                 f"workers = {max_workers}, chunk_workers = {chunk_workers}, "
-                f"planned_docs = {len(manifest.items)}"
+                f"planned_docs = {planned_docs}"
             )
         )
         self._notify(
@@ -786,7 +1346,7 @@ class ImportOrchestrator:
             level = notify_level,
             message = (
                 f"并发导入启动：workers = {max_workers}，chunk_workers = {chunk_workers}，"
-                f"planned_docs = {len(manifest.items)}"
+                f"planned_docs = {planned_docs}"
             ),
             force = notify_level == "normal"
         )
@@ -815,7 +1375,8 @@ class ImportOrchestrator:
             write_mode = write_mode,
             folder_subdirs = folder_subdirs,
             folder_root_relative_dir = folder_root_relative_dir,
-            folder_root_token = folder_root_token
+            folder_root_token = folder_root_token,
+            folder_dir_by_path = plan_lookups.folder_dir_by_path if plan_lookups else None
         )
         wiki_parent_by_path = self._build_wiki_parent_by_path(
             items = usable_items,
@@ -825,9 +1386,12 @@ class ImportOrchestrator:
         )
 
         grouped = self._group_items_by_top_dir(items = usable_items)
+        spool_path, markdown_span_by_path = self._write_markdown_spool(
+            paths = [item.path for item in usable_items],
+            snapshots = snapshots
+        )
         payloads = []
         group_doc_counts: dict[str, int] = {}
-        config_payload = dataclasses.asdict(self.config)
         for group_key, group_items in grouped:
             ordered_paths = [item.path for item in group_items]
             group_doc_counts[group_key] = len(ordered_paths)
@@ -838,34 +1402,19 @@ class ImportOrchestrator:
             )
             docs_payload = []
             for path in ordered_paths:
-                doc = snapshots[path]
-                docs_payload.append(
-                    {
-                        "path": doc.path,
-                        "title": doc.title,
-                        "markdown": doc.markdown,
-                        "relative_dir": doc.relative_dir,
-                        "base_ref": doc.base_ref,
-                        "source_type": doc.source_type
-                    }
+                row = self._doc_payload_row(
+                    doc = snapshots[path],
+                    markdown_span = markdown_span_by_path[path],
+                    folder_token = folder_token_by_path.get(path, ""),
+                    wiki_parent = wiki_parent_by_path.get(path, "")
                 )
+                if row is not None:
+                    docs_payload.append(row)
             payloads.append(
                 {
                     "group_key": group_key,
-                    "config": config_payload,
-                    "docs": docs_payload,
-                    "ordered_paths": ordered_paths,
-                    "write_mode": write_mode,
                     "space_id": space_id,
-                    "folder_token_by_path": {
-                        path: folder_token_by_path.get(path, "")
-                        for path in ordered_paths
-                    },
-                    "wiki_parent_by_path": {
-                        path: wiki_parent_by_path.get(path, "")
-                        for path in ordered_paths
-                    },
-                    "chunk_workers": max(1, int(chunk_workers))
+                    "docs": docs_payload
                 }
             )
 
@@ -891,7 +1440,20 @@ class ImportOrchestrator:
 
         executor = ProcessPoolExecutor(
             max_workers = max_workers,
-            mp_context = multiprocessing.get_context("spawn")
+            mp_context = _worker_mp_context(),
+            initializer = _worker_init,
+            initargs = (
+                # Each worker paces its own client, so split the run-wide budget.
+                {
+                    **dataclasses.asdict(self.config),
+                    "api_rate_limit": self.config.api_rate_limit / max_workers
+                },
+                write_mode,
+                max(1, int(chunk_workers)),
+                max(1, int(doc_workers)),
+                spool_path,
+                self._export_auth_seed()
+            )
         )
         try:
             for payload in payloads:
@@ -900,12 +1462,12 @@ class ImportOrchestrator:
                 logger.info(
                     "group submitted: key = %s, docs = %d",
                     payload["group_key"],
-                    len(payload.get("ordered_paths", []))
+                    len(payload["docs"])
                 )
                 self._log_robot_push(
                     stage = "group_submitted",
                     detail = (
-                        f"group = {payload['group_key']}, docs = {len(payload.get('ordered_paths', []))}"
+                        f"group = {payload['group_key']}, docs = {len(payload['docs'])}"
                     )
                 )
                 self._notify(
@@ -913,9 +1475,10 @@ class ImportOrchestrator:
                     level = notify_level,
                     message = (
                         f"分组已提交：{payload['group_key']}，"
-                        f"docs = {len(payload.get('ordered_paths', []))}"
+                        f"docs = {len(payload['docs'])}"
                     ),
-                    force = notify_level == "normal"
+                    force = notify_level == "normal",
+                    progress = True
                 )
 
             for future in as_completed(future_group_map):
@@ -994,7 +1557,8 @@ class ImportOrchestrator:
                         f"分组完成：{group_key}，success = {group_success}，failed = {len(group_failures)}，"
                         f"进度：groups {finished_groups}/{total_groups}，docs {finished_docs}/{total_docs}"
                     ),
-                    force = notify_level == "normal"
+                    force = notify_level == "normal",
+                    progress = True
                 )
 
                 for raw_failure in worker_result.get("failures", []):
@@ -1042,7 +1606,8 @@ class ImportOrchestrator:
                         chat_id = chat_id,
                         level = notify_level,
                         message = f"写入完成：{created_path}",
-                        force = notify_level == "normal"
+                        force = notify_level == "normal",
+                        progress = True
                     )
                     created_docs.append(
                         CreatedDocRecord(
@@ -1061,6 +1626,10 @@ class ImportOrchestrator:
                 executor.shutdown(wait = False, cancel_futures = True)
             except Exception:
                 pass
+            try:
+                os.unlink(spool_path)
+            except OSError:
+                pass
 
         logger.info(
             "grouped import finished: success = %d, failed = %d",
@@ -1078,6 +1647,85 @@ class ImportOrchestrator:
             "created_docs": created_docs
         }
 
+    @staticmethod
+    def _doc_payload_row(
+        doc: SourceDocument,
+        markdown_span: tuple[int, int],
+        folder_token: str,
+        wiki_parent: str
+    ) -> Optional[tuple[str, str, tuple[int, int], str, str, str, str, str]]:
+        """Flatten one snapshot into the fixed-schema row sent to pool workers.
+
+        Field cleanup happens here once, so workers build SourceDocument
+        positionally. Rows are (path, title, markdown_span, relative_dir,
+        base_ref, source_type, folder_token, wiki_parent) in dispatch order;
+        documents without a path yield None.
+
+        Args:
+            doc: Snapshot document.
+            markdown_span: (offset, length) of the markdown in the spool file.
+            folder_token: Destination folder token for the document.
+            wiki_parent: Wiki parent node token for the document.
+        """
+
+        path = doc.path.strip()
+        if not path:
+            return None
+        return (
+            path,
+            doc.title.strip() or path.rpartition("/")[2],
+            markdown_span,
+            doc.relative_dir.strip(),
+            doc.base_ref.strip(),
+            doc.source_type.strip() or "local",
+            folder_token,
+            wiki_parent
+        )
+
+    def _export_auth_seed(self) -> tuple[str, float]:
+        """Return the writer's tenant token and expiry for seeding pool workers.
+
+        Args:
+            None
+        """
+
+        export_token = getattr(getattr(self.doc_writer, "auth_client", None), "export_token", None)
+        if not callable(export_token):
+            return "", 0.0
+        try:
+            return export_token()
+        except Exception as exc:
+            logger.warning("tenant token export failed, workers will authenticate: %s", str(exc))
+            return "", 0.0
+
+    def _write_markdown_spool(
+        self,
+        paths: list[str],
+        snapshots: dict[str, SourceDocument]
+    ) -> tuple[str, dict[str, tuple[int, int]]]:
+        """Write snapshot markdown into one spool file for workers to mmap.
+
+        Group payloads then carry (offset, length) spans instead of pickled text.
+
+        Args:
+            paths: Paths to spool, in dispatch order.
+            snapshots: Path-to-document snapshot map.
+        """
+
+        span_by_path: dict[str, tuple[int, int]] = {}
+        offset = 0
+        with tempfile.NamedTemporaryFile(
+            prefix = "feishu_import_",
+            suffix = ".spool",
+            delete = False
+        ) as spool_file:
+            for path in paths:
+                data = snapshots[path].markdown.encode("utf-8")
+                spool_file.write(data)
+                span_by_path[path] = (offset, len(data))
+                offset += len(data)
+        return spool_file.name, span_by_path
+
     def _build_doc_snapshots(
         self,
         manifest: ImportManifest
@@ -1090,27 +1738,159 @@ class ImportOrchestrator:
 
         snapshots: dict[str, SourceDocument] = {}
         failures: list[ImportFailure] = []
-        for item in manifest.items:
-            try:
-                doc = self.source_adapter.read_markdown(relative_path = item.path)
-                snapshots[item.path] = SourceDocument(
-                    path = doc.path,
-                    title = doc.title,
-                    markdown = doc.markdown,
-                    assets = [],
-                    relative_dir = doc.relative_dir,
-                    base_ref = doc.base_ref,
-                    source_type = doc.source_type
-                )
-            except Exception as exc:
+        paths = [item.path for item in manifest.items]
+        read_many = getattr(self.source_adapter, "read_many", None)
+        if callable(read_many):
+            loaded = read_many(relative_paths = paths)
+        else:
+            loaded = []
+            for path in paths:
+                try:
+                    loaded.append(self.source_adapter.read_markdown(relative_path = path))
+                except Exception as exc:
+                    loaded.append(exc)
+
+        for path, doc in zip(paths, loaded):
+            if isinstance(doc, Exception):
                 failures.append(
                     ImportFailure(
-                        path = item.path,
-                        reason = str(exc)
+                        path = path,
+                        reason = str(doc)
                     )
                 )
+                continue
+            snapshots[path] = SourceDocument(
+                path = doc.path,
+                title = doc.title,
+                markdown = doc.markdown,
+                assets = [],
+                relative_dir = doc.relative_dir,
+                base_ref = doc.base_ref,
+                source_type = doc.source_type
+            )
         return snapshots, failures
 
+    def _derive_plan_lookups(
+        self,
+        manifest: ImportManifest,
+        folder_root_relative_dir: str
+    ) -> _PlanLookups:
+        """Derive every per-path lookup the import branches need in one manifest pass.
+
+        Args:
+            manifest: Ordered import manifest.
+            folder_root_relative_dir: Optional task root folder name.
+        """
+
+        order_map: dict[str, int] = {}
+        folder_dir_by_path: dict[str, str] = {}
+        folder_dir_by_relative_dir: dict[str, str] = {}
+        for index, item in enumerate(manifest.items):
+            path = item.path
+            order_map[path] = index
+            relative_dir = item.relative_dir
+            folder_dir = folder_dir_by_relative_dir.get(relative_dir)
+            if folder_dir is None:
+                folder_dir = self._effective_folder_dir(
+                    relative_dir = relative_dir,
+                    folder_root_relative_dir = folder_root_relative_dir
+                )
+                folder_dir_by_relative_dir[relative_dir] = folder_dir
+            folder_dir_by_path[path] = folder_dir
+        return _PlanLookups(
+            order_map = order_map,
+            folder_dir_by_path = folder_dir_by_path
+        )
+
+    def _ensure_folder_token(self, relative_dir: str) -> str:
+        """Return the folder token for one relative dir, created at most once.
+
+        Args:
+            relative_dir: Root-prefixed relative directory.
+        """
+
+        token = self._folder_token_cache.get(relative_dir)
+        if token is None:
+            token = self.doc_writer.ensure_folder_path(relative_dir = relative_dir)
+            self._folder_token_cache[relative_dir] = token
+        return token
+
+    def _ensure_wiki_parent(self, space_id: str, relative_dir: str) -> str:
+        """Return the wiki parent node token for one relative dir, memoized per space.
+
+        Args:
+            space_id: Wiki space id.
+            relative_dir: Source relative directory.
+        """
+
+        cache_key = (space_id, relative_dir)
+        token = self._wiki_parent_cache.get(cache_key)
+        if token is None:
+            token = self.wiki_service.ensure_path_nodes(
+                space_id = space_id,
+                relative_dir = relative_dir
+            )
+            self._wiki_parent_cache[cache_key] = token
+        return token
+
+    @staticmethod
+    def _effective_folder_dir(relative_dir: str, folder_root_relative_dir: str) -> str:
+        """Prefix a source relative dir with the optional task root folder.
+
+        Args:
+            relative_dir: Source relative directory.
+            folder_root_relative_dir: Optional task root folder name.
+        """
+
+        if not folder_root_relative_dir:
+            return relative_dir
+        if relative_dir:
+            return f"{folder_root_relative_dir}/{relative_dir}"
+        return folder_root_relative_dir
+
+    def _prefetch_folder_tokens(
+        self,
+        items: list,
+        write_mode: str,
+        folder_subdirs: bool,
+        folder_dir_by_path: dict[str, str]
+    ) -> dict[str, str]:
+        """Resolve destination folders once per directory before importing.
+
+        Directories that fail to resolve are left out, so each affected
+        document retries and reports the failure itself.
+
+        Args:
+            items: Manifest items.
+            write_mode: Write mode.
+            folder_subdirs: Whether to build hierarchy by source dirs.
+            folder_dir_by_path: Root-prefixed folder dirs from _derive_plan_lookups.
+        """
+
+        result: dict[str, str] = {}
+        if write_mode not in {"folder", "both"} or not folder_subdirs:
+            return result
+
+        token_by_dir: dict[str, Optional[str]] = {}
+        for item in items:
+            effective_relative_dir = folder_dir_by_path[item.path]
+            if effective_relative_dir not in token_by_dir:
+                try:
+                    token_by_dir[effective_relative_dir] = self._ensure_folder_token(
+                        relative_dir = effective_relative_dir
+                    )
+                except Exception as exc:
+                    logger.warning(
+                        "folder prefetch failed: relative_dir = %s, err = %s",
+                        effective_relative_dir,
+                        str(exc)
+                    )
+                    token_by_dir[effective_relative_dir] = None
+            token = token_by_dir[effective_relative_dir]
+            if token is not None:
+                result[item.path] = token
+        return result
+
     def _build_folder_token_by_path(
         self,
         items: list,
@@ -1118,7 +1898,8 @@ class ImportOrchestrator:
         write_mode: str,
         folder_subdirs: bool,
         folder_root_relative_dir: str,
-        folder_root_token: str
+        folder_root_token: str,
+        folder_dir_by_path: Optional[dict[str, str]] = None
     ) -> dict[str, str]:
         """Build destination folder token map for each document path.
 
@@ -1129,6 +1910,7 @@ class ImportOrchestrator:
             folder_subdirs: Whether to build hierarchy by source dirs.
             folder_root_relative_dir: Optional task root folder path.
             folder_root_token: Optional task root folder token.
+            folder_dir_by_path: Optional root-prefixed folder dirs from _derive_plan_lookups.
         """
 
         result: dict[str, str] = {}
@@ -1144,14 +1926,13 @@ class ImportOrchestrator:
 
             target_folder_token = folder_root_token
             if folder_subdirs:
-                effective_relative_dir = doc.relative_dir
-                if folder_root_relative_dir:
-                    if effective_relative_dir:
-                        effective_relative_dir = (
-                            f"{folder_root_relative_dir}/{effective_relative_dir}"
-                        )
-                    else:
-                        effective_relative_dir = folder_root_relative_dir
+                if folder_dir_by_path and path in folder_dir_by_path:
+                    effective_relative_dir = folder_dir_by_path[path]
+                else:
+                    effective_relative_dir = self._effective_folder_dir(
+                        relative_dir = doc.relative_dir,
+                        folder_root_relative_dir = folder_root_relative_dir
+                    )
                 if effective_relative_dir not in relative_dir_cache:
                     relative_dir_cache[effective_relative_dir] = self.doc_writer.ensure_folder_path(
                         relative_dir = effective_relative_dir
@@ -1279,7 +2060,7 @@ class ImportOrchestrator:
         self,
         folder_nav_title: str,
         manifest: ImportManifest,
-        created_docs: list[CreatedDocRecord],
+        record_by_path: dict[str, CreatedDocRecord],
         folder_token: str,
         source_paths: list[str],
         toc_file: str
@@ -1289,7 +2070,7 @@ class ImportOrchestrator:
         Args:
             folder_nav_title: Navigation document title.
             manifest: Import manifest.
-            created_docs: Created docs.
+            record_by_path: Created document records keyed by source path.
             folder_token: Destination folder token.
             source_paths: Source markdown paths from adapter.
             toc_file: TOC filename.
@@ -1302,7 +2083,6 @@ class ImportOrchestrator:
         if not callable(llm_generate):
             return False
 
-        record_by_path = {item.path: item for item in created_docs}
         llm_documents = []
         for item in manifest.items:
             record = record_by_path.get(item.path)
@@ -1336,7 +2116,7 @@ class ImportOrchestrator:
 
         rewritten_markdown, rewritten_links = self._replace_source_links_in_nav_markdown(
             markdown = llm_markdown,
-            created_docs = created_docs
+            created_docs = record_by_path.values()
         )
         if rewritten_links <= 0:
             return False
@@ -1356,7 +2136,7 @@ class ImportOrchestrator:
                 stage = "folder_nav_created",
                 detail = (
                     f"title = {folder_nav_title}, document_id = {nav_create['document_id']}, "
-                    f"entries = {len(created_docs)}, mode = llm"
+                    f"entries = {len(record_by_path)}, mode = llm"
                 )
             )
         except Exception:
@@ -1405,7 +2185,7 @@ class ImportOrchestrator:
     def _replace_source_links_in_nav_markdown(
         self,
         markdown: str,
-        created_docs: list[CreatedDocRecord]
+        created_docs: Iterable[CreatedDocRecord]
     ) -> tuple[str, int]:
         """Replace source-path markdown links with final Feishu doc links.
 
@@ -1525,7 +2305,7 @@ class ImportOrchestrator:
         self,
         folder_nav_title: str,
         manifest: ImportManifest,
-        created_docs: list[CreatedDocRecord],
+        record_by_path: dict[str, CreatedDocRecord],
         folder_token: str = ""
     ) -> None:
         """Create one folder navigation doc linking all imported markdown docs.
@@ -1533,11 +2313,10 @@ class ImportOrchestrator:
         Args:
             folder_nav_title: Navigation document title.
             manifest: Import manifest.
-            created_docs: Created document records.
+            record_by_path: Created document records keyed by source path.
             folder_token: Optional destination folder token.
         """
 
-        record_by_path = {item.path: item for item in created_docs}
         nav_markdown = self._build_folder_nav_markdown(
             manifest = manifest,
             record_by_path = record_by_path
@@ -1563,7 +2342,7 @@ class ImportOrchestrator:
                 stage = "folder_nav_created",
                 detail = (
                     f"title = {folder_nav_title}, document_id = {nav_create['document_id']}, "
-                    f"entries = {len(created_docs)}"
+                    f"entries = {len(record_by_path)}"
                 )
             )
         except Exception:
@@ -1592,31 +2371,22 @@ class ImportOrchestrator:
             ""
         ]
 
+        indent_by_dir: dict[str, str] = {}
         for item in manifest.items:
             record = record_by_path.get(item.path)
             if not record:
                 continue
 
-            level = 0
-            if item.relative_dir:
+            indent = indent_by_dir.get(item.relative_dir)
+            if indent is None:
                 level = len([segment for segment in item.relative_dir.split("/") if segment])
-            indent = "  " * max(level, 0)
-
-            display_title = record.title
-            if item.toc_label:
-                display_title = item.toc_label
+                indent = indent_by_dir[item.relative_dir] = "  " * level
 
+            display_title = item.toc_label or record.title
             if record.doc_url:
-                lines.append(
-                    f"{indent}- [{display_title}]({record.doc_url}) · `{item.path}`"
-                )
+                lines.append(_NAV_LINE_URL % (indent, display_title, record.doc_url, item.path))
             else:
-                lines.append(
-                    (
-                        f"{indent}- {display_title} · `{item.path}` "
-                        f"(document_id: `{record.document_id}`)"
-                    )
-                )
+                lines.append(_NAV_LINE_NOURL % (indent, display_title, item.path, record.document_id))
 
         return "\n".join(lines)
 
@@ -1629,19 +2399,39 @@ class ImportOrchestrator:
 
         lookup: dict[str, AssetRef] = {}
         for asset in assets:
-            candidates = [
-                asset.original_url,
-                urllib.parse.unquote(asset.original_url),
-                asset.resolved_url,
-                urllib.parse.unquote(asset.resolved_url),
+            original_unquoted = urllib.parse.unquote(asset.original_url)
+            resolved_unquoted = urllib.parse.unquote(asset.resolved_url)
+            url_keys = frozenset(
+                (
+                    asset.original_url,
+                    original_unquoted,
+                    asset.resolved_url,
+                    resolved_unquoted
+                )
+            )
+            for key in url_keys:
+                if key:
+                    lookup[key] = asset
+            # Normalized paths let "./img/a.png" and "img/a.png" meet before
+            # falling back to the ambiguous basename.
+            path_keys = {
+                posixpath.normpath(key)
+                for key in (original_unquoted, resolved_unquoted)
+                if key and "://" not in key
+            }
+            for key in path_keys - url_keys:
+                lookup.setdefault(key, asset)
+            # Basenames collide across directories; keep the first asset that
+            # claimed one instead of letting later assets overwrite it.
+            basename_keys = {
                 os.path.basename(asset.original_url),
-                os.path.basename(urllib.parse.unquote(asset.original_url)),
+                os.path.basename(original_unquoted),
                 os.path.basename(asset.resolved_url),
-                os.path.basename(urllib.parse.unquote(asset.resolved_url))
-            ]
-            for key in candidates:
+                os.path.basename(resolved_unquoted)
+            }
+            for key in basename_keys - url_keys:
                 if key:
-                    lookup[key] = asset
+                    lookup.setdefault(key, asset)
         return lookup
 
     def _find_asset_by_image_url(self, image_url: str, asset_lookup: dict[str, AssetRef]) -> Optional[AssetRef]:
@@ -1658,13 +2448,15 @@ class ImportOrchestrator:
 
         parsed = urllib.parse.urlparse(normalized)
         path_only = parsed.path or normalized
+        path_unquoted = urllib.parse.unquote(path_only)
         candidates = [
             normalized,
-            urllib.parse.unquote(normalized),
+            path_unquoted if path_only == normalized else urllib.parse.unquote(normalized),
             path_only,
-            urllib.parse.unquote(path_only),
+            path_unquoted,
+            posixpath.normpath(path_unquoted) if path_unquoted else "",
             os.path.basename(path_only),
-            os.path.basename(urllib.parse.unquote(path_only))
+            os.path.basename(path_unquoted)
         ]
 
         for key in candidates:
@@ -1672,6 +2464,82 @@ class ImportOrchestrator:
                 return asset_lookup[key]
         return None
 
+    def _upload_and_replace_images(
+        self,
+        document_id: str,
+        pending_images: list[tuple[str, AssetRef]]
+    ) -> None:
+        """Upload collected image assets concurrently and replace their blocks.
+
+        Replacements go out as one batch when the writer supports it, otherwise
+        each image is replaced right after its own upload.
+
+        Args:
+            document_id: Target document id.
+            pending_images: Ordered (block_id, asset) pairs collected during write.
+        """
+
+        if not pending_images:
+            return
+
+        batch_replace = getattr(self.doc_writer, "batch_replace_images", None)
+        can_batch = callable(batch_replace)
+
+        def _upload(item: tuple[str, AssetRef]) -> tuple[str, Optional[str]]:
+            block_id, asset = item
+            try:
+                file_token = self.media_service.upload_to_node(
+                    asset = asset,
+                    parent_node = block_id
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Image upload failed: document_id = %s, block_id = %s, err = %s",
+                    document_id,
+                    block_id,
+                    str(exc)
+                )
+                return block_id, None
+            if can_batch:
+                return block_id, file_token
+            # Without a batch endpoint, replace on the same thread so the
+            # replace round-trip overlaps other images' uploads.
+            try:
+                self.doc_writer.replace_image(
+                    document_id = document_id,
+                    block_id = block_id,
+                    file_token = file_token
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Image replace failed: document_id = %s, block_id = %s, err = %s",
+                    document_id,
+                    block_id,
+                    str(exc)
+                )
+            return block_id, file_token
+
+        upload_workers = min(len(pending_images), max(1, int(self.config.media_concurrency)))
+        if upload_workers > 1:
+            with ThreadPoolExecutor(max_workers = upload_workers) as upload_pool:
+                uploaded = list(upload_pool.map(_upload, pending_images))
+        else:
+            uploaded = [_upload(item) for item in pending_images]
+
+        if not can_batch:
+            return
+
+        replacements = [
+            (block_id, file_token)
+            for block_id, file_token in uploaded
+            if file_token is not None
+        ]
+        if replacements:
+            batch_replace(
+                document_id = document_id,
+                replacements = replacements
+            )
+
     def _create_doc_with_title_strategy(
         self,
         doc: SourceDocument,
@@ -1719,7 +2587,7 @@ class ImportOrchestrator:
             folder_token: Optional folder token override.
         """
 
-        if hasattr(self.doc_writer, "create_doc_with_meta"):
+        if self._doc_writer_has_meta:
             payload = self.doc_writer.create_doc_with_meta(
                 title = title,
                 folder_token = folder_token
@@ -1768,21 +2636,22 @@ class ImportOrchestrator:
             return ["Untitled"]
         return deduplicated
 
-    def _normalize_doc_title(self, title: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize = 4096)
+    def _normalize_doc_title(title: str) -> str:
         """Normalize title to avoid Feishu invalid parameter errors.
 
         Args:
             title: Raw title text.
         """
 
-        value = self._control_chars_pattern.sub(" ", title or "")
-        value = self._title_invalid_chars_pattern.sub(" ", value)
-        value = re.sub(r"\s+", " ", value).strip()
+        value = " ".join((title or "").translate(_TITLE_SANITIZE_TRANS).split())
         if not value:
             return ""
-        return self._truncate_utf8_bytes(text = value, max_bytes = self._title_max_bytes)
+        return ImportOrchestrator._truncate_utf8_bytes(text = value, max_bytes = _TITLE_MAX_BYTES)
 
-    def _truncate_utf8_bytes(self, text: str, max_bytes: int) -> str:
+    @staticmethod
+    def _truncate_utf8_bytes(text: str, max_bytes: int) -> str:
         """Truncate one string by UTF-8 bytes while keeping valid chars.
 
         Args:
@@ -1793,40 +2662,43 @@ class ImportOrchestrator:
         if max_bytes <= 0:
             return ""
 
-        result = ""
-        used = 0
-        for char in text:
-            char_bytes = len(char.encode("utf-8"))
-            if result and used + char_bytes > max_bytes:
-                break
-            if not result and char_bytes > max_bytes:
-                return ""
-            result += char
-            used += char_bytes
-        return result
+        encoded = text.encode("utf-8")
+        if len(encoded) <= max_bytes:
+            return text
+
+        boundary = max_bytes
+        while boundary > 0 and (encoded[boundary] & 0xC0) == 0x80:
+            boundary -= 1
+        if boundary == 0:
+            return ""
+        return encoded[:boundary].decode("utf-8")
 
-    def _path_based_title(self, path: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize = 4096)
+    def _path_based_title(path: str) -> str:
         """Create a title derived from source-relative path.
 
         Args:
             path: Source-relative markdown path.
         """
 
-        normalized = path.strip().replace("\\", "/")
-        if not normalized:
+        norm = _norm_path(path)
+        if not norm.posix:
             return ""
 
-        normalized_lower = normalized.lower()
-        if normalized_lower.endswith(".markdown"):
-            normalized = normalized[:-9]
-        elif normalized_lower.endswith(".docx"):
-            normalized = normalized[:-5]
-        elif normalized_lower.endswith(".md"):
-            normalized = normalized[:-3]
-
-        segments = [item for item in normalized.split("/") if item]
+        segments = list(norm.parts)
+        if segments:
+            last = segments.pop()
+            if not norm.posix.endswith("/"):
+                last_lower = last.lower()
+                for suffix in _TITLE_STRIP_SUFFIXES:
+                    if last_lower.endswith(suffix):
+                        last = last[:-len(suffix)]
+                        break
+            if last:
+                segments.append(last)
         if segments and segments[-1].lower() in {"readme", "index"}:
-            segments = segments[:-1]
+            segments.pop()
 
         if not segments:
             stem = os.path.splitext(os.path.basename(path))[0]
@@ -1841,21 +2713,19 @@ class ImportOrchestrator:
             path: Relative path text.
         """
 
-        normalized = path.strip().replace("\\", "/").strip("/")
-        if not normalized:
-            return ""
-        return normalized.split("/")[-1]
+        parts = _norm_path(path).parts
+        return parts[-1] if parts else ""
 
-    def _is_directory_index(self, path: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize = 4096)
+    def _is_directory_index(path: str) -> bool:
         """Check whether markdown file is README/INDEX style index document.
 
         Args:
             path: Source-relative markdown path.
         """
 
-        filename = os.path.basename(path or "")
-        stem = os.path.splitext(filename)[0].lower()
-        return stem in {"readme", "index", "table_of_contents", "toc"}
+        return _norm_path(path).stem_lower in {"readme", "index", "table_of_contents", "toc"}
 
     def _looks_like_invalid_param_error(self, exc: Exception) -> bool:
         """Check whether exception looks like Feishu invalid parameter error.
@@ -1864,16 +2734,7 @@ class ImportOrchestrator:
             exc: Raised exception.
         """
 
-        message = str(exc).lower()
-        if "1770001" in message:
-            return True
-        if "invalid param" in message:
-            return True
-        if "确认参数是否合法" in message:
-            return True
-        if "参数" in message and "合法" in message:
-            return True
-        return False
+        return _INVALID_PARAM_RE.search(str(exc).lower()) is not None
 
     def _assert_services_ready(self, write_mode: str) -> None:
         """Validate required Feishu services are available.
@@ -1888,7 +2749,14 @@ class ImportOrchestrator:
         if write_mode in {"wiki", "both"} and not self.wiki_service:
             raise RuntimeError("Wiki service is required for wiki/both modes")
 
-    def _notify(self, chat_id: str, level: str, message: str, force: bool) -> None:
+    def _notify(
+        self,
+        chat_id: str,
+        level: str,
+        message: str,
+        force: bool,
+        progress: bool = False
+    ) -> None:
         """Send notification message according to level.
 
         Args:
@@ -1896,6 +2764,7 @@ class ImportOrchestrator:
             level: Verbosity level.
             message: Message text.
             force: Whether to ignore level filter.
+            progress: Whether the message is per-item progress that may be coalesced.
         """
 
         if not self.notify_service:
@@ -1906,6 +2775,48 @@ class ImportOrchestrator:
         if level == "minimal" and not force:
             return
 
+        batcher = self._notify_batcher
+        if batcher is not None:
+            if progress:
+                batcher.submit(chat_id = chat_id, message = message)
+                return
+            batcher.flush()
+
+        self._send_notify(chat_id = chat_id, message = message)
+
+    def _start_notify_batcher(self, notify_level: str) -> Optional[_NotifyBatcher]:
+        """Start progress coalescing when per-item messages would be sent.
+
+        Args:
+            notify_level: Notification verbosity.
+        """
+
+        if not self.notify_service or notify_level != "normal":
+            return None
+        return _NotifyBatcher(
+            send = lambda chat_id, message: self._send_notify(chat_id = chat_id, message = message)
+        )
+
+    def _stop_notify_batcher(self) -> None:
+        """Flush queued progress messages and stop the batcher thread.
+
+        Args:
+            None
+        """
+
+        batcher = self._notify_batcher
+        self._notify_batcher = None
+        if batcher is not None:
+            batcher.close()
+
+    def _send_notify(self, chat_id: str, message: str) -> None:
+        """Deliver one notification, logging instead of raising on failure.
+
+        Args:
+            chat_id: Target chat id.
+            message: Message text.
+        """
+
         try:
             self.notify_service.send_status(chat_id = chat_id, message = message)
         except Exception:
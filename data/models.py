@@ -23,7 +23,7 @@ class AssetRef:
     media_token: str = ""
 
 
-@dataclass
+@dataclass(slots = True)
 class SourceDocument:
     """Represents one markdown file from local path or GitHub.
 
@@ -110,7 +110,7 @@ class ImportResult:
     created_docs: List["CreatedDocRecord"] = dataclasses.field(default_factory = list)
 
 
-@dataclass
+@dataclass(slots = True)
 class DocumentPlanItem:
     """One planned markdown import item after ordering.
 
@@ -138,6 +138,7 @@ class ImportManifest:
         unresolved_links: Unresolved TOC links summary.
         llm_used: Whether LLM fallback was called.
         llm_calls: Number of LLM calls used in this run.
+        llm_cache_hits: Ambiguities answered from persisted LLM resolutions.
         toc_links: Total markdown links parsed from TOC.
         matched_links: Links successfully resolved into source paths.
         ambiguous_links: Links with multiple candidate paths.
@@ -149,6 +150,7 @@ class ImportManifest:
     unresolved_links: List[str] = dataclasses.field(default_factory = list)
     llm_used: bool = False
     llm_calls: int = 0
+    llm_cache_hits: int = 0
     toc_links: int = 0
     matched_links: int = 0
     ambiguous_links: int = 0
@@ -8,6 +8,7 @@ import urllib.parse
 
 from pathlib import Path
 from typing import List
+from concurrent.futures import ThreadPoolExecutor
 
 from data.models import SourceDocument
 from utils.http_client import HttpClient
@@ -24,6 +25,9 @@ LOCAL_HTML_IMAGE_PATTERN = re.compile(
 class SourceAdapter(abc.ABC):
     """Source adapter abstraction for markdown discovery and reading."""
 
+    # Whether read_markdown may run while list_markdown is still scanning.
+    supports_concurrent_read = False
+
     @abc.abstractmethod
     def list_markdown(self) -> List[str]:
         """List markdown paths relative to source root.
@@ -49,6 +53,9 @@ class LocalSourceAdapter(SourceAdapter):
         root_path: Local root directory path.
     """
 
+    supports_concurrent_read = True
+    READ_MANY_MAX_WORKERS = 8
+
     def __init__(self, root_path: str) -> None:
         self.root_path = os.path.abspath(root_path)
         self._root_path_obj = Path(self.root_path)
@@ -118,6 +125,30 @@ class LocalSourceAdapter(SourceAdapter):
             source_type = "local"
         )
 
+    def read_many(self, relative_paths: List[str]) -> List[SourceDocument | Exception]:
+        """Read several local files concurrently, preserving input order.
+
+        A file that fails to read yields its exception in place, so one bad
+        path does not abort the rest of the batch.
+
+        Args:
+            self: Adapter instance.
+            relative_paths: Source-relative markdown paths.
+        """
+
+        def _read_or_error(relative_path: str) -> SourceDocument | Exception:
+            try:
+                return self.read_markdown(relative_path = relative_path)
+            except Exception as exc:
+                return exc
+
+        if len(relative_paths) <= 1:
+            return [_read_or_error(relative_path) for relative_path in relative_paths]
+
+        workers = min(self.READ_MANY_MAX_WORKERS, len(relative_paths))
+        with ThreadPoolExecutor(max_workers = workers) as pool:
+            return list(pool.map(_read_or_error, relative_paths))
+
     def close(self) -> None:
         """Release temporary DOCX conversion workspace.
 
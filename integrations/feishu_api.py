@@ -92,6 +92,28 @@ class FeishuAuthClient:
         self._expires_at = now + expire
         return token
 
+    def export_token(self) -> tuple[str, float]:
+        """Return a valid tenant token and its expiry timestamp for seeding other clients.
+
+        Args:
+            self: Auth client instance.
+        """
+
+        token = self.get_tenant_access_token()
+        return token, self._expires_at
+
+    def seed_token(self, token: str, expires_at: float) -> None:
+        """Prime the token cache with a token fetched elsewhere, e.g. by the parent process.
+
+        Args:
+            token: Tenant access token.
+            expires_at: Absolute expiry timestamp in seconds.
+        """
+
+        if token and expires_at > self._expires_at:
+            self._token = token
+            self._expires_at = float(expires_at)
+
 
 class FeishuUserTokenManager:
     """Manage user access token and refresh token lifecycle.
@@ -532,6 +554,7 @@ class DocWriterService(FeishuServiceBase):
     FOLDER_CREATE_MAX_ATTEMPTS = 4
     FOLDER_CREATE_BACKOFF_SECONDS = 0.05
     CREATE_CHILDREN_BATCH_SIZE = 20
+    BATCH_UPDATE_MAX_REQUESTS = 200
     NATIVE_TEXT_BLOCK_MAX_BYTES = 3000
     SCHEMA_RETRY_MAX_ATTEMPTS = 5
     SCHEMA_RETRY_BACKOFF_SECONDS = 0.2
@@ -1882,6 +1905,54 @@ class DocWriterService(FeishuServiceBase):
             }
         )
 
+    def batch_replace_images(self, document_id: str, replacements: List[tuple[str, str]]) -> None:
+        """Replace many image blocks with one batch_update call per chunk.
+
+        Args:
+            document_id: Document id.
+            replacements: Ordered (block_id, file_token) pairs.
+        """
+
+        for index in range(0, len(replacements), self.BATCH_UPDATE_MAX_REQUESTS):
+            batch = replacements[index:index + self.BATCH_UPDATE_MAX_REQUESTS]
+            try:
+                self._request_json(
+                    method = "PATCH",
+                    path = f"/open-apis/docx/v1/documents/{document_id}/blocks/batch_update",
+                    json_body = {
+                        "requests": [
+                            {
+                                "block_id": block_id,
+                                "replace_image": {
+                                    "token": file_token
+                                }
+                            }
+                            for block_id, file_token in batch
+                        ]
+                    }
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Batch image replace failed, fallback to per-block: document_id = %s, count = %d, err = %s",
+                    document_id,
+                    len(batch),
+                    str(exc)
+                )
+                for block_id, file_token in batch:
+                    try:
+                        self.replace_image(
+                            document_id = document_id,
+                            block_id = block_id,
+                            file_token = file_token
+                        )
+                    except Exception as item_exc:
+                        logger.warning(
+                            "Image replace failed: document_id = %s, block_id = %s, err = %s",
+                            document_id,
+                            block_id,
+                            str(item_exc)
+                        )
+
     def append_fallback_text(self, document_id: str, content: str) -> None:
         """Fallback when markdown convert fails.
 
@@ -123,6 +123,108 @@ class OpenAICompatibleLlmClient:
             reason = reason
         )
 
+    def resolve_toc_ambiguity_batch(
+        self,
+        items: list[dict],
+        toc_context: str
+    ) -> list[LlmResolution]:
+        """Resolve many TOC ambiguities with one structured prompt.
+
+        Args:
+            items: Ambiguity items with link_text, raw_target and candidate_paths.
+            toc_context: TOC context lines covering every item.
+        """
+
+        if not items:
+            return []
+        resolutions = [LlmResolution() for _ in items]
+        if not self.is_ready():
+            return resolutions
+
+        endpoint = self.base_url
+        if not endpoint.endswith("/chat/completions"):
+            endpoint = f"{endpoint}/chat/completions"
+
+        prompt_payload = {
+            "items": [
+                {
+                    "index": index,
+                    "link_text": item.get("link_text", ""),
+                    "raw_target": item.get("raw_target", ""),
+                    "candidate_paths": list(item.get("candidate_paths", []))[:12]
+                }
+                for index, item in enumerate(items)
+            ],
+            "toc_context": toc_context
+        }
+
+        try:
+            response = self.http_client.request(
+                method = "POST",
+                url = endpoint,
+                headers = {
+                    "Authorization": f"Bearer {self.api_key}"
+                },
+                json_body = {
+                    "model": self.model,
+                    "temperature": 0,
+                    "max_tokens": min(4000, 80 * len(items) + 40),
+                    "response_format": {
+                        "type": "json_object"
+                    },
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": (
+                                "Resolve markdown TOC link ambiguities. "
+                                "Return strict JSON only: "
+                                "{\"resolutions\":[{\"index\":0,\"selected_path\":\"...\","
+                                "\"confidence\":0.0,\"reason\":\"...\"}]}. "
+                                "Answer every item index once. "
+                                "selected_path must be one of that item's candidate_paths, "
+                                "or empty string if unsure."
+                            )
+                        },
+                        {
+                            "role": "user",
+                            "content": json.dumps(
+                                prompt_payload,
+                                ensure_ascii = False
+                            )
+                        }
+                    ]
+                }
+            )
+            payload = response.json()
+        except Exception as exc:
+            logger.warning("LLM batch request failed for TOC ambiguity: %s", str(exc))
+            return resolutions
+
+        content = self._extract_message_content(payload = payload)
+        if not content:
+            return resolutions
+
+        parsed = self._parse_json_text(text = content)
+        entries = parsed.get("resolutions", []) if parsed else []
+        if not isinstance(entries, list):
+            return resolutions
+
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get("index", -1))
+            except (TypeError, ValueError):
+                continue
+            if index < 0 or index >= len(items):
+                continue
+            resolutions[index] = LlmResolution(
+                selected_path = str(entry.get("selected_path", "")).strip(),
+                confidence = self._safe_float(entry.get("confidence", 0.0)),
+                reason = str(entry.get("reason", "")).strip()
+            )
+        return resolutions
+
     def generate_folder_nav_markdown(
         self,
         context_markdown: str,
@@ -186,6 +186,21 @@ def parse_args() -> argparse.Namespace:
             "recommend <= CPU logical cores"
         )
     )
+    parser.add_argument(
+        "--doc-workers",
+        type = int,
+        default = 1,
+        help = (
+            "In-process document import threads when --max-workers is 1; "
+            "wiki moves stay in manifest order"
+        )
+    )
+    parser.add_argument(
+        "--doc-stagger-ms",
+        type = int,
+        default = 0,
+        help = "Delay in milliseconds between document submissions when --doc-workers > 1"
+    )
     parser.add_argument(
         "--notify-level",
         choices = ["none", "minimal", "normal"],
@@ -214,6 +229,10 @@ def main() -> int:
         raise ValueError("--max-workers must be >= 1")
     if args.chunk_workers < 1:
         raise ValueError("--chunk-workers must be >= 1")
+    if args.doc_workers < 1:
+        raise ValueError("--doc-workers must be >= 1")
+    if args.doc_stagger_ms < 0:
+        raise ValueError("--doc-stagger-ms must be >= 0")
     if args.llm_max_calls < 0:
         raise ValueError("--llm-max-calls must be >= 0")
     if args.oauth_timeout < 1:
@@ -337,7 +356,9 @@ def main() -> int:
         llm_max_calls = args.llm_max_calls,
         skip_root_readme = args.skip_root_readme,
         max_workers = args.max_workers,
-        chunk_workers = args.chunk_workers
+        chunk_workers = args.chunk_workers,
+        doc_workers = args.doc_workers,
+        doc_stagger_ms = args.doc_stagger_ms
     )
 
     if result.failed > 0:
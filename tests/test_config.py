@@ -1,8 +1,10 @@
 import os
 import tempfile
 import unittest
+import dataclasses
 
 from config.config import AppConfig
+from config.config import _parse_dotenv_text
 
 
 class TestConfig(unittest.TestCase):
@@ -45,6 +47,7 @@ class TestConfig(unittest.TestCase):
                 ]:
                     os.environ.pop(key, None)
 
+                AppConfig.clear_cache()
                 config = AppConfig.from_env()
                 self.assertEqual(config.feishu_app_id, "app_1")
                 self.assertEqual(config.feishu_app_secret, "sec_1")
@@ -59,6 +62,76 @@ class TestConfig(unittest.TestCase):
             os.chdir(original_cwd)
             os.environ.clear()
             os.environ.update(original_env)
+            AppConfig.clear_cache()
+
+    def test_from_env_is_cached_until_cleared(self) -> None:
+        """Should reuse cached config until clear_cache is called.
+
+        Args:
+            self: Test case instance.
+        """
+
+        original_env = dict(os.environ)
+
+        try:
+            os.environ["LLM_MODEL"] = "model_a"
+            AppConfig.clear_cache()
+            first = AppConfig.from_env()
+
+            os.environ["LLM_MODEL"] = "model_b"
+            self.assertIs(AppConfig.from_env(), first)
+            self.assertEqual(AppConfig.from_env().llm_model, "model_a")
+
+            AppConfig.clear_cache()
+            self.assertEqual(AppConfig.from_env().llm_model, "model_b")
+        finally:
+            os.environ.clear()
+            os.environ.update(original_env)
+            AppConfig.clear_cache()
+
+    def test_cached_config_is_immutable(self) -> None:
+        """Should reject attribute writes on the shared cached config.
+
+        Args:
+            self: Test case instance.
+        """
+
+        config = AppConfig.from_env()
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            config.llm_model = "changed"
+        updated = dataclasses.replace(config, llm_model = "changed")
+        self.assertEqual(updated.llm_model, "changed")
+        self.assertNotEqual(config.llm_model, "changed")
+
+    def test_parse_dotenv_text_handles_quotes_and_comments(self) -> None:
+        """Should parse quoted values, inline comments and keep first duplicate.
+
+        Args:
+            self: Test case instance.
+        """
+
+        parsed = _parse_dotenv_text(
+            text = (
+                "# comment\n"
+                "A=1\n"
+                "B = \"two words\"  # note\n"
+                "C='x#y'\n"
+                "D=tok#en\n"
+                "E=\n"
+                "A=dup\r\n"
+                "not a pair\n"
+            )
+        )
+        self.assertEqual(
+            parsed,
+            {
+                "A": "1",
+                "B": "two words",
+                "C": "x#y",
+                "D": "tok#en",
+                "E": ""
+            }
+        )
 
 
 if __name__ == "__main__":
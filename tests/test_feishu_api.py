@@ -1,8 +1,10 @@
 import json
+import time
 import tempfile
 import unittest
 
 from integrations.feishu_api import DocWriterService
+from integrations.feishu_api import FeishuAuthClient
 from integrations.feishu_api import FeishuServiceBase
 from integrations.feishu_api import FeishuUserTokenManager
 from integrations.feishu_api import WikiService
@@ -333,6 +335,28 @@ class TestFeishuApiOptimizations(unittest.TestCase):
         headers = http_client.calls[0].get("headers", {})
         self.assertEqual(headers.get("Authorization"), "Bearer token_x")
 
+    def test_seeded_tenant_token_skips_auth_request(self) -> None:
+        """A seeded tenant token should be served without an auth round-trip.
+
+        Args:
+            self: Test case instance.
+        """
+
+        http_client = FakeHttpClient()
+        auth = FeishuAuthClient(
+            app_id = "app",
+            app_secret = "secret",
+            base_url = "https://open.feishu.cn",
+            http_client = http_client
+        )
+        expires_at = time.time() + 3600
+        auth.seed_token(token = "seeded", expires_at = expires_at)
+        auth.seed_token(token = "older", expires_at = expires_at - 10)
+
+        self.assertEqual(auth.get_tenant_access_token(), "seeded")
+        self.assertEqual(auth.export_token(), ("seeded", expires_at))
+        self.assertEqual(http_client.calls, [])
+
     def test_doc_convert_chunked_by_bytes(self) -> None:
         """Doc conversion should split large markdown into multiple calls.
 
@@ -637,6 +661,43 @@ class TestFeishuApiOptimizations(unittest.TestCase):
         self.assertTrue(has_bold)
         self.assertTrue(has_link)
 
+    def test_batch_replace_images_chunks_requests(self) -> None:
+        """Image replacements should be packed into batch_update calls.
+
+        Args:
+            self: Test case instance.
+        """
+
+        http_client = FakeHttpClient()
+        doc_writer = DocWriterService(
+            auth_client = FakeAuthClient(),
+            http_client = http_client,
+            base_url = "https://open.feishu.cn",
+            folder_token = "fld_root",
+            convert_max_bytes = 20
+        )
+        doc_writer.BATCH_UPDATE_MAX_REQUESTS = 2
+
+        doc_writer.batch_replace_images(
+            document_id = "doc_1",
+            replacements = [("blk_1", "img_1"), ("blk_2", "img_2"), ("blk_3", "img_3")]
+        )
+
+        batch_calls = [
+            call for call in http_client.calls
+            if call.get("url", "").endswith("/open-apis/docx/v1/documents/doc_1/blocks/batch_update")
+        ]
+        self.assertEqual(len(batch_calls), 2)
+        self.assertEqual(
+            [
+                (request["block_id"], request["replace_image"]["token"])
+                for call in batch_calls
+                for request in (call.get("json_body") or {}).get("requests", [])
+            ],
+            [("blk_1", "img_1"), ("blk_2", "img_2"), ("blk_3", "img_3")]
+        )
+        self.assertTrue(all(call.get("method") == "PATCH" for call in batch_calls))
+
     def test_ensure_folder_path_creates_missing_segments(self) -> None:
         """Folder hierarchy should reuse existing and create missing folders.
 
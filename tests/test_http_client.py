@@ -0,0 +1,134 @@
+import os
+import threading
+import unittest
+
+from unittest import mock
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+from core.exceptions import HttpRequestError
+from utils.http_client import HttpClient
+from utils.rate_limiter import RateLimiter
+
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 handler recording the client port of each request."""
+
+    protocol_version = "HTTP/1.1"
+    client_ports: list = []
+
+    def do_GET(self) -> None:
+        """Reply with a small JSON body, or 500 for /fail and 429 for /busy.
+
+        Args:
+            self: Handler instance.
+        """
+
+        self.client_ports.append(self.client_address[1])
+        status = {"/fail": 500, "/busy": 429}.get(self.path, 200)
+        body = b'{"ok": true}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """Silence request logging.
+
+        Args:
+            self: Handler instance.
+            format: Log format.
+            args: Log args.
+        """
+
+
+class TestHttpClient(unittest.TestCase):
+    """Tests for keep-alive HTTP client behavior."""
+
+    def setUp(self) -> None:
+        """Start a local HTTP/1.1 server.
+
+        Args:
+            self: Test case instance.
+        """
+
+        RecordingHandler.client_ports = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RecordingHandler)
+        self.thread = threading.Thread(
+            target = self.server.serve_forever,
+            kwargs = {"poll_interval": 0.05},
+            daemon = True
+        )
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self) -> None:
+        """Stop the local server.
+
+        Args:
+            self: Test case instance.
+        """
+
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _client(self, **kwargs) -> HttpClient:
+        """Build a client that ignores any proxy settings in the environment.
+
+        Args:
+            kwargs: Extra HttpClient arguments.
+        """
+
+        with mock.patch.dict(os.environ, {"no_proxy": "127.0.0.1", "NO_PROXY": "127.0.0.1"}):
+            return HttpClient(timeout = 5, retry_backoff = 0, **kwargs)
+
+    def test_requests_reuse_one_connection(self) -> None:
+        """Sequential requests to one host should share a keep-alive socket.
+
+        Args:
+            self: Test case instance.
+        """
+
+        client = self._client()
+        for _ in range(3):
+            response = client.request(method = "GET", url = f"{self.base_url}/ok")
+            self.assertEqual(response.json(), {"ok": True})
+        client.close()
+
+        self.assertEqual(len(RecordingHandler.client_ports), 3)
+        self.assertEqual(len(set(RecordingHandler.client_ports)), 1)
+
+    def test_pooled_request_retries_then_raises_on_server_error(self) -> None:
+        """5xx responses on pooled connections should keep retry semantics.
+
+        Args:
+            self: Test case instance.
+        """
+
+        client = self._client(max_retries = 2)
+        with self.assertRaises(HttpRequestError):
+            client.request(method = "GET", url = f"{self.base_url}/fail")
+        client.close()
+
+        self.assertEqual(len(RecordingHandler.client_ports), 2)
+
+    def test_throttled_responses_slow_down_rate_limiter(self) -> None:
+        """Each 429 attempt should halve the limiter rate.
+
+        Args:
+            self: Test case instance.
+        """
+
+        limiter = RateLimiter(rate_per_sec = 1000, burst = 10)
+        client = self._client(max_retries = 2, rate_limiter = limiter)
+        with self.assertRaises(HttpRequestError):
+            client.request(method = "GET", url = f"{self.base_url}/busy")
+        client.close()
+
+        self.assertEqual(len(RecordingHandler.client_ports), 2)
+        self.assertLess(limiter.rate, 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
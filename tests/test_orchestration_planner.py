@@ -1,3 +1,6 @@
+import asyncio
+import os
+import tempfile
 import unittest
 
 from core.orchestration_planner import LlmResolution
@@ -11,6 +14,7 @@ class PlannerSource:
     def __init__(self, docs: dict[str, SourceDocument], paths: list[str]) -> None:
         self.docs = docs
         self.paths = paths
+        self.read_count = 0
 
     def list_markdown(self) -> list[str]:
         """List markdown paths.
@@ -29,6 +33,7 @@ class PlannerSource:
             relative_path: Source-relative markdown path.
         """
 
+        self.read_count += 1
         return self.docs[relative_path]
 
 
@@ -65,6 +70,78 @@ class FakeResolver:
         )
 
 
+class FakeBatchResolver(FakeResolver):
+    """Fake resolver exposing batch ambiguity resolution."""
+
+    def __init__(self, selected_paths: list[str], confidence: float) -> None:
+        super().__init__(selected_path = "", confidence = confidence)
+        self.selected_paths = selected_paths
+        self.batch_calls = 0
+        self.batch_sizes: list[int] = []
+
+    def resolve_toc_ambiguity_batch(
+        self,
+        items: list[dict],
+        toc_context: str
+    ) -> list[LlmResolution]:
+        """Return deterministic selections for a batch.
+
+        Args:
+            self: Resolver instance.
+            items: Ambiguity items.
+            toc_context: TOC context for all items.
+        """
+
+        self.batch_calls += 1
+        self.batch_sizes.append(len(items))
+        return [
+            LlmResolution(
+                selected_path = self.selected_paths[index],
+                confidence = self.confidence,
+                reason = "test"
+            )
+            for index in range(len(items))
+        ]
+
+
+class FakeAsyncResolver:
+    """Fake coroutine-based resolver tracking peak concurrency."""
+
+    def __init__(self, confidence: float) -> None:
+        self.confidence = confidence
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def resolve_toc_ambiguity(
+        self,
+        link_text: str,
+        raw_target: str,
+        candidate_paths: list[str],
+        toc_context: str
+    ) -> LlmResolution:
+        """Select the last candidate after yielding to the loop.
+
+        Args:
+            self: Resolver instance.
+            link_text: Link text.
+            raw_target: Raw target text.
+            candidate_paths: Candidate path list.
+            toc_context: Nearby TOC context.
+        """
+
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return LlmResolution(
+            selected_path = candidate_paths[-1],
+            confidence = self.confidence,
+            reason = "test"
+        )
+
+
 class TestOrchestrationPlanner(unittest.TestCase):
     """Tests for TOC-aware orchestration planner."""
 
@@ -158,6 +235,44 @@ class TestOrchestrationPlanner(unittest.TestCase):
         )
         self.assertEqual(manifest.toc_links, 0)
 
+    def test_toc_links_inside_fenced_code_are_ignored(self) -> None:
+        """Link syntax inside fenced code blocks should not drive ordering.
+
+        Args:
+            self: Test case instance.
+        """
+
+        toc = (
+            "# TOC\n"
+            "```markdown\n"
+            "- [Example](./b.md)\n"
+            "```\n"
+            "- [A](./a.md)\n"
+            "    - [B](./b.md)\n"
+        )
+        docs = {
+            "TABLE_OF_CONTENTS.md": self._doc(path = "TABLE_OF_CONTENTS.md", markdown = toc),
+            "a.md": self._doc(path = "a.md"),
+            "b.md": self._doc(path = "b.md")
+        }
+        source = PlannerSource(
+            docs = docs,
+            paths = list(docs.keys())
+        )
+        planner = OrchestrationPlanner(source_adapter = source)
+
+        manifest = planner.build_manifest(
+            markdown_paths = source.list_markdown(),
+            llm_fallback = "off",
+            llm_max_calls = 0
+        )
+
+        self.assertEqual(
+            [item.path for item in manifest.items[:2]],
+            ["a.md", "b.md"]
+        )
+        self.assertEqual(manifest.toc_links, 2)
+
     def test_toc_link_supports_docx_target(self) -> None:
         """TOC parsing should support .docx links."""
 
@@ -190,6 +305,71 @@ class TestOrchestrationPlanner(unittest.TestCase):
         self.assertEqual(manifest.toc_links, 2)
         self.assertEqual(manifest.matched_links, 2)
 
+    def test_toc_content_cached_until_invalidated(self) -> None:
+        """Repeated manifest builds should reuse the TOC read.
+
+        Args:
+            self: Test case instance.
+        """
+
+        toc = "# TOC\n- [A](./a.md)\n"
+        docs = {
+            "TABLE_OF_CONTENTS.md": self._doc(path = "TABLE_OF_CONTENTS.md", markdown = toc),
+            "a.md": self._doc(path = "a.md")
+        }
+        source = PlannerSource(
+            docs = docs,
+            paths = ["TABLE_OF_CONTENTS.md", "a.md"]
+        )
+        planner = OrchestrationPlanner(source_adapter = source)
+
+        for _ in range(2):
+            planner.build_manifest(
+                markdown_paths = source.list_markdown(),
+                llm_fallback = "off",
+                llm_max_calls = 0
+            )
+        self.assertEqual(source.read_count, 1)
+
+        planner.invalidate_toc_cache()
+        planner.build_manifest(
+            markdown_paths = source.list_markdown(),
+            llm_fallback = "off",
+            llm_max_calls = 0
+        )
+        self.assertEqual(source.read_count, 2)
+
+    def test_seeded_toc_content_skips_source_read(self) -> None:
+        """TOC content read ahead of planning should be used without re-reading.
+
+        Args:
+            self: Test case instance.
+        """
+
+        docs = {
+            "TABLE_OF_CONTENTS.md": self._doc(path = "TABLE_OF_CONTENTS.md", markdown = "stale"),
+            "a.md": self._doc(path = "a.md"),
+            "b.md": self._doc(path = "b.md")
+        }
+        source = PlannerSource(
+            docs = docs,
+            paths = ["TABLE_OF_CONTENTS.md", "a.md", "b.md"]
+        )
+        planner = OrchestrationPlanner(source_adapter = source)
+        planner.seed_toc_cache(
+            toc_path = "./TABLE_OF_CONTENTS.md",
+            content = "# TOC\n- [B](./b.md)\n"
+        )
+
+        manifest = planner.build_manifest(
+            markdown_paths = source.list_markdown(),
+            llm_fallback = "off",
+            llm_max_calls = 0
+        )
+
+        self.assertEqual(source.read_count, 0)
+        self.assertEqual(manifest.items[0].path, "b.md")
+
     def test_llm_fallback_resolves_ambiguous_toc_link_with_call_cap(self) -> None:
         """Ambiguous TOC targets should use LLM fallback within call cap.
 
@@ -233,6 +413,191 @@ class TestOrchestrationPlanner(unittest.TestCase):
         self.assertEqual(manifest.llm_calls, 1)
         self.assertLessEqual(resolver.calls, 1)
 
+    def test_llm_batch_resolves_all_ambiguous_links_in_one_call(self) -> None:
+        """Batch-capable resolvers should settle all ambiguities in one call.
+
+        Args:
+            self: Test case instance.
+        """
+
+        toc = (
+            "# TOC\n"
+            "- [Intro](./intro.md)\n"
+            "- [Setup](./setup.md)\n"
+        )
+        docs = {
+            "TABLE_OF_CONTENTS.md": self._doc(path = "TABLE_OF_CONTENTS.md", markdown = toc),
+            "part1/intro.md": self._doc(path = "part1/intro.md"),
+            "part2/intro.md": self._doc(path = "part2/intro.md"),
+            "part1/setup.md": self._doc(path = "part1/setup.md"),
+            "part2/setup.md": self._doc(path = "part2/setup.md")
+        }
+        source = PlannerSource(
+            docs = docs,
+            paths = list(docs.keys())
+        )
+        resolver = FakeBatchResolver(
+            selected_paths = ["part2/intro.md", "part1/setup.md"],
+            confidence = 0.9
+        )
+        planner = OrchestrationPlanner(
+            source_adapter = source,
+            llm_resolver = resolver
+        )
+
+        manifest = planner.build_manifest(
+            markdown_paths = source.list_markdown(),
+            structure_order = "toc_first",
+            toc_file = "TABLE_OF_CONTENTS.md",
+            llm_fallback = "toc_ambiguity",
+            llm_max_calls = 1
+        )
+
+        self.assertEqual(
+            [item.path for item in manifest.items[:2]],
+            ["part2/intro.md", "part1/setup.md"]
+        )
+        self.assertEqual(manifest.llm_calls, 1)
+        self.assertEqual(resolver.batch_calls, 1)
+        self.assertEqual(resolver.batch_sizes, [2])
+        self.assertEqual(resolver.calls, 0)
+        self.assertEqual(len(manifest.unresolved_links), 0)
+
+    def test_llm_resolutions_persisted_and_reused_across_planners(self) -> None:
+        """Cached LLM resolutions should skip LLM calls on unchanged input.
+
+        Args:
+            self: Test case instance.
+        """
+
+        toc = (
+            "# TOC\n"
+            "- [Intro](./intro.md)\n"
+        )
+        docs = {
+            "TABLE_OF_CONTENTS.md": self._doc(path = "TABLE_OF_CONTENTS.md", markdown = toc),
+            "part1/intro.md": self._doc(path = "part1/intro.md"),
+            "part2/intro.md": self._doc(path = "part2/intro.md")
+        }
+        source = PlannerSource(
+            docs = docs,
+            paths = list(docs.keys())
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = os.path.join(temp_dir, "llm_cache.json")
+            manifests = []
+            resolvers = []
+            for _ in range(2):
+                resolver = FakeResolver(
+                    selected_path = "part2/intro.md",
+                    confidence = 0.9
+                )
+                planner = OrchestrationPlanner(
+                    source_adapter = source,
+                    llm_resolver = resolver,
+                    llm_cache_path = cache_path
+                )
+                manifests.append(
+                    planner.build_manifest(
+                        markdown_paths = source.list_markdown(),
+                        llm_fallback = "toc_ambiguity",
+                        llm_max_calls = 3
+                    )
+                )
+                resolvers.append(resolver)
+
+        self.assertEqual(resolvers[0].calls, 1)
+        self.assertEqual(manifests[0].llm_cache_hits, 0)
+        self.assertEqual(resolvers[1].calls, 0)
+        self.assertEqual(manifests[1].llm_calls, 0)
+        self.assertEqual(manifests[1].llm_cache_hits, 1)
+        self.assertEqual(manifests[1].items[0].path, "part2/intro.md")
+
+    def test_async_resolver_runs_calls_concurrently_within_cap(self) -> None:
+        """Async resolvers should be fanned out under the concurrency bound.
+
+        Args:
+            self: Test case instance.
+        """
+
+        toc = (
+            "# TOC\n"
+            "- [A](./a.md)\n"
+            "- [B](./b.md)\n"
+            "- [C](./c.md)\n"
+        )
+        docs = {
+            "TABLE_OF_CONTENTS.md": self._doc(path = "TABLE_OF_CONTENTS.md", markdown = toc)
+        }
+        for name in ("a", "b", "c"):
+            for part in ("part1", "part2"):
+                path = f"{part}/{name}.md"
+                docs[path] = self._doc(path = path)
+        source = PlannerSource(
+            docs = docs,
+            paths = list(docs.keys())
+        )
+        resolver = FakeAsyncResolver(confidence = 0.9)
+        planner = OrchestrationPlanner(
+            source_adapter = source,
+            llm_resolver = resolver,
+            llm_max_concurrency = 2
+        )
+
+        manifest = planner.build_manifest(
+            markdown_paths = source.list_markdown(),
+            structure_order = "toc_first",
+            toc_file = "TABLE_OF_CONTENTS.md",
+            llm_fallback = "toc_ambiguity",
+            llm_max_calls = 2
+        )
+
+        self.assertEqual(
+            [item.path for item in manifest.items[:2]],
+            ["part2/a.md", "part2/b.md"]
+        )
+        self.assertEqual(manifest.llm_calls, 2)
+        self.assertEqual(resolver.calls, 2)
+        self.assertEqual(resolver.peak_in_flight, 2)
+        self.assertTrue(
+            any("llm_limit_exceeded" in line for line in manifest.unresolved_links)
+        )
+
+    def test_fuzzy_match_resolves_typo_toc_target_without_llm(self) -> None:
+        """Near-miss TOC basenames should match by edit distance.
+
+        Args:
+            self: Test case instance.
+        """
+
+        toc = (
+            "# TOC\n"
+            "- [Start](./getting_stared.md)\n"
+            "- [Other](./unrelated.md)\n"
+        )
+        docs = {
+            "TABLE_OF_CONTENTS.md": self._doc(path = "TABLE_OF_CONTENTS.md", markdown = toc),
+            "getting_started.md": self._doc(path = "getting_started.md"),
+            "zeta.md": self._doc(path = "zeta.md")
+        }
+        source = PlannerSource(
+            docs = docs,
+            paths = list(docs.keys())
+        )
+        planner = OrchestrationPlanner(source_adapter = source)
+
+        manifest = planner.build_manifest(
+            markdown_paths = source.list_markdown(),
+            llm_fallback = "off",
+            llm_max_calls = 0
+        )
+
+        self.assertEqual(manifest.items[0].path, "getting_started.md")
+        self.assertEqual(manifest.matched_links, 1)
+        self.assertEqual(len(manifest.unresolved_links), 1)
+        self.assertIn("no_match", manifest.unresolved_links[0])
+
     def test_root_readme_kept_by_default(self) -> None:
         """Root README should be included by default.
 
@@ -1,14 +1,19 @@
+import os
 import unittest
 
 from unittest import mock
 
 from config.config import AppConfig
+from data.models import AssetRef
 from data.models import CreatedDocRecord
 from data.models import DocumentPlanItem
 from data.models import ImportFailure
 from data.models import ImportManifest
 from data.models import SourceDocument
 from core.orchestrator import ImportOrchestrator
+from core.orchestrator import InMemorySourceAdapter
+from core.orchestrator import _process_group_worker
+from core.orchestrator import _worker_init
 from utils.markdown_processor import MarkdownProcessor
 
 
@@ -183,6 +188,42 @@ class FakeMedia:
         return "token123"
 
 
+class FlakyMedia(FakeMedia):
+    """Fake media uploader failing for one block."""
+
+    def upload_to_node(self, asset, parent_node: str) -> str:
+        """Return a block-specific token or fail for blk_bad.
+
+        Args:
+            self: Fake media.
+            asset: Asset reference.
+            parent_node: Destination node token.
+        """
+
+        if parent_node == "blk_bad":
+            raise RuntimeError("upload failed")
+        return f"tok_{parent_node}"
+
+
+class BatchImageDocWriter(FakeDocWriter):
+    """Fake writer recording batched image replacements."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = []
+
+    def batch_replace_images(self, document_id: str, replacements) -> None:
+        """Record one batch call.
+
+        Args:
+            self: Fake writer.
+            document_id: Document id.
+            replacements: Ordered (block_id, file_token) pairs.
+        """
+
+        self.batches.append((document_id, list(replacements)))
+
+
 class FakeWiki:
     """Fake wiki service."""
 
@@ -223,6 +264,27 @@ class FakeWiki:
         return "node1"
 
 
+class RecordingWiki(FakeWiki):
+    """Fake wiki recording move order."""
+
+    def __init__(self) -> None:
+        self.moved_titles = []
+
+    def move_doc_to_wiki(self, space_id: str, document_id: str, parent_node_token: str, title: str) -> str:
+        """Record moved title and return deterministic node token.
+
+        Args:
+            self: Fake wiki.
+            space_id: Space id.
+            document_id: Document id.
+            parent_node_token: Parent token.
+            title: Node title.
+        """
+
+        self.moved_titles.append(title)
+        return f"node_{title}"
+
+
 class FakeNotify:
     """Fake notify service."""
 
@@ -595,6 +657,215 @@ class TestImportOrchestrator(unittest.TestCase):
         self.assertEqual(result.failures[0].path, "bad.md")
         self.assertTrue(len(notify.messages) >= 2)
 
+    def test_progress_notifications_coalesced_between_alerts(self) -> None:
+        """Per-document progress should be batched while failures flush immediately.
+
+        Args:
+            self: Test case instance.
+        """
+
+        config = AppConfig(
+            feishu_base_url = "https://open.feishu.cn",
+            feishu_webhook_url = "https://example.com/webhook",
+            feishu_app_id = "w",
+            feishu_app_secret = "w",
+            feishu_user_access_token = "",
+            feishu_user_refresh_token = "",
+            feishu_user_token_cache_path = "cache/user_token.json",
+            feishu_folder_token = "",
+            request_timeout = 30,
+            max_retries = 1,
+            retry_backoff = 0.1,
+            image_url_template = "https://example.com/{token}",
+            feishu_message_max_bytes = 18000,
+            feishu_convert_max_bytes = 45000,
+            notify_level = "normal"
+        )
+
+        notify = FakeNotify()
+        orchestrator = ImportOrchestrator(
+            source_adapter = FakeSource(),
+            markdown_processor = MarkdownProcessor(),
+            config = config,
+            doc_writer = FakeDocWriter(),
+            media_service = FakeMedia(),
+            wiki_service = FakeWiki(),
+            notify_service = notify
+        )
+
+        result = orchestrator.run(
+            space_name = "demo",
+            space_id = "",
+            chat_id = "chat1",
+            dry_run = False,
+            notify_level = "normal",
+            write_mode = "both",
+            folder_nav_doc = False
+        )
+
+        self.assertEqual(result.failed, 1)
+        progress_messages = [
+            message for _, message in notify.messages
+            if "正在写入" in message or "写入完成" in message
+        ]
+        self.assertEqual(
+            [len(message.splitlines()) for message in progress_messages],
+            [1, 2]
+        )
+        failure_index = next(
+            index for index, (_, message) in enumerate(notify.messages)
+            if message.startswith("写入失败")
+        )
+        self.assertLess(notify.messages.index(("chat1", progress_messages[0])), failure_index)
+
+    def test_image_uploads_batched_in_block_order_skipping_failures(self) -> None:
+        """Uploads run in parallel and feed one ordered batch replacement.
+
+        Args:
+            self: Test case instance.
+        """
+
+        config = AppConfig(
+            feishu_base_url = "https://open.feishu.cn",
+            feishu_webhook_url = "",
+            feishu_app_id = "w",
+            feishu_app_secret = "w",
+            feishu_user_access_token = "",
+            feishu_user_refresh_token = "",
+            feishu_user_token_cache_path = "cache/user_token.json",
+            feishu_folder_token = "",
+            request_timeout = 30,
+            max_retries = 1,
+            retry_backoff = 0.1,
+            image_url_template = "https://example.com/{token}",
+            feishu_message_max_bytes = 18000,
+            feishu_convert_max_bytes = 45000,
+            notify_level = "none",
+            media_concurrency = 3
+        )
+        writer = BatchImageDocWriter()
+        orchestrator = ImportOrchestrator(
+            source_adapter = FakeSource(),
+            markdown_processor = MarkdownProcessor(),
+            config = config,
+            doc_writer = writer,
+            media_service = FlakyMedia(),
+            wiki_service = None,
+            notify_service = None
+        )
+        asset = AssetRef(
+            original_url = "./a.png",
+            resolved_url = "/tmp/a.png"
+        )
+
+        orchestrator._upload_and_replace_images(
+            document_id = "doc_1",
+            pending_images = [
+                ("blk_1", asset),
+                ("blk_bad", asset),
+                ("blk_2", asset),
+                ("blk_3", asset)
+            ]
+        )
+
+        self.assertEqual(
+            writer.batches,
+            [("doc_1", [("blk_1", "tok_blk_1"), ("blk_2", "tok_blk_2"), ("blk_3", "tok_blk_3")])]
+        )
+
+    def test_asset_lookup_matches_normalized_relative_path(self) -> None:
+        """Equivalent relative paths should beat a shared basename.
+
+        Args:
+            self: Test case instance.
+        """
+
+        orchestrator = ImportOrchestrator.__new__(ImportOrchestrator)
+        first = AssetRef(original_url = "./x/image.png", resolved_url = "/src/x/image.png")
+        second = AssetRef(original_url = "./img/../y/image.png", resolved_url = "/src/y/image.png")
+        lookup = orchestrator._build_asset_lookup(assets = [first, second])
+
+        self.assertIs(
+            orchestrator._find_asset_by_image_url(image_url = "y/image.png", asset_lookup = lookup),
+            second
+        )
+        self.assertIs(
+            orchestrator._find_asset_by_image_url(image_url = "./x/%69mage.png", asset_lookup = lookup),
+            first
+        )
+
+    def test_image_replace_follows_each_upload_without_batch_support(self) -> None:
+        """Writers without batch replace get one replace_image per uploaded block.
+
+        Args:
+            self: Test case instance.
+        """
+
+        config = AppConfig(
+            feishu_base_url = "https://open.feishu.cn",
+            feishu_webhook_url = "",
+            feishu_app_id = "w",
+            feishu_app_secret = "w",
+            feishu_user_access_token = "",
+            feishu_user_refresh_token = "",
+            feishu_user_token_cache_path = "cache/user_token.json",
+            feishu_folder_token = "",
+            request_timeout = 30,
+            max_retries = 1,
+            retry_backoff = 0.1,
+            image_url_template = "https://example.com/{token}",
+            feishu_message_max_bytes = 18000,
+            feishu_convert_max_bytes = 45000,
+            notify_level = "none",
+            media_concurrency = 3
+        )
+        writer = FakeDocWriter()
+        orchestrator = ImportOrchestrator(
+            source_adapter = FakeSource(),
+            markdown_processor = MarkdownProcessor(),
+            config = config,
+            doc_writer = writer,
+            media_service = FlakyMedia(),
+            wiki_service = None,
+            notify_service = None
+        )
+        asset = AssetRef(
+            original_url = "./a.png",
+            resolved_url = "/tmp/a.png"
+        )
+
+        with mock.patch.object(writer, "replace_image") as replace_mock:
+            orchestrator._upload_and_replace_images(
+                document_id = "doc_1",
+                pending_images = [("blk_1", asset), ("blk_bad", asset), ("blk_2", asset)]
+            )
+
+        self.assertEqual(
+            sorted(call.kwargs["block_id"] for call in replace_mock.call_args_list),
+            ["blk_1", "blk_2"]
+        )
+
+    def test_asset_lookup_keeps_first_asset_for_shared_basename(self) -> None:
+        """Shared basenames should not let later assets overwrite earlier ones.
+
+        Args:
+            self: Test case instance.
+        """
+
+        orchestrator = ImportOrchestrator.__new__(ImportOrchestrator)
+        first = AssetRef(original_url = "./a/image.png", resolved_url = "/src/a/image.png")
+        second = AssetRef(original_url = "./b/image.png", resolved_url = "/src/b/image.png")
+        lookup = orchestrator._build_asset_lookup(assets = [first, second])
+
+        self.assertIs(
+            orchestrator._find_asset_by_image_url(image_url = "image.png", asset_lookup = lookup),
+            first
+        )
+        self.assertIs(
+            orchestrator._find_asset_by_image_url(image_url = "/src/b/image.png", asset_lookup = lookup),
+            second
+        )
+
     def test_folder_subdirs_create_docs_in_relative_folders(self) -> None:
         """Folder hierarchy mode should route docs into created subfolders.
 
@@ -721,6 +992,120 @@ class TestImportOrchestrator(unittest.TestCase):
             ["batch_001", "batch_001/part-a"]
         )
 
+    def test_sequential_import_resolves_each_folder_once(self) -> None:
+        """Sibling docs should share one ensure_folder_path call per directory.
+
+        Args:
+            self: Test case instance.
+        """
+
+        config = AppConfig(
+            feishu_base_url = "https://open.feishu.cn",
+            feishu_webhook_url = "",
+            feishu_app_id = "w",
+            feishu_app_secret = "w",
+            feishu_user_access_token = "",
+            feishu_user_refresh_token = "",
+            feishu_user_token_cache_path = "cache/user_token.json",
+            feishu_folder_token = "fld_x",
+            request_timeout = 30,
+            max_retries = 1,
+            retry_backoff = 0.1,
+            image_url_template = "https://example.com/{token}",
+            feishu_message_max_bytes = 18000,
+            feishu_convert_max_bytes = 45000,
+            notify_level = "none"
+        )
+        writer = FakeDocWriter()
+        docs_by_path = {
+            path: SourceDocument(
+                path = path,
+                title = path,
+                markdown = f"# {path}",
+                assets = [],
+                relative_dir = path.rsplit("/", 1)[0],
+                base_ref = "/tmp",
+                source_type = "local"
+            )
+            for path in ["a/1.md", "a/2.md", "b/3.md"]
+        }
+        orchestrator = ImportOrchestrator(
+            source_adapter = InMemorySourceAdapter(
+                docs_by_path = docs_by_path,
+                ordered_paths = list(docs_by_path)
+            ),
+            markdown_processor = MarkdownProcessor(),
+            config = config,
+            doc_writer = writer,
+            media_service = FakeMedia(),
+            wiki_service = None,
+            notify_service = None
+        )
+
+        result = orchestrator.run(
+            space_name = "",
+            space_id = "",
+            chat_id = "",
+            dry_run = False,
+            notify_level = "none",
+            write_mode = "folder",
+            folder_subdirs = True,
+            folder_root_subdir = False,
+            structure_order = "path",
+            folder_nav_doc = False
+        )
+
+        self.assertEqual(result.success, 3)
+        self.assertEqual(writer.ensure_calls, ["a", "b"])
+        self.assertEqual(
+            [folder_token for _, folder_token in writer.created],
+            ["folder_a", "folder_a", "folder_b"]
+        )
+
+    def test_wiki_parent_lookup_memoized_per_space(self) -> None:
+        """Repeated wiki parent lookups should reuse the first resolved token.
+
+        Args:
+            self: Test case instance.
+        """
+
+        config = AppConfig(
+            feishu_base_url = "https://open.feishu.cn",
+            feishu_webhook_url = "",
+            feishu_app_id = "w",
+            feishu_app_secret = "w",
+            feishu_user_access_token = "",
+            feishu_user_refresh_token = "",
+            feishu_user_token_cache_path = "cache/user_token.json",
+            feishu_folder_token = "fld_x",
+            request_timeout = 30,
+            max_retries = 1,
+            retry_backoff = 0.1,
+            image_url_template = "https://example.com/{token}",
+            feishu_message_max_bytes = 18000,
+            feishu_convert_max_bytes = 45000,
+            notify_level = "none"
+        )
+        wiki = mock.Mock()
+        wiki.ensure_path_nodes.side_effect = lambda space_id, relative_dir: f"{space_id}:{relative_dir}"
+        orchestrator = ImportOrchestrator(
+            source_adapter = OrderedSource(),
+            markdown_processor = MarkdownProcessor(),
+            config = config,
+            doc_writer = FakeDocWriter(),
+            media_service = FakeMedia(),
+            wiki_service = wiki,
+            notify_service = None
+        )
+
+        tokens = [
+            orchestrator._ensure_wiki_parent(space_id = space_id, relative_dir = "a/b")
+            for space_id in ["s1", "s1", "s2"]
+        ]
+
+        self.assertEqual(tokens, ["s1:a/b", "s1:a/b", "s2:a/b"])
+        self.assertEqual(wiki.ensure_path_nodes.call_count, 2)
+
     def test_folder_root_subdir_without_subdirs(self) -> None:
         """Folder root subdir should hold all docs when subdirs are disabled.
 
@@ -1079,6 +1464,61 @@ class TestImportOrchestrator(unittest.TestCase):
             ["Chapter 1", "Chapter 2"]
         )
 
+    def test_doc_workers_keep_wiki_move_order_and_results(self) -> None:
+        """Threaded document import should keep manifest order for wiki moves.
+
+        Args:
+            self: Test case instance.
+        """
+
+        config = AppConfig(
+            feishu_base_url = "https://open.feishu.cn",
+            feishu_webhook_url = "",
+            feishu_app_id = "w",
+            feishu_app_secret = "w",
+            feishu_user_access_token = "",
+            feishu_user_refresh_token = "",
+            feishu_user_token_cache_path = "cache/user_token.json",
+            feishu_folder_token = "fld_x",
+            request_timeout = 30,
+            max_retries = 1,
+            retry_backoff = 0.1,
+            image_url_template = "https://example.com/{token}",
+            feishu_message_max_bytes = 18000,
+            feishu_convert_max_bytes = 45000,
+            notify_level = "none"
+        )
+        wiki = RecordingWiki()
+        orchestrator = ImportOrchestrator(
+            source_adapter = OrderedSource(),
+            markdown_processor = MarkdownProcessor(),
+            config = config,
+            doc_writer = RecordingDocWriter(),
+            media_service = FakeMedia(),
+            wiki_service = wiki,
+            notify_service = None
+        )
+
+        result = orchestrator.run(
+            space_name = "demo",
+            space_id = "",
+            chat_id = "",
+            dry_run = False,
+            notify_level = "none",
+            write_mode = "both",
+            structure_order = "path",
+            folder_nav_doc = False,
+            doc_workers = 2
+        )
+
+        self.assertEqual(result.success, 2)
+        self.assertEqual(result.failed, 0)
+        self.assertEqual(wiki.moved_titles, ["Chapter 1", "Chapter 2"])
+        self.assertEqual(
+            [item.path for item in result.created_docs],
+            ["a/ch1.md", "b/ch2.md"]
+        )
+
     def test_folder_navigation_doc_contains_link_or_doc_id(self) -> None:
         """Folder navigation doc should prefer URL and fallback to document_id.
 
@@ -1566,7 +2006,7 @@ class TestImportOrchestrator(unittest.TestCase):
         ), mock.patch(
             "core.orchestrator.ProcessPoolExecutor",
             return_value = fake_executor
-        ), mock.patch(
+        ) as pool_cls, mock.patch(
             "core.orchestrator.as_completed",
             return_value = [future_success, future_failure]
         ):
@@ -1587,6 +2027,85 @@ class TestImportOrchestrator(unittest.TestCase):
         self.assertEqual(len(outcome["created_docs"]), 1)
         self.assertEqual(len(outcome["failures"]), 1)
         self.assertEqual(outcome["failures"][0].path, "group:b")
+        pool_kwargs = pool_cls.call_args.kwargs
+        self.assertIs(pool_kwargs["initializer"], _worker_init)
+        self.assertEqual(pool_kwargs["initargs"][1:4], ("folder", 2, 1))
+        submitted_payload = fake_executor.submit.call_args_list[0].args[1]
+        self.assertNotIn("config", submitted_payload)
+        self.assertEqual(
+            submitted_payload["docs"],
+            [("a/ch1.md", "Chapter 1", (0, len("# Chapter 1")), "a", "/tmp", "local", "folder_a", "")]
+        )
+        self.assertFalse(os.path.exists(pool_kwargs["initargs"][4]))
+
+    def test_group_worker_threads_keep_order_and_wiki_sequence(self) -> None:
+        """Threaded group worker should keep path order for results and wiki moves.
+
+        Args:
+            self: Test case instance.
+        """
+
+        config = AppConfig(
+            feishu_base_url = "https://open.feishu.cn",
+            feishu_webhook_url = "",
+            feishu_app_id = "w",
+            feishu_app_secret = "w",
+            feishu_user_access_token = "",
+            feishu_user_refresh_token = "",
+            feishu_user_token_cache_path = "cache/user_token.json",
+            feishu_folder_token = "fld_x",
+            request_timeout = 30,
+            max_retries = 1,
+            retry_backoff = 0.1,
+            image_url_template = "https://example.com/{token}",
+            feishu_message_max_bytes = 18000,
+            feishu_convert_max_bytes = 45000,
+            notify_level = "none"
+        )
+        wiki = RecordingWiki()
+        record_move = wiki.move_doc_to_wiki
+
+        def _move_or_fail(space_id: str, document_id: str, parent_node_token: str, title: str) -> str:
+            if document_id == "doc_bad":
+                raise RuntimeError("wiki move failed")
+            return record_move(
+                space_id = space_id,
+                document_id = document_id,
+                parent_node_token = parent_node_token,
+                title = title
+            )
+
+        wiki.move_doc_to_wiki = _move_or_fail
+        worker_ctx = {
+            "config": config,
+            "write_wiki": True,
+            "doc_workers": 3,
+            "doc_writer": FakeDocWriter(),
+            "media_service": FakeMedia(),
+            "wiki_service": wiki,
+            "markdown_processor": MarkdownProcessor(),
+            "markdown_spool": None
+        }
+        paths = ["a/ch1.md", "a/bad.md", "a/ch2.md", "a/ch3.md"]
+        payload = {
+            "group_key": "a",
+            "docs": [
+                (path, path.rsplit("/", 1)[1][:-3], (0, 0), "a", "", "local", "", "")
+                for path in paths
+            ],
+            "space_id": "space1"
+        }
+
+        with mock.patch("core.orchestrator._WORKER_CTX", worker_ctx):
+            outcome = _process_group_worker(payload)
+
+        self.assertEqual(outcome["success"], 3)
+        self.assertEqual([item["path"] for item in outcome["failures"]], ["a/bad.md"])
+        self.assertEqual(
+            [item["path"] for item in outcome["created_docs"]],
+            ["a/ch1.md", "a/ch2.md", "a/ch3.md"]
+        )
+        self.assertEqual(wiki.moved_titles, ["ch1", "ch2", "ch3"])
 
     def test_group_items_by_top_dir(self) -> None:
         """Top directory grouping should keep first-seen group order.
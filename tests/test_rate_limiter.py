@@ -0,0 +1,81 @@
+import unittest
+
+from unittest import mock
+
+from utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock that only advances when sleep is called."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        """Return current fake time.
+
+        Args:
+            self: Clock instance.
+        """
+
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Advance fake time.
+
+        Args:
+            self: Clock instance.
+            seconds: Seconds to advance.
+        """
+
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Tests for adaptive token bucket pacing."""
+
+    def setUp(self) -> None:
+        """Patch the limiter clock.
+
+        Args:
+            self: Test case instance.
+        """
+
+        self.clock = FakeClock()
+        patcher = mock.patch("utils.rate_limiter.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_acquire_paces_after_burst(self) -> None:
+        """Requests beyond the burst should wait one interval each.
+
+        Args:
+            self: Test case instance.
+        """
+
+        limiter = RateLimiter(rate_per_sec = 10, burst = 2)
+        for _ in range(4):
+            limiter.acquire()
+
+        self.assertAlmostEqual(self.clock.now, 0.2)
+
+    def test_throttle_halves_rate_then_recovers(self) -> None:
+        """A 429 should halve the rate, and granted requests ramp it back.
+
+        Args:
+            self: Test case instance.
+        """
+
+        limiter = RateLimiter(rate_per_sec = 10, burst = 1)
+        limiter.on_throttled()
+        limiter.on_throttled()
+        self.assertAlmostEqual(limiter.rate, 2.5)
+
+        for _ in range(100):
+            limiter.acquire()
+
+        self.assertEqual(limiter.rate, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
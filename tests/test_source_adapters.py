@@ -39,6 +39,25 @@ class TestLocalSourceAdapter(unittest.TestCase):
             self.assertEqual(doc.title, "Demo")
             self.assertEqual(doc.relative_dir, "a")
 
+    def test_read_many_keeps_order_and_reports_failures_in_place(self) -> None:
+        """Batch reads should align with input paths and not abort on one error.
+
+        Args:
+            self: Test case instance.
+        """
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a.md").write_text("# A\n", encoding = "utf-8")
+            (root / "b.md").write_text("# B\n", encoding = "utf-8")
+
+            adapter = LocalSourceAdapter(root_path = str(root))
+            loaded = adapter.read_many(relative_paths = ["b.md", "missing.md", "a.md"])
+
+            self.assertEqual(loaded[0].title, "B")
+            self.assertIsInstance(loaded[1], FileNotFoundError)
+            self.assertEqual(loaded[2].title, "A")
+
     def test_list_and_read_markdown_single_file_mode(self) -> None:
         """Should support importing one local markdown file directly.
 
@@ -2,6 +2,8 @@ import io
 import json
 import time
 import uuid
+import threading
+import http.client
 import urllib.error
 import urllib.parse
 import urllib.request
@@ -10,6 +12,18 @@ from dataclasses import dataclass
 from typing import Dict, Optional
 
 from core.exceptions import HttpRequestError
+from utils.rate_limiter import RateLimiter
+
+
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+# Errors meaning the server dropped an idle keep-alive socket before replying.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError
+)
 
 
 @dataclass
@@ -64,11 +78,16 @@ class HttpResponse:
 class HttpClient:
     """HTTP client with retry and JSON utilities.
 
+    Direct (non-proxied) http/https requests reuse one keep-alive connection
+    per host and thread; proxied hosts and redirects go through urllib.
+
     Args:
         timeout: Request timeout in seconds.
         max_retries: Number of retries for temporary failures.
         retry_backoff: Backoff multiplier used between retries.
         user_agent: User agent value sent in each request.
+        keep_alive: Whether to reuse persistent connections for direct hosts.
+        rate_limiter: Optional limiter paced before every attempt and slowed on HTTP 429.
     """
 
     def __init__(
@@ -76,12 +95,21 @@ class HttpClient:
         timeout: float = 30.0,
         max_retries: int = 3,
         retry_backoff: float = 1.0,
-        user_agent: str = "knowledge-generator/1.0"
+        user_agent: str = "knowledge-generator/1.0",
+        keep_alive: bool = True,
+        rate_limiter: Optional[RateLimiter] = None
     ) -> None:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
         self.user_agent = user_agent
+        self.keep_alive = keep_alive
+        self.rate_limiter = rate_limiter
+        self._proxies = urllib.request.getproxies()
+        self._proxy_bypass_by_host: dict[str, bool] = {}
+        self._local = threading.local()
+        self._connections_lock = threading.Lock()
+        self._open_connections: set[http.client.HTTPConnection] = set()
 
     def request(
         self,
@@ -125,9 +153,41 @@ class HttpClient:
             payload = urllib.parse.urlencode(data).encode("utf-8")
             request_headers["Content-Type"] = "application/x-www-form-urlencoded"
 
+        pooled_target = self._pooled_target(url = final_url) if self.keep_alive else None
         attempts = 0
         while True:
             attempts += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            if pooled_target is not None:
+                try:
+                    response = self._send_pooled(
+                        target = pooled_target,
+                        method = method.upper(),
+                        payload = payload,
+                        headers = request_headers
+                    )
+                except (http.client.HTTPException, OSError) as exc:
+                    if self._should_retry(status_code = 503, attempts = attempts):
+                        self._sleep(attempts = attempts)
+                        continue
+                    raise HttpRequestError(
+                        f"Network error for {method.upper()} {final_url}: {exc}"
+                    ) from exc
+                if response.status_code == 429:
+                    self._on_throttled()
+                if response.status_code in _REDIRECT_STATUSES:
+                    # Let urllib follow redirects for this request.
+                    pooled_target = None
+                elif response.status_code < 400 or response.status_code in allow_status:
+                    return response
+                elif self._should_retry(status_code = response.status_code, attempts = attempts):
+                    self._sleep(attempts = attempts)
+                    continue
+                else:
+                    raise HttpRequestError(
+                        f"HTTP {response.status_code} for {method.upper()} {final_url}: {response.text}"
+                    )
             try:
                 req = urllib.request.Request(
                     final_url,
@@ -149,6 +209,8 @@ class HttpClient:
             except urllib.error.HTTPError as exc:
                 body = exc.read()
                 status_code = int(exc.code)
+                if status_code == 429:
+                    self._on_throttled()
                 if status_code in allow_status:
                     return HttpResponse(
                         status_code = status_code,
@@ -169,6 +231,113 @@ class HttpClient:
                     f"Network error for {method.upper()} {final_url}: {exc.reason}"
                 ) from exc
 
+    def close(self) -> None:
+        """Close every pooled keep-alive connection.
+
+        Args:
+            None
+        """
+
+        with self._connections_lock:
+            connections = list(self._open_connections)
+            self._open_connections.clear()
+        for connection in connections:
+            connection.close()
+
+    def _pooled_target(self, url: str) -> Optional[tuple[str, str, str]]:
+        """Return (scheme, netloc, path) when url can use a pooled connection.
+
+        Args:
+            url: Final request url including query.
+        """
+
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname or parts.username:
+            return None
+        if parts.scheme in self._proxies and not self._bypasses_proxy(host = parts.hostname):
+            return None
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        return parts.scheme, parts.netloc, path
+
+    def _bypasses_proxy(self, host: str) -> bool:
+        """Check and cache whether host is excluded from env proxies.
+
+        Args:
+            host: Target hostname.
+        """
+
+        bypass = self._proxy_bypass_by_host.get(host)
+        if bypass is None:
+            bypass = bool(urllib.request.proxy_bypass(host))
+            self._proxy_bypass_by_host[host] = bypass
+        return bypass
+
+    def _send_pooled(
+        self,
+        target: tuple[str, str, str],
+        method: str,
+        payload: Optional[bytes],
+        headers: Dict[str, str]
+    ) -> HttpResponse:
+        """Send one request over this thread's keep-alive connection to the host.
+
+        Args:
+            target: (scheme, netloc, path) from _pooled_target.
+            method: Uppercase HTTP method.
+            payload: Encoded request body.
+            headers: Request headers.
+        """
+
+        scheme, netloc, path = target
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = {}
+            self._local.connections = connections
+
+        key = (scheme, netloc)
+        connection = connections.get(key)
+        reused = connection is not None and connection.sock is not None
+        if connection is None:
+            connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            connection = connection_class(netloc, timeout = self.timeout)
+            connections[key] = connection
+        if connection.sock is None:
+            with self._connections_lock:
+                self._open_connections.add(connection)
+
+        try:
+            connection.request(
+                method,
+                path,
+                body = payload,
+                headers = {**headers, "Connection": "keep-alive"}
+            )
+            resp = connection.getresponse()
+            body = resp.read()
+        except _STALE_CONNECTION_ERRORS:
+            connection.close()
+            if not reused:
+                raise
+            return self._send_pooled(
+                target = target,
+                method = method,
+                payload = payload,
+                headers = headers
+            )
+        except Exception:
+            connection.close()
+            raise
+
+        if resp.will_close:
+            connection.close()
+        return HttpResponse(
+            status_code = resp.status,
+            headers = dict(resp.getheaders()),
+            body = body
+        )
+
     def _build_url(self, url: str, params: Optional[Dict[str, str]]) -> str:
         """Build URL with query parameters.
 
@@ -198,6 +367,16 @@ class HttpClient:
             return False
         return status_code >= 500 or status_code in {408, 429}
 
+    def _on_throttled(self) -> None:
+        """Tell the rate limiter the server asked us to slow down.
+
+        Args:
+            None
+        """
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_throttled()
+
     def _sleep(self, attempts: int) -> None:
         """Apply retry backoff sleep.
 
@@ -3,6 +3,7 @@ import re
 import urllib.parse
 
 from pathlib import Path
+from typing import Callable
 from typing import Dict
 from typing import List
 
@@ -80,13 +81,17 @@ class MarkdownProcessor:
             image_url_template: URL template with {token} placeholder.
         """
 
+        build_image_url = self._compile_image_url_template(
+            image_url_template = image_url_template
+        )
+
         def _replace_md(match: re.Match) -> str:
             alt = match.group("alt")
             source_url = match.group("url").strip()
             token = token_map.get(source_url)
             if not token:
                 return match.group(0)
-            converted_url = image_url_template.format(token = token)
+            converted_url = build_image_url(token)
             return f"![{alt}]({converted_url})"
 
         def _replace_html(match: re.Match) -> str:
@@ -94,13 +99,26 @@ class MarkdownProcessor:
             token = token_map.get(source_url)
             if not token:
                 return match.group(0)
-            converted_url = image_url_template.format(token = token)
+            converted_url = build_image_url(token)
             return match.group(0).replace(source_url, converted_url)
 
         replaced = self.MD_IMAGE_PATTERN.sub(_replace_md, md_text)
         replaced = self.HTML_IMAGE_PATTERN.sub(_replace_html, replaced)
         return replaced
 
+    def _compile_image_url_template(self, image_url_template: str) -> Callable[[str], str]:
+        """Compile image URL template into a token-to-URL builder.
+
+        Args:
+            image_url_template: URL template with {token} placeholder.
+        """
+
+        prefix, marker, suffix = image_url_template.partition("{token}")
+        static_parts = prefix + suffix
+        if marker and "{" not in static_parts and "}" not in static_parts:
+            return lambda token: prefix + token + suffix
+        return lambda token: image_url_template.format(token = token)
+
     def _resolve_url(self, source_url: str, base_path_or_url: str) -> str:
         """Resolve relative image path to an absolute path/url.
 
@@ -0,0 +1,66 @@
+import time
+import threading
+
+from typing import Optional
+
+
+class RateLimiter:
+    """Thread-safe token bucket that backs off when the API throttles.
+
+    The rate halves on every throttled response and climbs back toward the
+    configured rate by a small step per granted request (AIMD).
+
+    Args:
+        rate_per_sec: Steady request rate when the API is not throttling.
+        burst: Bucket capacity; defaults to one second of requests.
+        min_rate: Floor the rate never drops below after throttling.
+    """
+
+    RAMP_STEP = 0.02
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        burst: Optional[float] = None,
+        min_rate: Optional[float] = None
+    ) -> None:
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        self.max_rate = float(rate_per_sec)
+        self.rate = self.max_rate
+        self.burst = float(burst) if burst else max(1.0, self.max_rate)
+        self.min_rate = float(min_rate) if min_rate else self.max_rate / 16
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one request may be sent.
+
+        Args:
+            None
+        """
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    if self.rate < self.max_rate:
+                        self.rate = min(self.max_rate, self.rate + self.max_rate * self.RAMP_STEP)
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_throttled(self) -> None:
+        """Halve the rate and drop queued burst after a 429 response.
+
+        Args:
+            None
+        """
+
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
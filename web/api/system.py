@@ -14,6 +14,7 @@ from fastapi import APIRouter, HTTPException
 sys.path.append(os.getcwd())
 
 from web.config import settings
+from config.config import AppConfig
 from config.config import get_project_root
 
 router = APIRouter()
@@ -121,6 +122,7 @@ async def update_system_config(config: Config):
             os.environ["LLM_MODEL"] = config.llm_model
             settings.LLM_MODEL = config.llm_model
 
+        AppConfig.clear_cache()
         logger.info("系统配置已更新")
         return {"message": "配置已更新"}
 
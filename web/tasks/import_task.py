@@ -17,7 +17,6 @@ from core.bootstrap import build_http_client
 from core.bootstrap import build_orchestrator
 from core.bootstrap import build_source_adapter_from_request
 from core.bootstrap import build_user_token_manager
-from core.bootstrap import is_placeholder_folder_token
 from web.models.task import Task, TaskStatus
 
 
@@ -52,9 +51,7 @@ def start_import_task(self, task_id: str, request: dict):
         if (
             not is_dry_run
             and request["write_mode"] in {"folder", "both"}
-            and is_placeholder_folder_token(
-                token = config.feishu_folder_token
-            )
+            and config.folder_token_is_placeholder
         ):
             logger.warning(
                 "FEISHU_FOLDER_TOKEN looks like placeholder value: %s. "